@@ -1,16 +1,26 @@
 """OAuth2 authentication handling for Google APIs with multi-account support."""
 
-import json
 import os
+import shutil
+import time
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
+from urllib.parse import parse_qs, urlparse
 
-from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
+
+from .utils.api import json_dumps, json_loads
+from .utils.display import display_error
+
+# The requests transport, OAuth flow and API discovery are imported where
+# they are used: most commands never refresh a token, log in, or look up a
+# profile, and these imports dominate CLI startup time
+if TYPE_CHECKING:
+    from google.auth.transport.requests import Request
 
 # Scopes for Gmail, Calendar, and Sheets access
-SCOPES = [
+SCOPES = (
     "https://www.googleapis.com/auth/gmail.modify",
     "https://www.googleapis.com/auth/gmail.compose",
     "https://www.googleapis.com/auth/gmail.send",
@@ -18,12 +28,20 @@ SCOPES = [
     "https://www.googleapis.com/auth/calendar",
     "https://www.googleapis.com/auth/spreadsheets",
     "https://www.googleapis.com/auth/drive.readonly",
-]
+)
 
 # Config directory (can be overridden with ASSISTANT_CONFIG_DIR env var)
 DEFAULT_CONFIG_DIR = Path.home() / ".config" / "assistant"
 
+# Maps email characters to their token-filename encoding
+_EMAIL_FILENAME_TRANS = str.maketrans({"@": "_at_", ".": "_"})
+
+# Parsed config.json, reused until the file's mtime changes
+_CONFIG_CACHE: Optional[dict] = None
+_CONFIG_MTIME: Optional[float] = None
 
+
+@lru_cache(maxsize=1)
 def get_config_dir() -> Path:
     """Get the configuration directory, creating it if needed."""
     config_dir = Path(os.environ.get("ASSISTANT_CONFIG_DIR", DEFAULT_CONFIG_DIR))
@@ -31,11 +49,13 @@ def get_config_dir() -> Path:
     return config_dir
 
 
+@lru_cache(maxsize=1)
 def get_credentials_path() -> Path:
     """Get the path to the credentials.json file."""
     return get_config_dir() / "credentials.json"
 
 
+@lru_cache(maxsize=1)
 def get_tokens_dir() -> Path:
     """Get the path to the tokens directory."""
     tokens_dir = get_config_dir() / "tokens"
@@ -43,46 +63,207 @@ def get_tokens_dir() -> Path:
     return tokens_dir
 
 
+@lru_cache(maxsize=1)
+def get_cache_dir() -> Path:
+    """Get the path to the directory of cached API data."""
+    cache_dir = get_config_dir() / "cache"
+    cache_dir.mkdir(exist_ok=True)
+    return cache_dir
+
+
+@lru_cache(maxsize=1)
 def get_config_path() -> Path:
     """Get the path to the config.json file."""
     return get_config_dir() / "config.json"
 
 
+@lru_cache(maxsize=1)
+def get_accounts_index_path() -> Path:
+    """Get the path to the accounts.json index of logged-in accounts."""
+    return get_config_dir() / "accounts.json"
+
+
+@lru_cache(maxsize=16)
 def get_token_path_for_account(email: str) -> Path:
     """Get the token file path for a specific account."""
     # Sanitize email for filename
-    safe_email = email.replace("@", "_at_").replace(".", "_")
+    safe_email = email.translate(_EMAIL_FILENAME_TRANS)
     return get_tokens_dir() / f"token_{safe_email}.json"
 
 
-def _get_email_from_token(token_path: Path) -> Optional[str]:
-    """Extract email from token by querying Gmail API."""
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write data to path atomically via a temp file and rename."""
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def get_account_cache_dir(account: str) -> Path:
+    """Get the cache directory for an account (not created)."""
+    return get_cache_dir() / account.translate(_EMAIL_FILENAME_TRANS)
+
+
+def _cache_path(name: str, account: str) -> Path:
+    """Get the path of a named cache file for an account."""
+    return get_account_cache_dir(account) / f"{name}.json"
+
+
+def read_cache(name: str, account: str, max_age: float) -> Optional[Any]:
+    """
+    Load cached data for an account.
+
+    Args:
+        name: Cache name (e.g. "labels")
+        account: Account email the data belongs to
+        max_age: Seconds after which the cache is considered stale
+
+    Returns:
+        The cached data, or None if missing, stale, or unreadable
+    """
+    path = _cache_path(name, account)
+    try:
+        if time.time() - path.stat().st_mtime > max_age:
+            return None
+        return json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def write_cache(name: str, account: str, data: Any) -> None:
+    """Store data in an account's named cache; failures are ignored."""
+    path = _cache_path(name, account)
     try:
-        creds = Credentials.from_authorized_user_file(str(token_path), SCOPES)
-        if creds.expired and creds.refresh_token:
-            creds.refresh(Request())
+        path.parent.mkdir(exist_ok=True)
+        _atomic_write(path, json_dumps(data))
+    except OSError:
+        pass
+
+
+def clear_cache(name: str, account: str) -> None:
+    """Remove an account's named cache."""
+    _cache_path(name, account).unlink(missing_ok=True)
+
+
+def _clear_account_caches(account: str) -> None:
+    """Remove every cache file belonging to an account."""
+    shutil.rmtree(get_account_cache_dir(account), ignore_errors=True)
+
+
+@lru_cache(maxsize=1)
+def _auth_request() -> "Request":
+    """Shared transport for token refreshes, so they reuse one HTTP session."""
+    from google.auth.transport.requests import Request
+
+    return Request()
+
+
+@lru_cache(maxsize=8)
+def _load_creds_cached(token_path: str, mtime_ns: int) -> Credentials:
+    """Parse a token file; keyed on mtime so a rewritten token is reloaded."""
+    return Credentials.from_authorized_user_info(
+        json_loads(Path(token_path).read_bytes()), SCOPES
+    )
+
+
+def _load_creds(token_path: Path) -> Credentials:
+    """Load credentials from a token file, reusing an already-parsed copy."""
+    return _load_creds_cached(str(token_path), token_path.stat().st_mtime_ns)
+
+
+def _token_json(creds: Credentials, email: str) -> bytes:
+    """Serialize credentials with the account email stored alongside them."""
+    data = json_loads(creds.to_json())
+    data["email"] = email
+    return json_dumps(data)
+
+
+def _get_email_from_token(token_path: Path, allow_network: bool = True) -> Optional[str]:
+    """
+    Extract email from a token file.
+
+    The email is stored in the token at login time. Tokens written by older
+    versions don't have it, so fall back to querying the Gmail API once and
+    record the result in the token for next time. With allow_network=False
+    such tokens are skipped instead.
+    """
+    try:
+        data = json_loads(token_path.read_bytes())
+        if data.get("email"):
+            return data["email"]
+        if not allow_network:
+            return None
+
         from googleapiclient.discovery import build
-        service = build("gmail", "v1", credentials=creds)
+
+        creds = Credentials.from_authorized_user_info(data, SCOPES)
+        if creds.expired and creds.refresh_token:
+            creds.refresh(_auth_request())
+        service = build(
+            "gmail", "v1", credentials=creds, cache_discovery=False, static_discovery=True
+        )
         profile = service.users().getProfile(userId="me").execute()
-        return profile.get("emailAddress")
+        email = profile.get("emailAddress")
+        if email:
+            _atomic_write(token_path, _token_json(creds, email))
+        return email
     except Exception:
         return None
 
 
 def load_config() -> dict:
-    """Load the config file."""
+    """Load the config file, reusing the cached copy if it hasn't changed."""
+    global _CONFIG_CACHE, _CONFIG_MTIME
+
     config_path = get_config_path()
-    if config_path.exists():
-        with open(config_path) as f:
-            return json.load(f)
-    return {}
+    try:
+        mtime = config_path.stat().st_mtime
+    except FileNotFoundError:
+        return {}
+
+    if _CONFIG_CACHE is None or _CONFIG_MTIME != mtime:
+        _CONFIG_CACHE = json_loads(config_path.read_bytes())
+        _CONFIG_MTIME = mtime
+
+    # Callers mutate the result before saving, so hand out a copy
+    return dict(_CONFIG_CACHE)
 
 
 def save_config(config: dict) -> None:
     """Save the config file."""
+    global _CONFIG_CACHE, _CONFIG_MTIME
+
     config_path = get_config_path()
-    with open(config_path, "w") as f:
-        json.dump(config, f, indent=2)
+    # Keep config.json indented since users edit it by hand (account aliases)
+    _atomic_write(config_path, json_dumps(config, indent=True))
+
+    _CONFIG_CACHE = dict(config)
+    _CONFIG_MTIME = config_path.stat().st_mtime
+
+
+def _load_accounts_index() -> Optional[list[str]]:
+    """
+    Load the accounts index, or None if it doesn't exist yet or is unreadable.
+
+    The index is derived from the token files, so a corrupt one is rebuilt
+    by the caller's scan. Entries whose token file has been deleted outside
+    logout are dropped, and the index is rewritten without them.
+    """
+    try:
+        indexed = json_loads(get_accounts_index_path().read_bytes())
+    except (FileNotFoundError, ValueError):
+        # json and orjson decode errors are both ValueErrors
+        return None
+    if not isinstance(indexed, list) or not all(isinstance(a, str) for a in indexed):
+        return None
+    accounts = [a for a in indexed if get_token_path_for_account(a).exists()]
+    if len(accounts) != len(indexed):
+        _save_accounts_index(accounts)
+    return accounts
+
+
+def _save_accounts_index(accounts: list[str]) -> None:
+    """Save the accounts index."""
+    _atomic_write(get_accounts_index_path(), json_dumps(sorted(set(accounts))))
 
 
 def get_active_account() -> Optional[str]:
@@ -96,8 +277,13 @@ def get_active_account() -> Optional[str]:
         if token_path.exists():
             return active
 
-    # If no active account or token missing, try to find one
-    accounts = list_accounts()
+    # If no active account or token missing, try to find one. Only local
+    # state is consulted here; legacy tokens without a stored email are
+    # resolved by list_accounts() when the user runs an auth command.
+    accounts = _load_accounts_index()
+    if accounts is None:
+        accounts = _scan_token_files(allow_network=False)
+    accounts = sorted(accounts)
     if accounts:
         # Set the first available account as active
         set_active_account(accounts[0])
@@ -120,17 +306,30 @@ def set_active_account(email: str) -> bool:
 
 def list_accounts() -> list[str]:
     """List all authenticated accounts."""
-    tokens_dir = get_tokens_dir()
-    accounts = []
-
-    for token_file in tokens_dir.glob("token_*.json"):
-        email = _get_email_from_token(token_file)
-        if email:
-            accounts.append(email)
+    accounts = _load_accounts_index()
+    if accounts is not None:
+        return sorted(accounts)
 
+    # No index yet (first run after upgrading): rebuild it from the token files
+    accounts = _scan_token_files()
+    _save_accounts_index(accounts)
     return sorted(accounts)
 
 
+def _scan_token_files(allow_network: bool = True) -> list[str]:
+    """Collect account emails from the token files on disk."""
+    accounts = []
+    with os.scandir(get_tokens_dir()) as entries:
+        for entry in entries:
+            name = entry.name
+            if not (name.startswith("token_") and name.endswith(".json")) or not entry.is_file():
+                continue
+            email = _get_email_from_token(Path(entry.path), allow_network=allow_network)
+            if email:
+                accounts.append(email)
+    return accounts
+
+
 def get_credentials(account: Optional[str] = None) -> Optional[Credentials]:
     """
     Get valid user credentials for the specified or active account.
@@ -155,15 +354,14 @@ def get_credentials(account: Optional[str] = None) -> Optional[Credentials]:
 
     # Load existing token if available
     if token_path.exists():
-        creds = Credentials.from_authorized_user_file(str(token_path), SCOPES)
+        creds = _load_creds(token_path)
 
     # If there are no (valid) credentials available, let the user log in.
     if not creds or not creds.valid:
         if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
+            creds.refresh(_auth_request())
             # Save refreshed token
-            with open(token_path, "w") as token:
-                token.write(creds.to_json())
+            _atomic_write(token_path, _token_json(creds, account))
         else:
             return None
 
@@ -186,6 +384,9 @@ def login(set_as_active: bool = True, headless: bool = False) -> Optional[str]:
     if not credentials_path.exists():
         return None
 
+    from google_auth_oauthlib.flow import InstalledAppFlow
+    from googleapiclient.discovery import build
+
     # Run OAuth flow
     flow = InstalledAppFlow.from_client_secrets_file(
         str(credentials_path), SCOPES
@@ -203,8 +404,6 @@ def login(set_as_active: bool = True, headless: bool = False) -> Optional[str]:
         redirect_response = input("Paste the redirect URL: ").strip()
 
         # Extract the authorization code from the redirect URL
-        from urllib.parse import urlparse, parse_qs
-
         parsed = urlparse(redirect_response)
         query_params = parse_qs(parsed.query)
 
@@ -219,8 +418,9 @@ def login(set_as_active: bool = True, headless: bool = False) -> Optional[str]:
         creds = flow.run_local_server(port=0)
 
     # Get the email for this account
-    from googleapiclient.discovery import build
-    service = build("gmail", "v1", credentials=creds)
+    service = build(
+        "gmail", "v1", credentials=creds, cache_discovery=False, static_discovery=True
+    )
     profile = service.users().getProfile(userId="me").execute()
     email = profile.get("emailAddress")
 
@@ -229,8 +429,8 @@ def login(set_as_active: bool = True, headless: bool = False) -> Optional[str]:
 
     # Save the credentials
     token_path = get_token_path_for_account(email)
-    with open(token_path, "w") as token:
-        token.write(creds.to_json())
+    _atomic_write(token_path, _token_json(creds, email))
+    _save_accounts_index(list_accounts() + [email])
 
     # Set as active account if requested
     if set_as_active:
@@ -259,6 +459,8 @@ def logout(account: Optional[str] = None) -> bool:
 
     if token_path.exists():
         os.remove(token_path)
+        _clear_account_caches(account)
+        _save_accounts_index([a for a in list_accounts() if a != account])
 
         # If this was the active account, switch to another
         config = load_config()
@@ -317,14 +519,13 @@ def is_authenticated(account: Optional[str] = None) -> bool:
         return False
 
     try:
-        creds = Credentials.from_authorized_user_file(str(token_path), SCOPES)
+        creds = _load_creds(token_path)
         if creds.valid:
             return True
         if creds.expired and creds.refresh_token:
-            creds.refresh(Request())
+            creds.refresh(_auth_request())
             # Save refreshed token
-            with open(token_path, "w") as token:
-                token.write(creds.to_json())
+            _atomic_write(token_path, _token_json(creds, account))
             return True
     except Exception:
         return False
@@ -358,12 +559,10 @@ def get_user_email(account: Optional[str] = None) -> Optional[str]:
 
 def require_auth(func):
     """Decorator to require authentication before running a function."""
-    from functools import wraps
 
     @wraps(func)
     def wrapper(*args, **kwargs):
         if not is_authenticated():
-            from .utils import display_error
             display_error(
                 "Not authenticated. Run 'assistant auth login' first."
             )
@@ -1,13 +1,27 @@
 """Google Calendar API client wrapper."""
 
-from datetime import datetime, timedelta
-from typing import Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Optional
 
+import httplib2
 from dateutil import parser as dateparser
-from googleapiclient.discovery import build
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.errors import HttpError
 
-from ..auth import get_credentials
+from ..auth import get_active_account, get_credentials
+from ..utils.api import build_service
+
+# Maximum number of sub-requests the Calendar API accepts in one batch
+BATCH_SIZE = 50
+
+# Upper bound on batches sent concurrently by find_event_by_id
+MAX_CONCURRENT_BATCHES = 4
+
+
+def _iso_rfc3339(dt: datetime) -> str:
+    """Format a datetime as a UTC RFC 3339 timestamp; naive values are taken as local time."""
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 class CalendarClient:
@@ -16,30 +30,38 @@ class CalendarClient:
     def __init__(self):
         """Initialize the Calendar client."""
         self._service = None
+        self._calendar_name_cache: dict[str, str] = {}
+        self._tz_cache: dict[str, Optional[str]] = {}
+        self._calendars: Optional[list[dict]] = None
 
     @property
     def service(self):
         """Get or create the Calendar API service."""
         if self._service is None:
-            creds = get_credentials()
-            if creds is None:
-                raise RuntimeError("Not authenticated. Run 'assistant auth login' first.")
-            self._service = build("calendar", "v3", credentials=creds)
+            self._service = build_service("calendar", "v3", get_active_account())
         return self._service
 
     def list_calendars(self) -> list[dict]:
         """
         List all calendars the user has access to.
 
+        The list is fetched once per client and reused by later calls.
+
         Returns:
             List of calendar dictionaries
         """
+        if self._calendars is not None:
+            return self._calendars
+
         try:
             calendar_list = self.service.calendarList().list().execute()
             calendars = calendar_list.get("items", [])
 
             result = []
             for cal in calendars:
+                self._remember_calendar(cal["id"], cal)
+                if cal.get("primary"):
+                    self._remember_calendar("primary", cal)
                 result.append({
                     "id": cal["id"],
                     "summary": cal.get("summary", ""),
@@ -51,6 +73,7 @@ class CalendarClient:
                     "timeZone": cal.get("timeZone", ""),
                 })
 
+            self._calendars = result
             return result
         except HttpError as e:
             raise RuntimeError(f"Calendar API error: {e}")
@@ -63,6 +86,27 @@ class CalendarClient:
                 return cal["id"]
         return "primary"
 
+    def _remember_calendar(self, calendar_id: str, cal: dict) -> None:
+        """Record name and timezone from a calendarList or calendars resource."""
+        self._calendar_name_cache[calendar_id] = cal.get("summary", calendar_id)
+        self._tz_cache[calendar_id] = cal.get("timeZone")
+
+    def _fetch_calendar(self, calendar_id: str) -> bool:
+        """Fetch calendar metadata into the caches. Returns False on API error."""
+        try:
+            cal = self.service.calendars().get(calendarId=calendar_id).execute()
+        except HttpError:
+            return False
+        self._remember_calendar(calendar_id, cal)
+        return True
+
+    def _get_calendar_name(self, calendar_id: str) -> str:
+        """Get a calendar's display name, fetching it only if not already known."""
+        if calendar_id not in self._calendar_name_cache:
+            if not self._fetch_calendar(calendar_id):
+                return calendar_id
+        return self._calendar_name_cache[calendar_id]
+
     def get_calendar_timezone(self, calendar_id: str = "primary") -> Optional[str]:
         """
         Get the timezone for a specific calendar.
@@ -73,11 +117,10 @@ class CalendarClient:
         Returns:
             Timezone string (e.g., 'America/Denver') or None
         """
-        try:
-            cal = self.service.calendars().get(calendarId=calendar_id).execute()
-            return cal.get("timeZone")
-        except HttpError:
-            return None
+        if calendar_id not in self._tz_cache:
+            if not self._fetch_calendar(calendar_id):
+                return None
+        return self._tz_cache[calendar_id]
 
     def list_events(
         self,
@@ -109,48 +152,20 @@ class CalendarClient:
             }
 
             if time_min:
-                # Use isoformat with timezone info, or assume local time
-                if time_min.tzinfo is None:
-                    params["timeMin"] = time_min.astimezone().isoformat()
-                else:
-                    params["timeMin"] = time_min.isoformat()
+                params["timeMin"] = _iso_rfc3339(time_min)
             if time_max:
-                if time_max.tzinfo is None:
-                    params["timeMax"] = time_max.astimezone().isoformat()
-                else:
-                    params["timeMax"] = time_max.isoformat()
+                params["timeMax"] = _iso_rfc3339(time_max)
 
             events_result = self.service.events().list(**params).execute()
             events = events_result.get("items", [])
 
             # Get calendar name for display
-            try:
-                cal = self.service.calendars().get(calendarId=calendar_id).execute()
-                calendar_name = cal.get("summary", calendar_id)
-            except HttpError:
-                calendar_name = calendar_id
+            calendar_name = self._get_calendar_name(calendar_id)
 
-            result = []
-            for event in events:
-                result.append({
-                    "id": event["id"],
-                    "summary": event.get("summary", "(No Title)"),
-                    "description": event.get("description", ""),
-                    "location": event.get("location", ""),
-                    "start": event.get("start", {}),
-                    "end": event.get("end", {}),
-                    "status": event.get("status", ""),
-                    "htmlLink": event.get("htmlLink", ""),
-                    "attendees": event.get("attendees", []),
-                    "organizer": event.get("organizer", {}),
-                    "creator": event.get("creator", {}),
-                    "calendar_id": calendar_id,
-                    "calendar_name": calendar_name,
-                    "recurrence": event.get("recurrence", []),
-                    "recurringEventId": event.get("recurringEventId"),
-                })
-
-            return result
+            return [
+                self._format_event(event, calendar_id, calendar_name)
+                for event in events
+            ]
         except HttpError as e:
             raise RuntimeError(f"Calendar API error: {e}")
 
@@ -172,26 +187,38 @@ class CalendarClient:
                 .execute()
             )
 
-            return {
-                "id": event["id"],
-                "summary": event.get("summary", "(No Title)"),
-                "description": event.get("description", ""),
-                "location": event.get("location", ""),
-                "start": event.get("start", {}),
-                "end": event.get("end", {}),
-                "status": event.get("status", ""),
-                "htmlLink": event.get("htmlLink", ""),
-                "attendees": event.get("attendees", []),
-                "organizer": event.get("organizer", {}),
-                "creator": event.get("creator", {}),
-                "calendar_id": calendar_id,
-                "recurrence": event.get("recurrence", []),
-            }
+            return self._format_event(event, calendar_id)
         except HttpError as e:
             if e.resp.status == 404:
                 return None
             raise RuntimeError(f"Calendar API error: {e}")
 
+    @staticmethod
+    def _format_event(
+        event: dict, calendar_id: str, calendar_name: Optional[str] = None
+    ) -> dict:
+        """Convert an API event resource into the dictionary used by list/get."""
+        get = event.get
+        result = {
+            "id": event["id"],
+            "summary": get("summary", "(No Title)"),
+            "description": get("description", ""),
+            "location": get("location", ""),
+            "start": get("start", {}),
+            "end": get("end", {}),
+            "status": get("status", ""),
+            "htmlLink": get("htmlLink", ""),
+            "attendees": get("attendees", []),
+            "organizer": get("organizer", {}),
+            "creator": get("creator", {}),
+            "calendar_id": calendar_id,
+            "recurrence": get("recurrence", []),
+            "recurringEventId": get("recurringEventId"),
+        }
+        if calendar_name is not None:
+            result["calendar_name"] = calendar_name
+        return result
+
     def create_event(
         self,
         summary: str,
@@ -454,9 +481,8 @@ class CalendarClient:
             )
 
             # Get user's email to find them in attendees
-            calendar_list = self.service.calendarList().list().execute()
             user_email = None
-            for cal in calendar_list.get("items", []):
+            for cal in self.list_calendars():
                 if cal.get("primary"):
                     user_email = cal["id"]
                     break
@@ -522,15 +548,60 @@ class CalendarClient:
         """
         Find an event by ID, searching across all calendars.
 
+        The lookups are sent as batch requests of BATCH_SIZE calendars each.
+        When more than one batch is needed they are sent concurrently.
+
         Args:
             event_id: The event ID to find
 
         Returns:
             Event dictionary or None
         """
-        calendars = self.list_calendars()
-        for cal in calendars:
-            event = self.get_event(event_id, calendar_id=cal["id"])
-            if event:
-                return event
+        calendar_ids = [cal["id"] for cal in self.list_calendars()]
+        found: dict[str, dict] = {}
+        errors: list[HttpError] = []
+
+        def collect(request_id, response, exception):
+            if exception is None:
+                found[request_id] = response
+            elif not (isinstance(exception, HttpError) and exception.resp.status == 404):
+                errors.append(exception)
+
+        batches = []
+        for offset in range(0, len(calendar_ids), BATCH_SIZE):
+            batch = self.service.new_batch_http_request(callback=collect)
+            for calendar_id in calendar_ids[offset:offset + BATCH_SIZE]:
+                batch.add(
+                    self.service.events().get(calendarId=calendar_id, eventId=event_id),
+                    request_id=calendar_id,
+                )
+            batches.append(batch)
+
+        try:
+            if len(batches) == 1:
+                batches[0].execute()
+            elif batches:
+                # httplib2 connections aren't thread-safe, so give each batch its own
+                creds = get_credentials(get_active_account())
+                with ThreadPoolExecutor(
+                    max_workers=min(len(batches), MAX_CONCURRENT_BATCHES)
+                ) as executor:
+                    futures = [
+                        executor.submit(
+                            batch.execute, http=AuthorizedHttp(creds, http=httplib2.Http())
+                        )
+                        for batch in batches
+                    ]
+                    for future in futures:
+                        future.result()
+        except HttpError as e:
+            raise RuntimeError(f"Calendar API error: {e}")
+
+        # Prefer the first calendar in list order, matching a sequential scan
+        for calendar_id in calendar_ids:
+            if calendar_id in found:
+                return self._format_event(found[calendar_id], calendar_id)
+
+        if errors:
+            raise RuntimeError(f"Calendar API error: {errors[0]}")
         return None
@@ -1,6 +1,7 @@
 """Calendar CLI commands."""
 
 from datetime import datetime, timedelta
+from functools import cache
 from typing import Optional
 
 import typer
@@ -11,6 +12,7 @@ from ..utils.display import (
     console,
     display_error,
     display_success,
+    display_table,
     format_calendar_events,
     format_calendars,
     format_event_detail,
@@ -18,12 +20,18 @@ from ..utils.display import (
 )
 from .client import CalendarClient
 
-app = typer.Typer(help="Google Calendar commands")
+app = typer.Typer(help="Google Calendar commands", rich_markup_mode=None)
+
+
+@cache
+def _auth_ok() -> bool:
+    """Check authentication once per process."""
+    return is_authenticated()
 
 
 def require_auth():
     """Check authentication and exit if not authenticated."""
-    if not is_authenticated():
+    if not _auth_ok():
         display_error("Not authenticated. Run 'assistant auth login' first.")
         raise typer.Exit(1)
 
@@ -78,8 +86,7 @@ def list_events(
                 return
 
             table = format_calendar_events(events)
-            console.print(table)
-            console.print(f"\n[dim]{len(events)} events found[/dim]")
+            display_table(table, f"{len(events)} events found")
         else:
             # Default: upcoming events
             events = client.get_upcoming_events(days=days, max_results=limit, calendar_id=calendar_id)
@@ -89,8 +96,7 @@ def list_events(
                 return
 
             table = format_calendar_events(events)
-            console.print(table)
-            console.print(f"\n[dim]{len(events)} events in the next {days} days[/dim]")
+            display_table(table, f"{len(events)} events in the next {days} days")
     except RuntimeError as e:
         display_error(str(e))
         raise typer.Exit(1)
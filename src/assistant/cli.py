@@ -1,8 +1,10 @@
 """Main CLI entry point for Assistant."""
 
+import importlib
 from typing import Optional
 
 import typer
+from typer.core import TyperGroup
 
 from . import __version__
 from .auth import (
@@ -17,26 +19,69 @@ from .auth import (
     logout_all,
     set_active_account,
 )
-from .gmail.commands import app as gmail_app
-from .calendar.commands import app as calendar_app
-from .sheets.commands import app as sheets_app
-from .drive.commands import app as drive_app
-from .utils.display import console, display_error, display_success, display_warning
+from .utils.display import console, display_error, display_success, display_table, display_warning
+
+# Service subcommands, imported only when they are invoked: name -> (module, help)
+LAZY_SUBCOMMANDS = {
+    "gmail": (".gmail.commands", "Gmail commands"),
+    "calendar": (".calendar.commands", "Google Calendar commands"),
+    "sheets": (".sheets.commands", "Google Sheets commands"),
+    "drive": (".drive.commands", "Google Drive commands"),
+}
+
+
+class LazyGroup(TyperGroup):
+    """Top-level command group that loads service subcommands on demand."""
+
+    def list_commands(self, ctx):
+        commands = super().list_commands(ctx)
+        return [name for name in LAZY_SUBCOMMANDS if name not in commands] + commands
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in LAZY_SUBCOMMANDS and cmd_name not in self.commands:
+            module = importlib.import_module(LAZY_SUBCOMMANDS[cmd_name][0], __package__)
+            command = typer.main.get_group(module.app)
+            command.name = cmd_name
+            self.add_command(command)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx, formatter):
+        """List commands using the static help of unloaded subcommands.
+
+        Top-level --help (and the no-args help) then never imports the
+        service modules and their API client dependencies.
+        """
+        rows = []
+        for name in self.list_commands(ctx):
+            if name in LAZY_SUBCOMMANDS and name not in self.commands:
+                rows.append((name, LAZY_SUBCOMMANDS[name][1]))
+                continue
+            command = self.commands[name]
+            if not command.hidden:
+                rows.append((name, command))
+        if not rows:
+            return
+
+        limit = formatter.width - 6 - max(len(name) for name, _ in rows)
+        rows = [
+            (name, help if isinstance(help, str) else help.get_short_help_str(limit))
+            for name, help in rows
+        ]
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
+
 
 app = typer.Typer(
     name="assistant",
     help="CLI tool for Gmail, Google Calendar, Google Sheets, and Google Drive",
     no_args_is_help=True,
+    rich_markup_mode=None,
+    add_completion=False,
+    cls=LazyGroup,
 )
 
-# Add subcommands
-app.add_typer(gmail_app, name="gmail")
-app.add_typer(calendar_app, name="calendar")
-app.add_typer(sheets_app, name="sheets")
-app.add_typer(drive_app, name="drive")
-
 # Auth subcommand group
-auth_app = typer.Typer(help="Authentication commands")
+auth_app = typer.Typer(help="Authentication commands", rich_markup_mode=None)
 app.add_typer(auth_app, name="auth")
 
 
@@ -171,8 +216,7 @@ def auth_list():
         else:
             table.add_row("○", acc, "")
 
-    console.print(table)
-    console.print(f"\n[dim]{len(accounts)} account(s)[/dim]")
+    display_table(table, f"{len(accounts)} account(s)")
 
 
 @auth_app.command("switch")
@@ -186,24 +230,31 @@ def auth_switch(
         display_error("No authenticated accounts. Run 'assistant auth login' first.")
         raise typer.Exit(1)
 
-    # Allow partial match
-    matches = [a for a in accounts if account.lower() in a.lower()]
+    # Allow partial match; stop scanning as soon as the match is ambiguous
+    query = account.lower()
+    target = None
+    ambiguous = False
+    for acc in accounts:
+        if query in acc.lower():
+            if target is not None:
+                ambiguous = True
+                break
+            target = acc
 
-    if len(matches) == 0:
+    if target is None:
         display_error(f"Account '{account}' not found.")
         console.print("\nAvailable accounts:")
         for acc in accounts:
             console.print(f"  - {acc}")
         raise typer.Exit(1)
-    elif len(matches) > 1:
+    elif ambiguous:
         display_error(f"'{account}' matches multiple accounts:")
-        for acc in matches:
-            console.print(f"  - {acc}")
+        for acc in accounts:
+            if query in acc.lower():
+                console.print(f"  - {acc}")
         console.print("\nPlease be more specific.")
         raise typer.Exit(1)
 
-    target = matches[0]
-
     if set_active_account(target):
         display_success(f"Switched to {target}")
     else:
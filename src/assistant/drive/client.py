@@ -1,16 +1,67 @@
 """Google Drive API client wrapper."""
 
-import io
+import os
 import re
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterator, Optional, Union
+from urllib.parse import quote
 
-from googleapiclient.discovery import build
+import requests
+from google.auth.transport.requests import AuthorizedSession
 from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaIoBaseDownload
 
-from ..auth import get_credentials
-
+from ..auth import get_active_account, get_credentials
+from ..utils.api import build_service
+
+# Maximum number of sub-requests the Drive API accepts in one batch
+BATCH_SIZE = 100
+
+# Fields requested for file metadata
+METADATA_FIELDS = "id, name, mimeType, size, createdTime, modifiedTime, owners, webViewLink, parents, driveId"
+
+# Query used by list_files when no filters are given
+_DEFAULT_QUERY = "trashed = false"
+
+# Largest pageSize files().list accepts
+MAX_PAGE_SIZE = 1000
+
+# Chunk size for media downloads; larger chunks mean fewer HTTP round-trips
+DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Direct content endpoint for binary files, and the copy buffer used to stream it
+MEDIA_URL = "https://www.googleapis.com/drive/v3/files/{file_id}"
+_MEDIA_PARAMS = {"alt": "media", "supportsAllDrives": "true"}
+STREAM_BUFFER_SIZE = 1024 * 1024
+
+# Binary files larger than this are fetched as parallel byte ranges
+PARALLEL_DOWNLOAD_THRESHOLD = 32 * 1024 * 1024
+RANGE_SIZE = 8 * 1024 * 1024
+MAX_DOWNLOAD_WORKERS = 8
+
+# Patterns for extracting a file ID from Drive/Docs URLs
+_RE_DRIVE_PATH_ID = re.compile(r"/d/([a-zA-Z0-9_-]+)")
+_RE_DRIVE_QUERY_ID = re.compile(r"[?&]id=([a-zA-Z0-9_-]+)")
+_FILE_ID_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-")
+
+# Fields read from Drive file resources, with defaults for ones the API omits
+_get_file_fields = itemgetter(
+    "id", "name", "mimeType", "size", "createdTime", "modifiedTime", "owners", "webViewLink"
+)
+_FILE_FIELD_DEFAULTS = {
+    "id": "",
+    "name": "",
+    "mimeType": "",
+    "size": None,
+    "createdTime": "",
+    "modifiedTime": "",
+    "owners": (),
+    "webViewLink": "",
+}
 
 # Google Workspace MIME types and their export formats
 EXPORT_MIME_TYPES = {
@@ -52,6 +103,24 @@ EXPORT_MIME_TYPES = {
     },
 }
 
+# (mime_type, export_format) -> (export mime type, file extension); the
+# (mime_type, None) entry holds the default used for unknown formats
+_EXPORT_LOOKUP: dict[tuple[str, Optional[str]], tuple[str, str]] = {}
+for _mime, _info in EXPORT_MIME_TYPES.items():
+    _EXPORT_LOOKUP[(_mime, None)] = (_info["default"], _info["extension"])
+    for _fmt, _export_mime in _info["formats"].items():
+        _EXPORT_LOOKUP[(_mime, _fmt)] = (_export_mime, f".{_fmt}")
+del _mime, _info, _fmt, _export_mime
+
+
+def _escape_query_value(value: str) -> str:
+    """Escape a value for use inside a quoted Drive query string."""
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
+
+class _RangeNotSatisfied(Exception):
+    """The server did not honour a byte-range request."""
+
 
 class DriveClient:
     """Wrapper class for Google Drive API operations."""
@@ -64,10 +133,7 @@ class DriveClient:
     def service(self):
         """Get or create the Drive API service."""
         if self._service is None:
-            creds = get_credentials()
-            if creds is None:
-                raise RuntimeError("Not authenticated. Run 'assistant auth login' first.")
-            self._service = build("drive", "v3", credentials=creds)
+            self._service = build_service("drive", "v3", get_active_account())
         return self._service
 
     @staticmethod
@@ -92,13 +158,31 @@ class DriveClient:
         if not file_id_or_url.startswith("http"):
             return file_id_or_url
 
+        # Fast path: slice between the literal markers and accept the result
+        # if it is a clean ID; anything unusual falls through to the regexes
+        start = file_id_or_url.find("/d/")
+        if start >= 0:
+            start += 3
+            end = file_id_or_url.find("/", start)
+            candidate = file_id_or_url[start:end] if end > 0 else file_id_or_url[start:]
+            if candidate and _FILE_ID_CHARS.issuperset(candidate):
+                return candidate
+        else:
+            start = file_id_or_url.find("id=")
+            if start > 0 and file_id_or_url[start - 1] in "?&":
+                start += 3
+                end = file_id_or_url.find("&", start)
+                candidate = file_id_or_url[start:end] if end > 0 else file_id_or_url[start:]
+                if candidate and _FILE_ID_CHARS.issuperset(candidate):
+                    return candidate
+
         # Pattern for /d/{id}/ format
-        match = re.search(r"/d/([a-zA-Z0-9_-]+)", file_id_or_url)
+        match = _RE_DRIVE_PATH_ID.search(file_id_or_url)
         if match:
             return match.group(1)
 
         # Pattern for ?id={id} format
-        match = re.search(r"[?&]id=([a-zA-Z0-9_-]+)", file_id_or_url)
+        match = _RE_DRIVE_QUERY_ID.search(file_id_or_url)
         if match:
             return match.group(1)
 
@@ -122,33 +206,81 @@ class DriveClient:
                 self.service.files()
                 .get(
                     fileId=file_id,
-                    fields="id, name, mimeType, size, createdTime, modifiedTime, owners, webViewLink, parents, driveId",
+                    fields=METADATA_FIELDS,
                     supportsAllDrives=True,
                 )
                 .execute()
             )
 
-            owners = file_metadata.get("owners", [])
-            owner_email = owners[0].get("emailAddress", "") if owners else ""
-
-            return {
-                "id": file_metadata.get("id", ""),
-                "name": file_metadata.get("name", ""),
-                "mime_type": file_metadata.get("mimeType", ""),
-                "size": int(file_metadata.get("size", 0)) if file_metadata.get("size") else None,
-                "created_time": file_metadata.get("createdTime", ""),
-                "modified_time": file_metadata.get("modifiedTime", ""),
-                "owner": owner_email,
-                "web_view_link": file_metadata.get("webViewLink", ""),
-                "is_google_workspace": file_metadata.get("mimeType", "").startswith(
-                    "application/vnd.google-apps."
-                ),
-            }
+            return self._format_metadata(file_metadata)
         except HttpError as e:
             if e.resp.status == 404:
                 raise ValueError(f"File not found: {file_id}")
             raise RuntimeError(f"Drive API error: {e}")
 
+    def get_many_metadata(self, file_ids: list[str]) -> list[Optional[dict]]:
+        """
+        Get metadata for several files using batch requests.
+
+        Args:
+            file_ids: File IDs or URLs
+
+        Returns:
+            Metadata dictionaries in the same order as file_ids, with None
+            for files that were not found
+        """
+        ids = [self.extract_file_id(file_id) for file_id in file_ids]
+        responses: dict[str, Any] = {}
+
+        def collect(request_id, response, exception):
+            responses[request_id] = response if exception is None else exception
+
+        try:
+            for offset in range(0, len(ids), BATCH_SIZE):
+                batch = self.service.new_batch_http_request(callback=collect)
+                for index in range(offset, min(offset + BATCH_SIZE, len(ids))):
+                    batch.add(
+                        self.service.files().get(
+                            fileId=ids[index],
+                            fields=METADATA_FIELDS,
+                            supportsAllDrives=True,
+                        ),
+                        request_id=str(index),
+                    )
+                batch.execute()
+        except HttpError as e:
+            raise RuntimeError(f"Drive API error: {e}")
+
+        result = []
+        for index in range(len(ids)):
+            response = responses.get(str(index))
+            if isinstance(response, HttpError):
+                if response.resp.status == 404:
+                    result.append(None)
+                    continue
+                raise RuntimeError(f"Drive API error: {response}")
+            result.append(self._format_metadata(response) if response else None)
+        return result
+
+    @staticmethod
+    def _format_metadata(file_metadata: dict) -> dict:
+        """Convert a Drive file resource into the metadata dictionary."""
+        fid, name, mime_type, size, created, modified, owners, link = _get_file_fields(
+            {**_FILE_FIELD_DEFAULTS, **file_metadata}
+        )
+
+        return {
+            "id": fid,
+            "name": name,
+            "mime_type": mime_type,
+            "size": int(size) if size else None,
+            "created_time": created,
+            "modified_time": modified,
+            "owner": owners[0].get("emailAddress", "") if owners else "",
+            "web_view_link": link,
+            "is_google_workspace": mime_type.startswith("application/vnd.google-apps."),
+        }
+
     def list_files(
         self,
         query: Optional[str] = None,
@@ -166,54 +298,81 @@ class DriveClient:
         Returns:
             List of file dictionaries
         """
-        try:
+        return [
+            f for page in self.iter_files(query, max_results, mime_type) for f in page
+        ]
+
+    def iter_files(
+        self,
+        query: Optional[str] = None,
+        max_results: int = 20,
+        mime_type: Optional[str] = None,
+    ) -> Iterator[list[dict]]:
+        """
+        Yield files page by page, as they arrive from the API.
+
+        Takes the same arguments as list_files; each yielded list holds
+        one API page of file dictionaries.
+        """
+        # Exclude trashed files
+        if not query and not mime_type:
+            q = _DEFAULT_QUERY
+        else:
             q_parts = []
             if query:
-                q_parts.append(f"name contains '{query}'")
+                q_parts.append(f"name contains '{_escape_query_value(query)}'")
             if mime_type:
-                q_parts.append(f"mimeType = '{mime_type}'")
-
-            # Exclude trashed files
-            q_parts.append("trashed = false")
-
-            q = " and ".join(q_parts) if q_parts else None
-
-            response = (
-                self.service.files()
-                .list(
-                    q=q,
-                    pageSize=max_results,
-                    fields="files(id, name, mimeType, size, modifiedTime, owners, webViewLink, driveId)",
-                    orderBy="modifiedTime desc",
-                    supportsAllDrives=True,
-                    includeItemsFromAllDrives=True,
+                q_parts.append(f"mimeType = '{_escape_query_value(mime_type)}'")
+            q_parts.append(_DEFAULT_QUERY)
+            q = " and ".join(q_parts)
+
+        # Drive caps pageSize, so page through results until max_results is reached
+        remaining = max_results
+        page_token = None
+        while remaining > 0:
+            try:
+                response = (
+                    self.service.files()
+                    .list(
+                        q=q,
+                        pageSize=min(MAX_PAGE_SIZE, remaining),
+                        pageToken=page_token,
+                        fields="nextPageToken, files(id, name, mimeType, size, modifiedTime, owners(emailAddress), webViewLink)",
+                        orderBy="modifiedTime desc",
+                        supportsAllDrives=True,
+                        includeItemsFromAllDrives=True,
+                    )
+                    .execute()
                 )
-                .execute()
-            )
+            except HttpError as e:
+                raise RuntimeError(f"Drive API error: {e}")
 
-            files = response.get("files", [])
-            result = []
-            for f in files:
-                owners = f.get("owners", [])
-                owner_email = owners[0].get("emailAddress", "") if owners else ""
-                result.append({
-                    "id": f["id"],
-                    "name": f.get("name", ""),
-                    "mime_type": f.get("mimeType", ""),
-                    "size": int(f.get("size", 0)) if f.get("size") else None,
-                    "modified_time": f.get("modifiedTime", ""),
-                    "owner": owner_email,
-                    "web_view_link": f.get("webViewLink", ""),
+            page = []
+            for f in response.get("files", [])[:remaining]:
+                fid, name, mime, size, _, modified, owners, link = _get_file_fields(
+                    {**_FILE_FIELD_DEFAULTS, **f}
+                )
+                page.append({
+                    "id": fid,
+                    "name": name,
+                    "mime_type": mime,
+                    "size": int(size) if size else None,
+                    "modified_time": modified,
+                    "owner": owners[0].get("emailAddress", "") if owners else "",
+                    "web_view_link": link,
                 })
+            if page:
+                remaining -= len(page)
+                yield page
 
-            return result
-        except HttpError as e:
-            raise RuntimeError(f"Drive API error: {e}")
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                break
 
     def download_file(
         self,
         file_id: str,
-        output_path: Optional[str] = None,
+        output_path: Optional[Union[str, os.PathLike]] = None,
         export_format: Optional[str] = None,
     ) -> str:
         """
@@ -224,7 +383,7 @@ class DriveClient:
 
         Args:
             file_id: The file ID or URL
-            output_path: Optional output path. If not specified, uses current directory
+            output_path: Optional output path (str or path-like). If not specified, uses current directory
                         with original filename.
             export_format: For Google Workspace files, the export format (e.g., 'pdf', 'csv')
 
@@ -244,25 +403,23 @@ class DriveClient:
                 file_id, original_name, mime_type, output_path, export_format
             )
         else:
-            return self._download_binary_file(file_id, original_name, output_path)
+            return self._download_binary_file(
+                file_id, original_name, output_path, metadata["size"]
+            )
 
     def _export_google_file(
         self,
         file_id: str,
         original_name: str,
         mime_type: str,
-        output_path: Optional[str],
+        output_path: Optional[Union[str, os.PathLike]],
         export_format: Optional[str],
     ) -> str:
         """Export a Google Workspace file to a downloadable format."""
-        export_info = EXPORT_MIME_TYPES[mime_type]
-
-        if export_format and export_format in export_info["formats"]:
-            export_mime = export_info["formats"][export_format]
-            extension = f".{export_format}"
-        else:
-            export_mime = export_info["default"]
-            extension = export_info["extension"]
+        export_mime, extension = (
+            _EXPORT_LOOKUP.get((mime_type, export_format))
+            or _EXPORT_LOOKUP[(mime_type, None)]
+        )
 
         # Determine output path
         if output_path:
@@ -277,14 +434,7 @@ class DriveClient:
                 fileId=file_id, mimeType=export_mime
             )
 
-            fh = io.BytesIO()
-            downloader = MediaIoBaseDownload(fh, request)
-
-            done = False
-            while not done:
-                _, done = downloader.next_chunk()
-
-            output.write_bytes(fh.getvalue())
+            self._download_to_path(request, output)
             return str(output)
 
         except HttpError as e:
@@ -296,7 +446,8 @@ class DriveClient:
         self,
         file_id: str,
         original_name: str,
-        output_path: Optional[str],
+        output_path: Optional[Union[str, os.PathLike]],
+        size: Optional[int] = None,
     ) -> str:
         """Download a binary (non-Google Workspace) file."""
         # Determine output path
@@ -308,19 +459,116 @@ class DriveClient:
             output = Path.cwd() / original_name
 
         try:
-            request = self.service.files().get_media(fileId=file_id, supportsAllDrives=True)
-
-            fh = io.BytesIO()
-            downloader = MediaIoBaseDownload(fh, request)
-
-            done = False
-            while not done:
-                _, done = downloader.next_chunk()
-
-            output.write_bytes(fh.getvalue())
+            self._stream_media(file_id, output, size)
             return str(output)
 
-        except HttpError as e:
-            if e.resp.status == 404:
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
                 raise ValueError(f"File not found: {file_id}")
             raise RuntimeError(f"Drive API error: {e}")
+        except requests.RequestException as e:
+            raise RuntimeError(f"Drive API error: {e}")
+
+    def _stream_media(self, file_id: str, output: Path, size: Optional[int] = None) -> None:
+        """Stream a binary file to disk, using parallel range GETs for large files."""
+        creds = get_credentials(get_active_account())
+        if creds is None:
+            raise RuntimeError("Not authenticated. Run 'assistant auth login' first.")
+
+        url = MEDIA_URL.format(file_id=quote(file_id))
+        part_path = output.with_name(output.name + ".part")
+        try:
+            if size and size > PARALLEL_DOWNLOAD_THRESHOLD:
+                try:
+                    self._fetch_ranges(creds, url, part_path, size)
+                except _RangeNotSatisfied:
+                    self._fetch_whole(creds, url, part_path)
+            else:
+                self._fetch_whole(creds, url, part_path)
+
+            part_path.replace(output)
+        finally:
+            part_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _fetch_whole(creds, url: str, part_path: Path) -> None:
+        """Copy the whole media body into part_path with a single GET."""
+        with AuthorizedSession(creds) as session, session.get(
+            url, params=_MEDIA_PARAMS, stream=True
+        ) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            with open(part_path, "wb") as fh:
+                shutil.copyfileobj(response.raw, fh, STREAM_BUFFER_SIZE)
+
+    @staticmethod
+    def _fetch_ranges(creds, url: str, part_path: Path, size: int) -> None:
+        """Fetch RANGE_SIZE slices concurrently and write each at its offset.
+
+        Raises _RangeNotSatisfied if the server ignores or rejects the Range
+        header, so the caller can fall back to a single GET.
+        """
+        local = threading.local()
+        sessions = []
+
+        def fetch(start: int) -> None:
+            session = getattr(local, "session", None)
+            if session is None:
+                session = local.session = AuthorizedSession(creds)
+                sessions.append(session)
+            end = min(start + RANGE_SIZE, size) - 1
+            with session.get(
+                url,
+                params=_MEDIA_PARAMS,
+                headers={"Range": f"bytes={start}-{end}", "Accept-Encoding": "identity"},
+                stream=True,
+            ) as response:
+                if response.status_code == 416:
+                    raise _RangeNotSatisfied()
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise _RangeNotSatisfied()
+                offset = start
+                for block in response.iter_content(STREAM_BUFFER_SIZE):
+                    os.pwrite(fd, block, offset)
+                    offset += len(block)
+            if offset != end + 1:
+                raise requests.RequestException(
+                    f"Short read for bytes {start}-{end} of {url}"
+                )
+
+        fd = os.open(part_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            if hasattr(os, "posix_fallocate"):
+                os.posix_fallocate(fd, 0, size)
+            else:
+                os.ftruncate(fd, size)
+            with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+                futures = [executor.submit(fetch, start) for start in range(0, size, RANGE_SIZE)]
+                try:
+                    for future in futures:
+                        future.result()
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+        finally:
+            os.close(fd)
+            for session in sessions:
+                session.close()
+
+    @staticmethod
+    def _download_to_path(request, output: Path) -> None:
+        """Stream a media request to disk via a .part file, then move it into place."""
+        part_path = output.with_name(output.name + ".part")
+        try:
+            with open(part_path, "wb") as fh:
+                downloader = MediaIoBaseDownload(fh, request, chunksize=DOWNLOAD_CHUNK_SIZE)
+
+                done = False
+                while not done:
+                    _, done = downloader.next_chunk()
+
+            part_path.replace(output)
+        finally:
+            part_path.unlink(missing_ok=True)
@@ -1,18 +1,30 @@
 """Google Drive CLI commands."""
 
-from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
-from rich.panel import Panel
-from rich.table import Table
 
 from ..auth import is_authenticated
-from ..utils.display import console, display_error, display_success
+from ..utils.display import console, display_error, display_success, display_table, format_size
 from .client import DriveClient, EXPORT_MIME_TYPES
 
-app = typer.Typer(help="Google Drive commands")
+if TYPE_CHECKING:
+    from rich.panel import Panel
+    from rich.table import Table
+
+app = typer.Typer(help="Google Drive commands", rich_markup_mode=None)
+
+# Shared client, created on first use after require_auth() has passed
+_client: Optional[DriveClient] = None
+
+
+def _get_client() -> DriveClient:
+    """Return the module's DriveClient, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = DriveClient()
+    return _client
 
 
 def require_auth():
@@ -22,106 +34,152 @@ def require_auth():
         raise typer.Exit(1)
 
 
-def format_file_list(files: list[dict]) -> Table:
+MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+# Two-digit month/hour fields of a timestamp mapped straight to display text,
+# so formatting needs no int() parsing
+_MONTH_NAMES = {f"{i:02d}": name for i, name in enumerate(MONTHS, 1)}
+_HOURS_12 = {f"{h:02d}": (f"{(h % 12) or 12:02d}", "AM" if h < 12 else "PM") for h in range(24)}
+
+
+def _split_timestamp(value: str) -> Optional[tuple[str, str, str]]:
+    """Split a Drive RFC 3339 timestamp into (month name, day, year) strings."""
+    month = _MONTH_NAMES.get(value[5:7])
+    if month is None or value[4:5] != "-" or value[7:8] != "-" or len(value) < 10:
+        return None
+    return month, value[8:10], value[:4]
+
+
+def _format_date(value: str) -> str:
+    """Format a Drive timestamp as 'Mon DD, YYYY'."""
+    parts = _split_timestamp(value)
+    if parts is None:
+        return value[:10]
+    month, day, year = parts
+    return f"{month[:3]} {day}, {year}"
+
+
+def _format_datetime(value: str) -> str:
+    """Format a Drive timestamp as 'Month DD, YYYY at HH:MM AM' (UTC)."""
+    parts = _split_timestamp(value)
+    hour = _HOURS_12.get(value[11:13])
+    if parts is None or hour is None or value[10:11] != "T" or value[13:14] != ":":
+        return value
+    month, day, year = parts
+    return f"{month} {day}, {year} at {hour[0]}:{value[14:16]} {hour[1]}"
+
+
+GOOGLE_APPS_PREFIX = "application/vnd.google-apps."
+
+
+def _type_display(mime: str) -> str:
+    """Shorten a MIME type for the file list's Type column."""
+    if mime.startswith(GOOGLE_APPS_PREFIX):
+        return "G-" + mime[len(GOOGLE_APPS_PREFIX):]
+    return mime.rpartition("/")[2][:15]
+
+
+# Type column text per MIME type; seeded with the Workspace types and
+# filled in as other types are seen
+_TYPE_DISPLAY = {mime: _type_display(mime) for mime in EXPORT_MIME_TYPES}
+
+# Workspace MIME type -> (comma-separated export formats, default extension)
+_EXPORT_FORMATS = {
+    mime: (", ".join(info["formats"]), info["extension"].lstrip("."))
+    for mime, info in EXPORT_MIME_TYPES.items()
+}
+
+
+# Listings longer than this are printed in slices of this many rows
+STREAM_ROWS = 256
+
+# Column headers and options for the file list table
+_LIST_COLUMNS = (
+    ("ID", {"style": "dim", "width": 35, "overflow": "fold"}),
+    ("Name", {"width": 30, "overflow": "ellipsis"}),
+    ("Type", {"width": 12, "overflow": "ellipsis"}),
+    ("Size", {"width": 10, "justify": "right"}),
+    ("Modified", {"width": 12}),
+)
+
+
+def _empty_file_table() -> "Table":
+    """Build the placeholder table shown for an empty file list (a new one each call)."""
+    from rich.table import Table
+
+    table = Table(show_header=False, box=None)
+    table.add_row("No files found.")
+    return table
+
+
+def format_file_list(files: list[dict], show_header: bool = True) -> "Table":
     """Format a list of files as a Rich table."""
-    table = Table(show_header=True, header_style="bold blue", box=None)
-    table.add_column("ID", style="dim", width=35, overflow="fold")
-    table.add_column("Name", width=30, overflow="ellipsis")
-    table.add_column("Type", width=12, overflow="ellipsis")
-    table.add_column("Size", width=10, justify="right")
-    table.add_column("Modified", width=12)
+    if not files:
+        return _empty_file_table()
+
+    from rich.table import Table
+
+    table = Table(show_header=show_header, header_style="bold blue", box=None)
+    for header, options in _LIST_COLUMNS:
+        table.add_column(header, **options)
+
+    # Bind the helpers and the table's add_row locally for the row loop
+    add_row = table.add_row
+    type_labels = _TYPE_DISPLAY
+    type_display = _type_display
+    format_date = _format_date
 
     for f in files:
+        get = f.get
+
         # Format MIME type for display
-        mime = f.get("mime_type", "")
-        if mime.startswith("application/vnd.google-apps."):
-            type_display = mime.replace("application/vnd.google-apps.", "G-")
-        elif "/" in mime:
-            type_display = mime.split("/")[-1][:15]
-        else:
-            type_display = mime[:15]
-
-        # Format size
-        size = f.get("size")
-        if size is None:
-            size_str = "-"
-        elif size > 1024 * 1024:
-            size_str = f"{size / (1024 * 1024):.1f} MB"
-        elif size > 1024:
-            size_str = f"{size / 1024:.1f} KB"
-        else:
-            size_str = f"{size} B"
-
-        # Format modified time
-        modified = f.get("modified_time", "")
-        if modified:
-            try:
-                dt = datetime.fromisoformat(modified.replace("Z", "+00:00"))
-                modified = dt.strftime("%b %d, %Y")
-            except (ValueError, AttributeError):
-                modified = modified[:10]
-
-        table.add_row(
-            f.get("id", ""),
-            f.get("name", "")[:40],
-            type_display,
-            size_str,
-            modified,
+        mime = get("mime_type", "")
+        label = type_labels.get(mime)
+        if label is None:
+            label = type_labels[mime] = type_display(mime)
+
+        modified = get("modified_time", "")
+        add_row(
+            get("id", ""),
+            get("name", "")[:40],
+            label,
+            format_size(get("size")),
+            format_date(modified) if modified else modified,
         )
 
     return table
 
 
-def format_file_detail(file: dict) -> Panel:
+def format_file_detail(file: dict) -> "Panel":
     """Format file metadata as a Rich panel."""
-    lines = [
-        f"[bold blue]Name:[/bold blue] {file.get('name', '')}",
-        f"[bold blue]ID:[/bold blue] {file.get('id', '')}",
-        f"[bold blue]Type:[/bold blue] {file.get('mime_type', '')}",
-    ]
-
-    size = file.get("size")
-    if size is not None:
-        if size > 1024 * 1024:
-            size_str = f"{size / (1024 * 1024):.1f} MB"
-        elif size > 1024:
-            size_str = f"{size / 1024:.1f} KB"
-        else:
-            size_str = f"{size} B"
-        lines.append(f"[bold blue]Size:[/bold blue] {size_str}")
-    else:
-        lines.append("[bold blue]Size:[/bold blue] [dim](Google Workspace file)[/dim]")
-
-    if file.get("owner"):
-        lines.append(f"[bold blue]Owner:[/bold blue] {file['owner']}")
-
-    if file.get("created_time"):
-        try:
-            dt = datetime.fromisoformat(file["created_time"].replace("Z", "+00:00"))
-            lines.append(f"[bold blue]Created:[/bold blue] {dt.strftime('%B %d, %Y at %I:%M %p')}")
-        except (ValueError, AttributeError):
-            lines.append(f"[bold blue]Created:[/bold blue] {file['created_time']}")
-
-    if file.get("modified_time"):
-        try:
-            dt = datetime.fromisoformat(file["modified_time"].replace("Z", "+00:00"))
-            lines.append(f"[bold blue]Modified:[/bold blue] {dt.strftime('%B %d, %Y at %I:%M %p')}")
-        except (ValueError, AttributeError):
-            lines.append(f"[bold blue]Modified:[/bold blue] {file['modified_time']}")
-
-    if file.get("web_view_link"):
-        lines.append(f"[bold blue]URL:[/bold blue] {file['web_view_link']}")
-
-    # Show export formats for Google Workspace files
-    mime_type = file.get("mime_type", "")
-    if mime_type in EXPORT_MIME_TYPES:
-        export_info = EXPORT_MIME_TYPES[mime_type]
-        formats = ", ".join(export_info["formats"].keys())
-        lines.append(f"\n[bold blue]Export formats:[/bold blue] {formats}")
-        default_ext = export_info["extension"].lstrip(".")
-        lines.append(f"[bold blue]Default export:[/bold blue] {default_ext}")
-
-    content = "\n".join(lines)
+    from rich.panel import Panel
+
+    get = file.get
+    mime_type = get("mime_type", "")
+    size = get("size")
+    owner = get("owner")
+    created = get("created_time")
+    modified = get("modified_time")
+    link = get("web_view_link")
+    export_formats = _EXPORT_FORMATS.get(mime_type)
+
+    content = "\n".join(line for line in (
+        f"[bold blue]Name:[/bold blue] {get('name', '')}",
+        f"[bold blue]ID:[/bold blue] {get('id', '')}",
+        f"[bold blue]Type:[/bold blue] {mime_type}",
+        f"[bold blue]Size:[/bold blue] {format_size(size)}" if size is not None
+        else "[bold blue]Size:[/bold blue] [dim](Google Workspace file)[/dim]",
+        f"[bold blue]Owner:[/bold blue] {owner}" if owner else None,
+        f"[bold blue]Created:[/bold blue] {_format_datetime(created)}" if created else None,
+        f"[bold blue]Modified:[/bold blue] {_format_datetime(modified)}" if modified else None,
+        f"[bold blue]URL:[/bold blue] {link}" if link else None,
+        # Show export formats for Google Workspace files
+        f"\n[bold blue]Export formats:[/bold blue] {export_formats[0]}\n"
+        f"[bold blue]Default export:[/bold blue] {export_formats[1]}" if export_formats else None,
+    ) if line is not None)
 
     return Panel(
         content,
@@ -138,17 +196,32 @@ def list_files(
     """List recent files from Google Drive."""
     require_auth()
 
-    client = DriveClient()
+    client = _get_client()
     try:
-        files = client.list_files(query=query, max_results=limit)
+        if limit <= STREAM_ROWS:
+            files = client.list_files(query=query, max_results=limit)
 
-        if not files:
-            console.print("No files found.")
+            if not files:
+                console.print("No files found.")
+                return
+
+            display_table(format_file_list(files), f"{len(files)} files")
             return
 
-        table = format_file_list(files)
-        console.print(table)
-        console.print(f"\n[dim]{len(files)} files[/dim]")
+        # Large listings: print each page in STREAM_ROWS slices as it arrives
+        # instead of holding every row in one table. Column widths are fixed,
+        # so the slices line up.
+        count = 0
+        for page in client.iter_files(query=query, max_results=limit):
+            for start in range(0, len(page), STREAM_ROWS):
+                rows = page[start:start + STREAM_ROWS]
+                console.print(format_file_list(rows, show_header=not count))
+                count += len(rows)
+
+        if not count:
+            console.print("No files found.")
+            return
+        console.print(f"\n[dim]{count} files[/dim]")
     except RuntimeError as e:
         display_error(str(e))
         raise typer.Exit(1)
@@ -156,21 +229,36 @@ def list_files(
 
 @app.command("info")
 def file_info(
-    file_id: str = typer.Argument(..., help="File ID or Google Drive URL"),
+    file_ids: list[str] = typer.Argument(..., metavar="FILE_ID...", help="File ID(s) or Google Drive URL(s)"),
 ):
-    """Show file metadata."""
+    """Show file metadata.
+
+    Several files can be given at once; their metadata is fetched in a
+    single batch request.
+    """
     require_auth()
 
-    client = DriveClient()
+    client = _get_client()
+    missing = False
     try:
-        metadata = client.get_file_metadata(file_id)
-        panel = format_file_detail(metadata)
-        console.print(panel)
-    except ValueError as e:
+        if len(file_ids) == 1:
+            metadata = client.get_file_metadata(file_ids[0])
+            panel = format_file_detail(metadata)
+            console.print(panel)
+            return
+
+        for file_id, metadata in zip(file_ids, client.get_many_metadata(file_ids)):
+            if metadata is None:
+                display_error(f"File not found: {file_id}")
+                missing = True
+            else:
+                console.print(format_file_detail(metadata))
+    except (ValueError, RuntimeError) as e:
         display_error(str(e))
         raise typer.Exit(1)
-    except RuntimeError as e:
-        display_error(str(e))
+
+    # Outside the try: typer.Exit is a RuntimeError and would be reported again
+    if missing:
         raise typer.Exit(1)
 
 
@@ -195,14 +283,10 @@ def download_file(
     """
     require_auth()
 
-    client = DriveClient()
+    client = _get_client()
     try:
-        output_path = str(output) if output else None
-        downloaded_path = client.download_file(file_id, output_path, export_format=format)
+        downloaded_path = client.download_file(file_id, output, export_format=format)
         display_success(f"Downloaded: {downloaded_path}")
-    except ValueError as e:
-        display_error(str(e))
-        raise typer.Exit(1)
-    except RuntimeError as e:
+    except (ValueError, RuntimeError) as e:
         display_error(str(e))
         raise typer.Exit(1)
@@ -1,5 +1,17 @@
 """Gmail module for Assistant CLI."""
 
-from .client import GmailClient
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import GmailClient
 
 __all__ = ["GmailClient"]
+
+
+def __getattr__(name: str):
+    # Import the client on first access so loading gmail.commands stays cheap
+    if name == "GmailClient":
+        from .client import GmailClient
+
+        return GmailClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
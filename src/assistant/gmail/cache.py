@@ -0,0 +1,95 @@
+"""On-disk cache of Gmail message metadata."""
+
+import sqlite3
+from pathlib import Path
+from typing import Iterable, Optional
+
+from ..utils.api import json_dumps, json_loads
+
+
+class MessageCache:
+    """
+    Message metadata responses keyed by message ID, stored in SQLite.
+
+    Entries stay valid until Gmail's history reports a label change or
+    deletion for the message, so the last history ID synced is stored with
+    them. The cache is emptied when the requested format changes.
+    """
+
+    def __init__(self, path: Path, fmt: str):
+        """
+        Open (or create) the cache.
+
+        Args:
+            path: SQLite database file
+            fmt: Description of the cached response format, e.g. the
+                metadata headers requested
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS messages (id TEXT PRIMARY KEY, data BLOB NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        if self._get_meta("format") != fmt:
+            self.clear()
+            self._set_meta("format", fmt)
+
+    def close(self, commit: bool = True) -> None:
+        """Close the database, committing pending changes unless told not to."""
+        if commit:
+            self._db.commit()
+        self._db.close()
+
+    def __enter__(self) -> "MessageCache":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        # Changes made before an error are discarded
+        self.close(commit=exc_type is None)
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._db.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, value))
+
+    @property
+    def history_id(self) -> Optional[str]:
+        """Gmail history ID the cached entries are current as of."""
+        return self._get_meta("history_id")
+
+    @history_id.setter
+    def history_id(self, value: str) -> None:
+        self._set_meta("history_id", value)
+
+    def get_many(self, message_ids: list[str]) -> dict[str, dict]:
+        """Return the cached responses for those IDs that are present."""
+        if not message_ids:
+            return {}
+        placeholders = ",".join("?" * len(message_ids))
+        rows = self._db.execute(
+            f"SELECT id, data FROM messages WHERE id IN ({placeholders})", message_ids
+        )
+        return {message_id: json_loads(data) for message_id, data in rows}
+
+    def put_many(self, messages: list[dict]) -> None:
+        """Store message responses, replacing existing entries."""
+        self._db.executemany(
+            "INSERT OR REPLACE INTO messages VALUES (?, ?)",
+            [(msg["id"], json_dumps(msg)) for msg in messages],
+        )
+
+    def discard(self, message_ids: Iterable[str]) -> None:
+        """Drop entries for the given IDs."""
+        self._db.executemany(
+            "DELETE FROM messages WHERE id = ?", [(message_id,) for message_id in message_ids]
+        )
+
+    def clear(self) -> None:
+        """Drop all entries and the stored history ID."""
+        self._db.execute("DELETE FROM messages")
+        self._db.execute("DELETE FROM meta WHERE key = 'history_id'")
@@ -2,17 +2,200 @@
 
 import base64
 import os
+import re
+import sqlite3
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from email.generator import BytesGenerator
 from email.mime.base import MIMEBase
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from email.utils import formataddr, getaddresses
+from functools import lru_cache
 from mimetypes import guess_type
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, BinaryIO, Iterator, Optional
+from urllib.parse import quote
 
-from googleapiclient.discovery import build
+import httplib2
+import requests
+from google.auth.transport.requests import AuthorizedSession
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaIoBaseUpload
+
+from ..auth import (
+    clear_cache,
+    get_account_cache_dir,
+    get_active_account,
+    get_credentials,
+    read_cache,
+    write_cache,
+)
+from ..utils.api import build_service
+from .cache import MessageCache
+
+# Gmail accepts up to 100 sub-requests per batch but recommends at most 50
+BATCH_SIZE = 50
+
+# Upper bound on batches sent concurrently by _batch_execute
+MAX_CONCURRENT_BATCHES = 8
+
+# Maximum message IDs per batchModify/batchDelete call
+BULK_ID_LIMIT = 1000
+
+# Worker threads for per-message fallbacks when a bulk call fails
+MAX_CONCURRENT_REQUESTS = 10
+
+# Worker threads for downloading a message's attachments
+MAX_CONCURRENT_DOWNLOADS = 8
+
+# Seconds the label name -> ID map is reused across invocations
+LABEL_CACHE_TTL = 60 * 60
+
+# Attachment response bytes read per step when saving attachments
+DECODE_CHUNK_SIZE = 1024 * 1024
+
+ATTACHMENT_URL = (
+    "https://gmail.googleapis.com/gmail/v1/users/me/messages/{message_id}/attachments/{attachment_id}"
+)
+
+# Start of the base64 value in an attachments.get JSON response
+_DATA_FIELD = re.compile(rb'"data"\s*:\s*"')
+
+# Attachment bytes read per base64 step when sending (a multiple of 57, one
+# encoded line, so the chunks join into the same output as a single pass)
+ENCODE_CHUNK_SIZE = 57 * 16 * 1024
+
+# Messages larger than this are sent with a resumable upload
+RESUMABLE_UPLOAD_THRESHOLD = 5 * 1024 * 1024
+
+# Headers requested for list views
+LIST_HEADERS = ["From", "To", "Cc", "Subject", "Date"]
+
+# History record fields that make a cached list entry stale
+HISTORY_CHANGES = ("labelsAdded", "labelsRemoved", "messagesDeleted")
+
+# Partial-response masks: only the fields each call's result is read for
+MESSAGE_LIST_FIELDS = "messages/id"
+MESSAGE_FIELDS = "id,threadId,historyId,labelIds,snippet,payload/headers"
+FULL_MESSAGE_FIELDS = "id,threadId,labelIds,snippet,payload"
+HISTORY_FIELDS = (
+    "history(labelsAdded/message/id,labelsRemoved/message/id,messagesDeleted/message/id),"
+    "historyId,nextPageToken"
+)
+LABEL_LIST_FIELDS = "labels(id,name)"
+LABEL_FIELDS = "id,name,type,messagesTotal,messagesUnread"
+DRAFT_LIST_FIELDS = "drafts/id"
+DRAFT_FIELDS = "id,message(id,payload/headers)"
+FILTER_LIST_FIELDS = "filter(id,criteria,action)"
+
+# System labels can be used in filters directly; user labels need an ID lookup
+SYSTEM_LABELS = frozenset({
+    "INBOX", "SPAM", "TRASH", "UNREAD", "STARRED", "IMPORTANT",
+    "SENT", "DRAFT", "CATEGORY_PERSONAL", "CATEGORY_SOCIAL",
+    "CATEGORY_PROMOTIONS", "CATEGORY_UPDATES", "CATEGORY_FORUMS",
+})
+
+# Filter --category names and their label IDs
+CATEGORY_LABELS = {
+    "primary": "CATEGORY_PERSONAL",
+    "social": "CATEGORY_SOCIAL",
+    "promotions": "CATEGORY_PROMOTIONS",
+    "updates": "CATEGORY_UPDATES",
+    "forums": "CATEGORY_FORUMS",
+}
+
+# Headers needed to address and thread a reply
+REPLY_HEADERS = ["From", "To", "Cc", "Subject", "Message-ID", "References", "In-Reply-To"]
+
+
+def _encode_file(path: str) -> str:
+    """Base64-encode a file as MIME-wrapped text, reading it a chunk at a time."""
+    with open(path, "rb") as f:
+        return "".join(
+            base64.encodebytes(chunk).decode("ascii")
+            for chunk in iter(lambda: f.read(ENCODE_CHUNK_SIZE), b"")
+        )
+
 
-from ..auth import get_credentials
+@lru_cache(maxsize=8)
+def _encoded_attachment(path: str, mtime_ns: int, size: int) -> str:
+    """
+    Base64-encode an attachment file, cached for small files.
+
+    Cached on (path, mtime, size) so sending the same file several times in
+    one process reads and encodes it once; a changed file gets a new entry.
+    """
+    return _encode_file(path)
+
+
+def _decode_data_field(source: BinaryIO, dest: BinaryIO) -> None:
+    """Decode the base64url "data" string of a streamed JSON body into dest."""
+    head = b""
+    while True:
+        chunk = source.read(DECODE_CHUNK_SIZE)
+        if not chunk:
+            raise RuntimeError("Gmail API error: attachment response has no data")
+        head += chunk
+        match = _DATA_FIELD.search(head)
+        if match:
+            break
+
+    # Decode 4-character-aligned runs until the closing quote
+    pending = head[match.end():]
+    while True:
+        end = pending.find(b'"')
+        if end >= 0:
+            pending = pending[:end]
+            dest.write(base64.urlsafe_b64decode(pending + b"=" * (-len(pending) % 4)))
+            return
+        aligned = len(pending) - len(pending) % 4
+        dest.write(base64.urlsafe_b64decode(pending[:aligned]))
+        pending = pending[aligned:]
+        chunk = source.read(DECODE_CHUNK_SIZE)
+        if not chunk:
+            raise RuntimeError("Gmail API error: attachment response was truncated")
+        pending += chunk
+
+
+def _free_name(filename: str, existing: set[str]) -> str:
+    """Pick the first "stem_N.suffix" variant of filename not in existing."""
+    path = Path(filename)
+    stem, suffix = path.stem, path.suffix
+    counter = 1
+    while f"{stem}_{counter}{suffix}" in existing:
+        counter += 1
+    return f"{stem}_{counter}{suffix}"
+
+
+def _attachment_info(part: dict) -> dict:
+    """Describe an attachment part of a message payload."""
+    body = part.get("body", {})
+    return {
+        "id": body.get("attachmentId"),
+        "filename": part["filename"],
+        "mimeType": part.get("mimeType", ""),
+        "size": body.get("size", 0),
+    }
+
+
+def _message_media(message: MIMEBase) -> MediaIoBaseUpload:
+    """Wrap a MIME message as a message/rfc822 upload, resumable when large."""
+    # Flatten straight into the upload buffer rather than copying as_bytes();
+    # large messages spill to disk and are streamed from there in chunks
+    buffer = tempfile.SpooledTemporaryFile(max_size=RESUMABLE_UPLOAD_THRESHOLD)
+    BytesGenerator(buffer, mangle_from_=False, policy=message.policy).flatten(message)
+    size = buffer.tell()
+    buffer.seek(0)
+    return MediaIoBaseUpload(
+        buffer,
+        mimetype="message/rfc822",
+        resumable=size > RESUMABLE_UPLOAD_THRESHOLD,
+    )
 
 
 class GmailClient:
@@ -21,56 +204,287 @@ class GmailClient:
     def __init__(self):
         """Initialize the Gmail client."""
         self._service = None
+        self._label_cache: Optional[dict[str, str]] = None
+        self._label_cache_fresh = False
+        self._email: Optional[str] = None
+        self._pending: Optional[list] = None
 
     @property
     def service(self):
         """Get or create the Gmail API service."""
         if self._service is None:
-            creds = get_credentials()
-            if creds is None:
-                raise RuntimeError("Not authenticated. Run 'assistant auth login' first.")
-            self._service = build("gmail", "v1", credentials=creds)
+            self._service = build_service("gmail", "v1", get_active_account())
         return self._service
 
+    def _sender_email(self) -> str:
+        """
+        Get the address this client sends as.
+
+        Accounts are stored under their Gmail address at login, so the active
+        account is used without a network call; getProfile is only a
+        fallback. The result is cached on the client.
+        """
+        if self._email is None:
+            email = get_active_account()
+            if not email:
+                try:
+                    profile = (
+                        self.service.users()
+                        .getProfile(userId="me", fields="emailAddress")
+                        .execute()
+                    )
+                except HttpError as e:
+                    raise RuntimeError(f"Gmail API error: {e}")
+                email = profile.get("emailAddress", "")
+            self._email = email
+        return self._email
+
     def list_messages(
         self,
         query: str = "",
         max_results: int = 20,
         label_ids: Optional[list[str]] = None,
+        use_cache: bool = True,
     ) -> list[dict]:
         """
         List messages matching the given query.
 
+        Message metadata is served from the on-disk cache where Gmail's
+        history shows the message unchanged; only the rest is fetched.
+
         Args:
             query: Gmail search query string
             max_results: Maximum number of messages to return
             label_ids: List of label IDs to filter by
+            use_cache: Whether to use the on-disk metadata cache
 
         Returns:
             List of message dictionaries with id, from, subject, date, snippet, unread
         """
+        message_ids = self.list_message_ids(query, max_results, label_ids)
         try:
-            params = {
-                "userId": "me",
-                "maxResults": max_results,
-            }
-            if query:
-                params["q"] = query
-            if label_ids:
-                params["labelIds"] = label_ids
+            with self._message_cache(use_cache) as cache:
+                found = cache.get_many(message_ids) if cache else {}
+
+                # Fetch the remaining message details in batches instead of one GET each
+                details = self._batch_execute([
+                    self.service.users().messages().get(
+                        userId="me",
+                        id=message_id,
+                        format="metadata",
+                        metadataHeaders=LIST_HEADERS,
+                        fields=MESSAGE_FIELDS,
+                    )
+                    for message_id in message_ids
+                    if message_id not in found
+                ])
+                fetched = self._found(details)
+
+                if cache and fetched:
+                    cache.put_many(fetched)
+                    if cache.history_id is None:
+                        # History after the newest fetched change covers every entry
+                        cache.history_id = max((msg["historyId"] for msg in fetched), key=int)
+        except HttpError as e:
+            raise RuntimeError(f"Gmail API error: {e}")
+
+        found.update((msg["id"], msg) for msg in fetched)
+        # Skip messages deleted since the list call
+        return [
+            self._format_message(found[message_id], minimal=True)
+            for message_id in message_ids
+            if message_id in found
+        ]
+
+    def list_message_ids(
+        self,
+        query: str = "",
+        max_results: int = 20,
+        label_ids: Optional[list[str]] = None,
+    ) -> list[str]:
+        """
+        List the IDs of messages matching the given query, without fetching them.
 
+        Args:
+            query: Gmail search query string
+            max_results: Maximum number of IDs to return
+            label_ids: List of label IDs to filter by
+
+        Returns:
+            Message IDs, newest first
+        """
+        params = {
+            "userId": "me",
+            "maxResults": max_results,
+            "fields": MESSAGE_LIST_FIELDS,
+        }
+        if query:
+            params["q"] = query
+        if label_ids:
+            params["labelIds"] = label_ids
+
+        try:
             response = self.service.users().messages().list(**params).execute()
-            messages = response.get("messages", [])
+        except HttpError as e:
+            raise RuntimeError(f"Gmail API error: {e}")
+        return [msg["id"] for msg in response.get("messages", [])]
+
+    @contextmanager
+    def _message_cache(self, enabled: bool) -> Iterator[Optional[MessageCache]]:
+        """Open the message cache for one operation, or yield None if disabled."""
+        cache = self._open_message_cache() if enabled else None
+        if cache is None:
+            yield None
+            return
+        with cache:
+            yield cache
+
+    def _open_message_cache(self) -> Optional[MessageCache]:
+        """
+        Open the active account's message cache, synced with Gmail history.
 
-            result = []
-            for msg in messages:
-                msg_detail = self.get_message(msg["id"], minimal=True)
-                if msg_detail:
-                    result.append(msg_detail)
+        Entries for messages whose labels changed, or that were deleted,
+        since the stored history ID are dropped. If that history has expired
+        the cache is emptied.
 
-            return result
+        Returns:
+            The cache, or None if there is no active account or it can't be opened
+        """
+        account = get_active_account()
+        if not account:
+            return None
+        try:
+            cache = MessageCache(
+                get_account_cache_dir(account) / "messages.db",
+                f"{','.join(LIST_HEADERS)};{MESSAGE_FIELDS}",
+            )
+        except (OSError, sqlite3.Error):
+            return None
+
+        start = cache.history_id
+        if start is None:
+            return cache
+
+        history = self.service.users().history()
+        request = history.list(
+            userId="me",
+            startHistoryId=start,
+            historyTypes=["labelAdded", "labelRemoved", "messageDeleted"],
+            maxResults=500,
+            fields=HISTORY_FIELDS,
+        )
+        changed = set()
+        latest = start
+        try:
+            while request is not None:
+                response = request.execute()
+                for record in response.get("history", ()):
+                    for key in HISTORY_CHANGES:
+                        for change in record.get(key, ()):
+                            changed.add(change["message"]["id"])
+                latest = response.get("historyId", latest)
+                request = history.list_next(request, response)
+        except HttpError as e:
+            if e.resp.status != 404:
+                cache.close(commit=False)
+                raise
+            cache.clear()
+            return cache
+
+        cache.discard(changed)
+        cache.history_id = latest
+        return cache
+
+    @contextmanager
+    def batch(self) -> Iterator["GmailClient"]:
+        """
+        Queue message changes made inside the block and send them together.
+
+        Within the block modify_labels, mark_as_read, mark_as_unread, archive
+        and trash_message return as soon as the call is queued; on exit the
+        queue is sent as batch requests. Nested blocks join the outer one.
+
+        Raises:
+            RuntimeError: On exit, if any queued call failed
+        """
+        if self._pending is not None:
+            yield self
+            return
+
+        self._pending = pending = []
+        try:
+            yield self
+        finally:
+            self._pending = None
+
+        try:
+            responses = self._batch_execute(pending)
         except HttpError as e:
             raise RuntimeError(f"Gmail API error: {e}")
+        for response in responses:
+            if isinstance(response, HttpError):
+                raise RuntimeError(f"Gmail API error: {response}")
+
+    def _execute(self, request) -> None:
+        """Execute a request, or queue it if inside batch()."""
+        if self._pending is not None:
+            self._pending.append(request)
+        else:
+            request.execute()
+
+    def _batch_execute(self, requests: list) -> list:
+        """
+        Execute API requests as batch calls of up to BATCH_SIZE each.
+
+        When more than one batch is needed they are sent concurrently.
+
+        Returns:
+            One entry per request, in order: the response, or the HttpError
+            raised for that sub-request
+        """
+        responses: dict[str, Any] = {}
+
+        def collect(request_id, response, exception):
+            responses[request_id] = response if exception is None else exception
+
+        batches = []
+        for offset in range(0, len(requests), BATCH_SIZE):
+            batch = self.service.new_batch_http_request(callback=collect)
+            for index in range(offset, min(offset + BATCH_SIZE, len(requests))):
+                batch.add(requests[index], request_id=str(index))
+            batches.append(batch)
+
+        if len(batches) == 1:
+            batches[0].execute()
+        elif batches:
+            # httplib2 connections aren't thread-safe, so give each batch its own
+            creds = get_credentials(get_active_account())
+            with ThreadPoolExecutor(
+                max_workers=min(len(batches), MAX_CONCURRENT_BATCHES)
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        batch.execute, http=AuthorizedHttp(creds, http=httplib2.Http())
+                    )
+                    for batch in batches
+                ]
+                for future in futures:
+                    future.result()
+
+        return [responses.get(str(index)) for index in range(len(requests))]
+
+    @staticmethod
+    def _found(responses: list) -> list[dict]:
+        """Drop 404 sub-responses from _batch_execute output; raise on other errors."""
+        result = []
+        for response in responses:
+            if isinstance(response, HttpError):
+                if response.resp.status == 404:
+                    continue
+                raise RuntimeError(f"Gmail API error: {response}")
+            if response:
+                result.append(response)
+        return result
 
     def get_message(self, message_id: str, minimal: bool = False) -> Optional[dict]:
         """
@@ -84,108 +498,140 @@ class GmailClient:
             Message dictionary with full details
         """
         try:
-            format_type = "metadata" if minimal else "full"
+            if minimal:
+                request = self.service.users().messages().get(
+                    userId="me",
+                    id=message_id,
+                    format="metadata",
+                    metadataHeaders=LIST_HEADERS,
+                    fields=MESSAGE_FIELDS,
+                )
+            else:
+                request = self.service.users().messages().get(
+                    userId="me", id=message_id, format="full", fields=FULL_MESSAGE_FIELDS
+                )
+            msg = request.execute()
+            return self._format_message(msg, minimal)
+        except HttpError as e:
+            if e.resp.status == 404:
+                return None
+            raise RuntimeError(f"Gmail API error: {e}")
+
+    def _get_reply_headers(self, message_id: str) -> Optional[dict]:
+        """
+        Fetch only the headers needed to reply to a message.
+
+        Returns:
+            The minimal message dictionary plus 'rfc822_message_id' and
+            'references', or None if the message does not exist
+        """
+        try:
             msg = (
                 self.service.users()
                 .messages()
-                .get(userId="me", id=message_id, format=format_type)
+                .get(
+                    userId="me",
+                    id=message_id,
+                    format="metadata",
+                    metadataHeaders=REPLY_HEADERS,
+                    fields=MESSAGE_FIELDS,
+                )
                 .execute()
             )
-
-            headers = {h["name"].lower(): h["value"] for h in msg.get("payload", {}).get("headers", [])}
-
-            result = {
-                "id": msg["id"],
-                "thread_id": msg.get("threadId"),
-                "from": headers.get("from", ""),
-                "to": headers.get("to", ""),
-                "cc": headers.get("cc", ""),
-                "subject": headers.get("subject", "(No Subject)"),
-                "date": headers.get("date", ""),
-                "snippet": msg.get("snippet", ""),
-                "unread": "UNREAD" in msg.get("labelIds", []),
-                "labels": msg.get("labelIds", []),
-            }
-
-            if not minimal:
-                # Extract body
-                result["body"] = self._extract_body(msg.get("payload", {}))
-                # Extract attachments info
-                result["attachments"] = self._extract_attachments_info(msg.get("payload", {}))
-
-            return result
         except HttpError as e:
             if e.resp.status == 404:
                 return None
             raise RuntimeError(f"Gmail API error: {e}")
 
+        headers = {h["name"].lower(): h["value"] for h in msg.get("payload", {}).get("headers", [])}
+        result = self._format_message(msg, minimal=True)
+        result["rfc822_message_id"] = headers.get("message-id", "")
+        result["references"] = headers.get("references", "")
+        return result
+
+    def _format_message(self, msg: dict, minimal: bool = False) -> dict:
+        """Shape a messages.get response into the client's message dictionary."""
+        headers = {h["name"].lower(): h["value"] for h in msg.get("payload", {}).get("headers", [])}
+
+        result = {
+            "id": msg["id"],
+            "thread_id": msg.get("threadId"),
+            "from": headers.get("from", ""),
+            "to": headers.get("to", ""),
+            "cc": headers.get("cc", ""),
+            "subject": headers.get("subject", "(No Subject)"),
+            "date": headers.get("date", ""),
+            "snippet": msg.get("snippet", ""),
+            "unread": "UNREAD" in msg.get("labelIds", []),
+            "labels": msg.get("labelIds", []),
+        }
+
+        if not minimal:
+            # Extract body
+            result["body"] = self._extract_body(msg.get("payload", {}))
+            # Extract attachments info
+            result["attachments"] = self._extract_attachments_info(msg.get("payload", {}))
+
+        return result
+
     def _extract_body(self, payload: dict) -> str:
-        """Extract the message body from payload."""
-        body = ""
-
-        if "body" in payload and payload["body"].get("data"):
-            body = base64.urlsafe_b64decode(payload["body"]["data"]).decode("utf-8")
-        elif "parts" in payload:
-            for part in payload["parts"]:
-                mime_type = part.get("mimeType", "")
-                if mime_type == "text/plain":
-                    if part.get("body", {}).get("data"):
-                        body = base64.urlsafe_b64decode(part["body"]["data"]).decode("utf-8")
-                        break
-                elif mime_type == "text/html" and not body:
-                    if part.get("body", {}).get("data"):
-                        # Fall back to HTML if no plain text
-                        body = base64.urlsafe_b64decode(part["body"]["data"]).decode("utf-8")
-                elif mime_type.startswith("multipart/"):
-                    # Recursively extract from nested parts
-                    body = self._extract_body(part)
-                    if body:
-                        break
-
-        return body
+        """Extract the message body from payload, preferring text/plain over HTML."""
+        data = payload.get("body", {}).get("data")
+        if data:
+            return base64.urlsafe_b64decode(data).decode("utf-8")
+
+        # Walk the MIME tree depth-first, in part order, without recursion.
+        # HTML is only remembered, and decoded only if no plain text exists.
+        html_data = None
+        stack = list(reversed(payload.get("parts", ())))
+        while stack:
+            part = stack.pop()
+            mime_type = part.get("mimeType", "")
+            if mime_type == "text/plain":
+                data = part.get("body", {}).get("data")
+                if data:
+                    return base64.urlsafe_b64decode(data).decode("utf-8")
+            elif mime_type == "text/html":
+                if html_data is None:
+                    html_data = part.get("body", {}).get("data") or None
+            elif mime_type.startswith("multipart/"):
+                stack.extend(reversed(part.get("parts", ())))
+
+        # Fall back to HTML if no plain text
+        if html_data:
+            return base64.urlsafe_b64decode(html_data).decode("utf-8")
+        return ""
 
     def _extract_attachments_info(self, payload: dict) -> list[dict]:
         """Extract attachment information from payload."""
-        attachments = []
-
-        def extract_from_parts(parts):
-            for part in parts:
-                filename = part.get("filename")
-                if filename:
-                    attachments.append({
-                        "id": part.get("body", {}).get("attachmentId"),
-                        "filename": filename,
-                        "mimeType": part.get("mimeType", ""),
-                        "size": part.get("body", {}).get("size", 0),
-                    })
-                if "parts" in part:
-                    extract_from_parts(part["parts"])
-
-        if "parts" in payload:
-            extract_from_parts(payload["parts"])
-        elif payload.get("filename"):
+        if "parts" not in payload:
             # Handle single-part messages where the payload itself is the attachment
-            attachments.append({
-                "id": payload.get("body", {}).get("attachmentId"),
-                "filename": payload["filename"],
-                "mimeType": payload.get("mimeType", ""),
-                "size": payload.get("body", {}).get("size", 0),
-            })
+            return [_attachment_info(payload)] if payload.get("filename") else []
+
+        attachments = []
+        stack = list(reversed(payload["parts"]))
+        while stack:
+            part = stack.pop()
+            if part.get("filename"):
+                attachments.append(_attachment_info(part))
+            if "parts" in part:
+                stack.extend(reversed(part["parts"]))
 
         return attachments
 
-    def search(self, query: str, max_results: int = 20) -> list[dict]:
+    def search(self, query: str, max_results: int = 20, use_cache: bool = True) -> list[dict]:
         """
         Search for messages matching the query.
 
         Args:
             query: Gmail search query string
             max_results: Maximum number of results
+            use_cache: Whether to use the on-disk metadata cache
 
         Returns:
             List of message dictionaries
         """
-        return self.list_messages(query=query, max_results=max_results)
+        return self.list_messages(query=query, max_results=max_results, use_cache=use_cache)
 
     def send_message(
         self,
@@ -198,6 +644,7 @@ class GmailClient:
         reply_to_message_id: Optional[str] = None,
         thread_id: Optional[str] = None,
         is_html: bool = False,
+        _reply_headers: Optional[dict] = None,
     ) -> dict:
         """
         Send an email message.
@@ -212,45 +659,18 @@ class GmailClient:
             reply_to_message_id: Message ID if this is a reply
             thread_id: Thread ID to add this message to
             is_html: If True, send body as HTML instead of plain text
+            _reply_headers: Already-fetched _get_reply_headers() result for
+                reply_to_message_id, to avoid fetching it again
 
         Returns:
             Sent message info
         """
         try:
             # Get sender info
-            profile = self.service.users().getProfile(userId="me").execute()
-            sender = profile.get("emailAddress", "")
+            sender = self._sender_email()
 
             subtype = "html" if is_html else "plain"
-            if attachments:
-                message = MIMEMultipart()
-                message.attach(MIMEText(body, subtype))
-
-                for file_path in attachments:
-                    path = Path(file_path)
-                    if not path.exists():
-                        raise FileNotFoundError(f"Attachment not found: {file_path}")
-
-                    content_type, _ = guess_type(str(path))
-                    if content_type is None:
-                        content_type = "application/octet-stream"
-
-                    main_type, sub_type = content_type.split("/", 1)
-
-                    with open(path, "rb") as f:
-                        attachment = MIMEBase(main_type, sub_type)
-                        attachment.set_payload(f.read())
-
-                    from email.encoders import encode_base64
-                    encode_base64(attachment)
-                    attachment.add_header(
-                        "Content-Disposition",
-                        "attachment",
-                        filename=path.name,
-                    )
-                    message.attach(attachment)
-            else:
-                message = MIMEText(body, subtype)
+            message = self._build_mime_message(body, subtype, attachments)
 
             message["to"] = to
             message["from"] = sender
@@ -261,23 +681,21 @@ class GmailClient:
             if bcc:
                 message["bcc"] = bcc
 
-            # Handle reply headers
+            # Handle reply headers, threading on the original's RFC 822 Message-ID
             if reply_to_message_id:
-                original = self.get_message(reply_to_message_id)
-                if original:
-                    message["In-Reply-To"] = reply_to_message_id
-                    message["References"] = reply_to_message_id
-
-            raw = base64.urlsafe_b64encode(message.as_bytes()).decode("utf-8")
+                original = _reply_headers or self._get_reply_headers(reply_to_message_id)
+                if original and original["rfc822_message_id"]:
+                    rfc822_id = original["rfc822_message_id"]
+                    message["In-Reply-To"] = rfc822_id
+                    message["References"] = f"{original['references']} {rfc822_id}".strip()
 
-            body_data = {"raw": raw}
-            if thread_id:
-                body_data["threadId"] = thread_id
+            # Upload the RFC 822 bytes as media rather than base64 in a JSON "raw" field
+            body_data = {"threadId": thread_id} if thread_id else None
 
             sent = (
                 self.service.users()
                 .messages()
-                .send(userId="me", body=body_data)
+                .send(userId="me", body=body_data, media_body=_message_media(message))
                 .execute()
             )
 
@@ -285,6 +703,46 @@ class GmailClient:
         except HttpError as e:
             raise RuntimeError(f"Gmail API error: {e}")
 
+    @staticmethod
+    def _build_mime_message(body: str, subtype: str, attachments: Optional[list[str]]) -> MIMEBase:
+        """Build the MIME body: text alone, or multipart with the files attached."""
+        if not attachments:
+            return MIMEText(body, subtype)
+
+        message = MIMEMultipart()
+        message.attach(MIMEText(body, subtype))
+
+        for file_path in attachments:
+            path = Path(file_path)
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Attachment not found: {file_path}") from None
+
+            # Large payloads aren't kept around between sends
+            if stat.st_size <= RESUMABLE_UPLOAD_THRESHOLD:
+                payload = _encoded_attachment(str(path), stat.st_mtime_ns, stat.st_size)
+            else:
+                payload = _encode_file(str(path))
+
+            content_type, _ = guess_type(path.name)
+            if content_type is None:
+                content_type = "application/octet-stream"
+            main_type, sub_type = content_type.split("/", 1)
+
+            # Fresh part per message; only the encoded payload is shared
+            attachment = MIMEBase(main_type, sub_type)
+            attachment.set_payload(payload)
+            attachment["Content-Transfer-Encoding"] = "base64"
+            attachment.add_header(
+                "Content-Disposition",
+                "attachment",
+                filename=path.name,
+            )
+            message.attach(attachment)
+
+        return message
+
     def create_draft(
         self,
         to: str,
@@ -307,38 +765,9 @@ class GmailClient:
             Draft info with ID
         """
         try:
-            profile = self.service.users().getProfile(userId="me").execute()
-            sender = profile.get("emailAddress", "")
-
-            if attachments:
-                message = MIMEMultipart()
-                message.attach(MIMEText(body, "plain"))
-
-                for file_path in attachments:
-                    path = Path(file_path)
-                    if not path.exists():
-                        raise FileNotFoundError(f"Attachment not found: {file_path}")
-
-                    content_type, _ = guess_type(str(path))
-                    if content_type is None:
-                        content_type = "application/octet-stream"
+            sender = self._sender_email()
 
-                    main_type, sub_type = content_type.split("/", 1)
-
-                    with open(path, "rb") as f:
-                        attachment = MIMEBase(main_type, sub_type)
-                        attachment.set_payload(f.read())
-
-                    from email.encoders import encode_base64
-                    encode_base64(attachment)
-                    attachment.add_header(
-                        "Content-Disposition",
-                        "attachment",
-                        filename=path.name,
-                    )
-                    message.attach(attachment)
-            else:
-                message = MIMEText(body, "plain")
+            message = self._build_mime_message(body, "plain", attachments)
 
             message["to"] = to
             message["from"] = sender
@@ -346,12 +775,10 @@ class GmailClient:
             if cc:
                 message["cc"] = cc
 
-            raw = base64.urlsafe_b64encode(message.as_bytes()).decode("utf-8")
-
             draft = (
                 self.service.users()
                 .drafts()
-                .create(userId="me", body={"message": {"raw": raw}})
+                .create(userId="me", media_body=_message_media(message))
                 .execute()
             )
 
@@ -376,7 +803,7 @@ class GmailClient:
         Returns:
             Sent message info
         """
-        original = self.get_message(message_id)
+        original = self._get_reply_headers(message_id)
         if not original:
             raise ValueError(f"Message not found: {message_id}")
 
@@ -385,25 +812,26 @@ class GmailClient:
         cc = ""
         if reply_all:
             # Get original recipients excluding ourselves
-            profile = self.service.users().getProfile(userId="me").execute()
-            my_email = profile.get("emailAddress", "")
+            my_email = self._sender_email()
 
             orig_to = original.get("to", "")
             orig_cc = original.get("cc", "")
 
-            # Combine all recipients except ourselves
-            all_recipients = []
-            for addr in (orig_to + "," + orig_cc).split(","):
-                addr = addr.strip()
-                if addr and my_email.lower() not in addr.lower():
-                    all_recipients.append(addr)
+            # Combine all recipients except ourselves; getaddresses handles
+            # quoted display names that contain commas
+            my_email_lower = my_email.lower()
+            all_recipients = [
+                formataddr(addr)
+                for addr in getaddresses([orig_to, orig_cc])
+                if addr[1] and addr[1].lower() != my_email_lower
+            ]
 
             if all_recipients:
                 cc = ", ".join(all_recipients)
 
         # Prepare subject with Re: prefix
         subject = original["subject"]
-        if not subject.lower().startswith("re:"):
+        if subject[:3].lower() != "re:":
             subject = f"Re: {subject}"
 
         return self.send_message(
@@ -413,6 +841,7 @@ class GmailClient:
             cc=cc,
             reply_to_message_id=message_id,
             thread_id=original.get("thread_id"),
+            _reply_headers=original,
         )
 
     def forward(self, message_id: str, to: str, body: str = "") -> dict:
@@ -433,7 +862,7 @@ class GmailClient:
 
         # Prepare subject with Fwd: prefix
         subject = original["subject"]
-        if not subject.lower().startswith("fwd:"):
+        if subject[:4].lower() != "fwd:":
             subject = f"Fwd: {subject}"
 
         # Build forwarded message body
@@ -459,7 +888,7 @@ class GmailClient:
             True if successful
         """
         try:
-            self.service.users().messages().trash(userId="me", id=message_id).execute()
+            self._execute(self.service.users().messages().trash(userId="me", id=message_id))
             return True
         except HttpError as e:
             raise RuntimeError(f"Gmail API error: {e}")
@@ -496,6 +925,112 @@ class GmailClient:
         except HttpError as e:
             raise RuntimeError(f"Gmail API error: {e}")
 
+    def _execute_each(self, requests: dict[str, Any]) -> dict[str, RuntimeError]:
+        """
+        Execute independent requests concurrently.
+
+        httplib2 connections aren't thread-safe, so each worker thread sends
+        its requests over its own AuthorizedHttp.
+
+        Args:
+            requests: API requests keyed by an identifier (e.g. message ID)
+
+        Returns:
+            The error for each request that failed, keyed the same way
+        """
+        creds = get_credentials(get_active_account())
+        local = threading.local()
+
+        def execute(request) -> None:
+            http = getattr(local, "http", None)
+            if http is None:
+                http = local.http = AuthorizedHttp(creds, http=httplib2.Http())
+            request.execute(http=http)
+
+        failures: dict[str, RuntimeError] = {}
+        with ThreadPoolExecutor(
+            max_workers=min(len(requests), MAX_CONCURRENT_REQUESTS) or 1
+        ) as executor:
+            futures = {key: executor.submit(execute, request) for key, request in requests.items()}
+            for key, future in futures.items():
+                try:
+                    future.result()
+                except HttpError as e:
+                    failures[key] = RuntimeError(f"Gmail API error: {e}")
+        return failures
+
+    def trash_each(self, message_ids: list[str]) -> dict[str, RuntimeError]:
+        """
+        Trash messages with one concurrent request each.
+
+        Used when a bulk call fails, so one bad ID only fails itself.
+
+        Returns:
+            The error for each message that could not be trashed
+        """
+        messages = self.service.users().messages()
+        return self._execute_each({
+            message_id: messages.trash(userId="me", id=message_id)
+            for message_id in message_ids
+        })
+
+    def archive_each(self, message_ids: list[str]) -> dict[str, RuntimeError]:
+        """
+        Archive messages with one concurrent request each.
+
+        Used when a bulk call fails, so one bad ID only fails itself.
+
+        Returns:
+            The error for each message that could not be archived
+        """
+        messages = self.service.users().messages()
+        return self._execute_each({
+            message_id: messages.modify(
+                userId="me", id=message_id, body={"removeLabelIds": ["INBOX"]}
+            )
+            for message_id in message_ids
+        })
+
+    def batch_trash(self, message_ids: list[str]) -> int:
+        """
+        Move many messages to trash with batchModify calls.
+
+        Only TRASH is added, as messages.trash does, so untrash restores
+        the messages to where they were.
+
+        Returns:
+            Number of messages trashed
+        """
+        return self.batch_modify_labels(message_ids, add_labels=["TRASH"])
+
+    def batch_mark_read(self, message_ids: list[str]) -> int:
+        """Mark many messages as read with batchModify calls."""
+        return self.batch_modify_labels(message_ids, remove_labels=["UNREAD"])
+
+    def batch_archive(self, message_ids: list[str]) -> int:
+        """Archive many messages (remove from inbox) with batchModify calls."""
+        return self.batch_modify_labels(message_ids, remove_labels=["INBOX"])
+
+    def batch_delete(self, message_ids: list[str]) -> int:
+        """
+        Permanently delete many messages with batchDelete calls.
+
+        Args:
+            message_ids: The message IDs, sent BULK_ID_LIMIT per call
+
+        Returns:
+            Number of messages deleted
+        """
+        try:
+            for offset in range(0, len(message_ids), BULK_ID_LIMIT):
+                self.service.users().messages().batchDelete(
+                    userId="me",
+                    body={"ids": message_ids[offset:offset + BULK_ID_LIMIT]},
+                ).execute()
+        except HttpError as e:
+            raise RuntimeError(f"Gmail API error: {e}")
+        return len(message_ids)
+
     def modify_labels(
         self,
         message_id: str,
@@ -520,13 +1055,46 @@ class GmailClient:
             if remove_labels:
                 body["removeLabelIds"] = remove_labels
 
-            self.service.users().messages().modify(
-                userId="me", id=message_id, body=body
-            ).execute()
+            self._execute(
+                self.service.users().messages().modify(userId="me", id=message_id, body=body)
+            )
             return True
         except HttpError as e:
             raise RuntimeError(f"Gmail API error: {e}")
 
+    def batch_modify_labels(
+        self,
+        message_ids: list[str],
+        add_labels: Optional[list[str]] = None,
+        remove_labels: Optional[list[str]] = None,
+    ) -> int:
+        """
+        Modify labels on many messages with batchModify calls.
+
+        Args:
+            message_ids: The message IDs, sent BULK_ID_LIMIT per call
+            add_labels: Labels to add
+            remove_labels: Labels to remove
+
+        Returns:
+            Number of messages modified
+        """
+        body = {}
+        if add_labels:
+            body["addLabelIds"] = add_labels
+        if remove_labels:
+            body["removeLabelIds"] = remove_labels
+
+        try:
+            for offset in range(0, len(message_ids), BULK_ID_LIMIT):
+                self.service.users().messages().batchModify(
+                    userId="me",
+                    body={**body, "ids": message_ids[offset:offset + BULK_ID_LIMIT]},
+                ).execute()
+        except HttpError as e:
+            raise RuntimeError(f"Gmail API error: {e}")
+        return len(message_ids)
+
     def mark_as_read(self, message_id: str) -> bool:
         """Mark a message as read."""
         return self.modify_labels(message_id, remove_labels=["UNREAD"])
@@ -558,35 +1126,105 @@ class GmailClient:
         Returns:
             Path to the downloaded file
         """
+        download_path = Path(download_dir)
+        download_path.mkdir(parents=True, exist_ok=True)
+
+        file_path = download_path / filename
+
+        # Handle filename conflicts, listing the directory once rather
+        # than stat-ing each numbered candidate
+        if file_path.exists():
+            with os.scandir(download_path) as entries:
+                existing = {entry.name for entry in entries}
+            file_path = download_path / _free_name(filename, existing)
+
         try:
-            attachment = (
-                self.service.users()
-                .messages()
-                .attachments()
-                .get(userId="me", messageId=message_id, id=attachment_id)
-                .execute()
-            )
+            self._stream_attachment(message_id, attachment_id, file_path)
+        except requests.RequestException as e:
+            raise RuntimeError(f"Gmail API error: {e}")
+        return str(file_path)
 
-            data = base64.urlsafe_b64decode(attachment["data"])
+    def download_attachments(
+        self,
+        message_id: str,
+        attachments: list[dict],
+        download_dir: str = ".",
+    ) -> tuple[list[str], dict[str, RuntimeError]]:
+        """
+        Download several attachments of a message concurrently.
 
-            download_path = Path(download_dir)
-            download_path.mkdir(parents=True, exist_ok=True)
+        File names are chosen up front, so attachments sharing a name get
+        distinct numbered files just as with sequential downloads.
 
-            file_path = download_path / filename
+        Args:
+            message_id: The message ID
+            attachments: Attachment dictionaries (id, filename) from get_message
+            download_dir: Directory to save the files
 
-            # Handle filename conflicts
-            counter = 1
-            original_stem = file_path.stem
-            while file_path.exists():
-                file_path = download_path / f"{original_stem}_{counter}{file_path.suffix}"
-                counter += 1
+        Returns:
+            (paths of the saved files in attachment order,
+             the error for each attachment that failed, keyed by the file
+             name it was to be saved as)
+        """
+        download_path = Path(download_dir)
+        download_path.mkdir(parents=True, exist_ok=True)
+        with os.scandir(download_path) as entries:
+            existing = {entry.name for entry in entries}
+
+        targets = []
+        for att in attachments:
+            name = att["filename"]
+            if name in existing:
+                name = _free_name(name, existing)
+            existing.add(name)
+            targets.append((att, download_path / name))
+
+        paths: list[str] = []
+        failures: dict[str, RuntimeError] = {}
+        with ThreadPoolExecutor(
+            max_workers=min(len(targets), MAX_CONCURRENT_DOWNLOADS) or 1
+        ) as executor:
+            futures = [
+                executor.submit(self._stream_attachment, message_id, att["id"], file_path)
+                for att, file_path in targets
+            ]
+            for (_, file_path), future in zip(targets, futures):
+                try:
+                    future.result()
+                    paths.append(str(file_path))
+                except requests.RequestException as e:
+                    failures[file_path.name] = RuntimeError(f"Gmail API error: {e}")
+                except RuntimeError as e:
+                    failures[file_path.name] = e
+        return paths, failures
+
+    @staticmethod
+    def _stream_attachment(message_id: str, attachment_id: str, file_path: Path) -> None:
+        """
+        Stream an attachment to disk, decoding its base64 as it arrives.
 
-            with open(file_path, "wb") as f:
-                f.write(data)
+        attachments.get has no media download, so the JSON response (trimmed
+        to its data field) is read in chunks and never held in memory whole.
+        """
+        creds = get_credentials()
+        if creds is None:
+            raise RuntimeError("Not authenticated. Run 'assistant auth login' first.")
 
-            return str(file_path)
-        except HttpError as e:
-            raise RuntimeError(f"Gmail API error: {e}")
+        url = ATTACHMENT_URL.format(
+            message_id=quote(message_id, safe=""), attachment_id=quote(attachment_id, safe="")
+        )
+        part_path = file_path.with_name(file_path.name + ".part")
+        try:
+            with AuthorizedSession(creds) as session, session.get(
+                url, params={"fields": "data"}, stream=True
+            ) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                with open(part_path, "wb") as fh:
+                    _decode_data_field(response.raw, fh)
+            part_path.replace(file_path)
+        finally:
+            part_path.unlink(missing_ok=True)
 
     def list_labels(self) -> list[dict]:
         """
@@ -596,30 +1234,33 @@ class GmailClient:
             List of label dictionaries
         """
         try:
-            response = self.service.users().labels().list(userId="me").execute()
+            response = (
+                self.service.users().labels().list(userId="me", fields=LABEL_LIST_FIELDS).execute()
+            )
             labels = response.get("labels", [])
+            self._store_label_cache(labels)
 
-            result = []
-            for label in labels:
-                # Get full label details
-                label_detail = (
-                    self.service.users()
-                    .labels()
-                    .get(userId="me", id=label["id"])
-                    .execute()
-                )
-                result.append({
-                    "id": label_detail["id"],
-                    "name": label_detail["name"],
-                    "type": label_detail.get("type", "user"),
-                    "messagesTotal": label_detail.get("messagesTotal", 0),
-                    "messagesUnread": label_detail.get("messagesUnread", 0),
-                })
-
-            return sorted(result, key=lambda x: x["name"])
+            # Get full label details (message counts) in batches
+            details = self._batch_execute([
+                self.service.users().labels().get(userId="me", id=label["id"], fields=LABEL_FIELDS)
+                for label in labels
+            ])
         except HttpError as e:
             raise RuntimeError(f"Gmail API error: {e}")
 
+        result = [
+            {
+                "id": label_detail["id"],
+                "name": label_detail["name"],
+                "type": label_detail.get("type", "user"),
+                "messagesTotal": label_detail.get("messagesTotal", 0),
+                "messagesUnread": label_detail.get("messagesUnread", 0),
+            }
+            for label_detail in self._found(details)
+        ]
+        result.sort(key=itemgetter("name"))
+        return result
+
     def get_label_id(self, name: str) -> Optional[str]:
         """
         Get a label ID by name.
@@ -630,15 +1271,76 @@ class GmailClient:
         Returns:
             Label ID if found, None otherwise
         """
-        try:
-            response = self.service.users().labels().list(userId="me").execute()
-            labels = response.get("labels", [])
-            for label in labels:
-                if label["name"].lower() == name.lower():
-                    return label["id"]
-            return None
-        except HttpError as e:
-            raise RuntimeError(f"Gmail API error: {e}")
+        key = name.lower()
+        label_id = self._load_label_cache().get(key)
+        if label_id is None and not self._label_cache_fresh:
+            # The on-disk map may predate the label; check the server once
+            label_id = self._load_label_cache(refresh=True).get(key)
+        return label_id
+
+    def resolve_label_ids(self, labels: Optional[list[str]]) -> list[str]:
+        """
+        Resolve label names to label IDs from the cached label map.
+
+        System labels (INBOX, STARRED, ...) are used directly, in any case;
+        existing label IDs are accepted as-is.
+
+        Args:
+            labels: Label names or IDs
+
+        Returns:
+            Label IDs, in the same order
+
+        Raises:
+            ValueError: If a label doesn't exist
+        """
+        label_ids = []
+        for label in labels or ():
+            if label.upper() in SYSTEM_LABELS:
+                label_ids.append(label.upper())
+                continue
+            label_id = self.get_label_id(label)
+            if label_id is None and label in self._load_label_cache().values():
+                label_id = label
+            if label_id is None:
+                raise ValueError(f"Label not found: {label}")
+            label_ids.append(label_id)
+        return label_ids
+
+    def _load_label_cache(self, refresh: bool = False) -> dict[str, str]:
+        """
+        Map lowercased label names to IDs.
+
+        The map is kept on the client and on disk for LABEL_CACHE_TTL, so
+        labels are listed at most once per client and usually not at all.
+        """
+        if refresh:
+            self._label_cache = None
+        elif self._label_cache is None:
+            account = get_active_account()
+            if account:
+                self._label_cache = read_cache("labels", account, LABEL_CACHE_TTL)
+
+        if self._label_cache is None:
+            try:
+                response = (
+                    self.service.users()
+                    .labels()
+                    .list(userId="me", fields=LABEL_LIST_FIELDS)
+                    .execute()
+                )
+            except HttpError as e:
+                raise RuntimeError(f"Gmail API error: {e}")
+            self._store_label_cache(response.get("labels", []))
+        return self._label_cache
+
+    def _store_label_cache(self, labels: list[dict]) -> None:
+        """Replace the label map from a labels.list response."""
+        self._label_cache = {label["name"].lower(): label["id"] for label in labels}
+        self._label_cache_fresh = True
+        account = get_active_account()
+        if account:
+            write_cache("labels", account, self._label_cache)
 
     def create_label(self, name: str) -> dict:
         """
@@ -662,6 +1364,10 @@ class GmailClient:
                 .create(userId="me", body=label_body)
                 .execute()
             )
+            self._label_cache = None
+            account = get_active_account()
+            if account:
+                clear_cache("labels", account)
             return {
                 "id": label["id"],
                 "name": label["name"],
@@ -679,33 +1385,37 @@ class GmailClient:
             List of draft dictionaries
         """
         try:
-            response = self.service.users().drafts().list(userId="me").execute()
+            response = (
+                self.service.users().drafts().list(userId="me", fields=DRAFT_LIST_FIELDS).execute()
+            )
             drafts = response.get("drafts", [])
 
-            result = []
-            for draft in drafts:
-                draft_detail = (
-                    self.service.users()
-                    .drafts()
-                    .get(userId="me", id=draft["id"])
-                    .execute()
+            details = self._batch_execute([
+                # Headers only; drafts.get has no metadataHeaders filter
+                self.service.users().drafts().get(
+                    userId="me", id=draft["id"], format="metadata", fields=DRAFT_FIELDS
                 )
-                msg = draft_detail.get("message", {})
-                headers = {
-                    h["name"].lower(): h["value"]
-                    for h in msg.get("payload", {}).get("headers", [])
-                }
-                result.append({
-                    "id": draft["id"],
-                    "message_id": msg.get("id"),
-                    "to": headers.get("to", ""),
-                    "subject": headers.get("subject", "(No Subject)"),
-                })
-
-            return result
+                for draft in drafts
+            ])
         except HttpError as e:
             raise RuntimeError(f"Gmail API error: {e}")
 
+        result = []
+        for draft_detail in self._found(details):
+            msg = draft_detail.get("message", {})
+            headers = {
+                h["name"].lower(): h["value"]
+                for h in msg.get("payload", {}).get("headers", [])
+            }
+            result.append({
+                "id": draft_detail["id"],
+                "message_id": msg.get("id"),
+                "to": headers.get("to", ""),
+                "subject": headers.get("subject", "(No Subject)"),
+            })
+
+        return result
+
     def send_draft(self, draft_id: str) -> dict:
         """
         Send a draft.
@@ -769,7 +1479,13 @@ class GmailClient:
             List of filter dictionaries
         """
         try:
-            response = self.service.users().settings().filters().list(userId="me").execute()
+            response = (
+                self.service.users()
+                .settings()
+                .filters()
+                .list(userId="me", fields=FILTER_LIST_FIELDS)
+                .execute()
+            )
             filters = response.get("filter", [])
 
             result = []
@@ -848,34 +1564,8 @@ class GmailClient:
             # Build action
             action = {}
 
-            # System labels can be used directly, user labels need ID lookup
-            system_labels = {
-                "INBOX", "SPAM", "TRASH", "UNREAD", "STARRED", "IMPORTANT",
-                "SENT", "DRAFT", "CATEGORY_PERSONAL", "CATEGORY_SOCIAL",
-                "CATEGORY_PROMOTIONS", "CATEGORY_UPDATES", "CATEGORY_FORUMS",
-            }
-
-            add_label_ids = []
-            if add_labels:
-                for label in add_labels:
-                    if label.upper() in system_labels:
-                        add_label_ids.append(label.upper())
-                    else:
-                        label_id = self.get_label_id(label)
-                        if not label_id:
-                            raise ValueError(f"Label not found: {label}")
-                        add_label_ids.append(label_id)
-
-            remove_label_ids = []
-            if remove_labels:
-                for label in remove_labels:
-                    if label.upper() in system_labels:
-                        remove_label_ids.append(label.upper())
-                    else:
-                        label_id = self.get_label_id(label)
-                        if not label_id:
-                            raise ValueError(f"Label not found: {label}")
-                        remove_label_ids.append(label_id)
+            add_label_ids = self.resolve_label_ids(add_labels)
+            remove_label_ids = self.resolve_label_ids(remove_labels)
 
             if archive:
                 remove_label_ids.append("INBOX")
@@ -892,15 +1582,9 @@ class GmailClient:
             elif important is False:
                 remove_label_ids.append("IMPORTANT")
             if category:
-                category_map = {
-                    "primary": "CATEGORY_PERSONAL",
-                    "social": "CATEGORY_SOCIAL",
-                    "promotions": "CATEGORY_PROMOTIONS",
-                    "updates": "CATEGORY_UPDATES",
-                    "forums": "CATEGORY_FORUMS",
-                }
-                if category.lower() in category_map:
-                    add_label_ids.append(category_map[category.lower()])
+                category_id = CATEGORY_LABELS.get(category.lower())
+                if category_id:
+                    add_label_ids.append(category_id)
 
             if add_label_ids:
                 action["addLabelIds"] = list(set(add_label_ids))
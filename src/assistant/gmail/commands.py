@@ -1,7 +1,7 @@
 """Gmail CLI commands."""
 
-from pathlib import Path
-from typing import Optional
+from functools import cache
+from typing import TYPE_CHECKING, Optional
 
 import typer
 
@@ -10,6 +10,7 @@ from ..utils.display import (
     console,
     display_error,
     display_success,
+    display_table,
     display_warning,
     format_attachments,
     format_drafts,
@@ -19,14 +20,44 @@ from ..utils.display import (
     open_editor,
     confirm,
 )
-from .client import GmailClient
 
-app = typer.Typer(help="Gmail commands")
+if TYPE_CHECKING:
+    from .client import GmailClient
+
+app = typer.Typer(help="Gmail commands", rich_markup_mode=None)
+
+# Filter criteria fields and the prefix each is shown with
+FILTER_CRITERIA = (("from", "from:"), ("to", "to:"), ("subject", "subject:"), ("query", ""))
+
+# Filter label changes shown by name: (label list, label, description)
+FILTER_ACTIONS = (
+    ("remove_labels", "INBOX", "Skip Inbox"),
+    ("remove_labels", "UNREAD", "Mark Read"),
+    ("add_labels", "STARRED", "Star"),
+    ("add_labels", "TRASH", "Trash"),
+)
+
+# Labels left out of the +/- lists in filter actions
+HIDDEN_ADD_LABELS = frozenset({"STARRED", "TRASH", "IMPORTANT"})
+HIDDEN_REMOVE_LABELS = frozenset({"INBOX", "UNREAD", "SPAM", "IMPORTANT"})
+
+
+def _make_client() -> "GmailClient":
+    """Create a GmailClient; the API client stack is only imported when a command runs."""
+    from .client import GmailClient
+
+    return GmailClient()
+
+
+@cache
+def _auth_ok() -> bool:
+    """Check authentication once per process."""
+    return is_authenticated()
 
 
 def require_auth():
     """Check authentication and exit if not authenticated."""
-    if not is_authenticated():
+    if not _auth_ok():
         display_error("Not authenticated. Run 'assistant auth login' first.")
         raise typer.Exit(1)
 
@@ -35,22 +66,24 @@ def require_auth():
 def list_messages(
     limit: int = typer.Option(20, "--limit", "-n", help="Number of messages to show"),
     label: Optional[str] = typer.Option(None, "--label", "-l", help="Filter by label"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Fetch all message details from Gmail"),
 ):
     """List recent emails."""
     require_auth()
 
-    client = GmailClient()
+    client = _make_client()
     try:
         label_ids = [label] if label else None
-        messages = client.list_messages(max_results=limit, label_ids=label_ids)
+        messages = client.list_messages(
+            max_results=limit, label_ids=label_ids, use_cache=not no_cache
+        )
 
         if not messages:
             console.print("No messages found.")
             return
 
         table = format_email_list(messages)
-        console.print(table)
-        console.print(f"\n[dim]{len(messages)} messages[/dim]")
+        display_table(table, f"{len(messages)} messages")
     except RuntimeError as e:
         display_error(str(e))
         raise typer.Exit(1)
@@ -60,21 +93,21 @@ def list_messages(
 def search_messages(
     query: str = typer.Argument(..., help="Gmail search query"),
     limit: int = typer.Option(20, "--limit", "-n", help="Number of results"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Fetch all message details from Gmail"),
 ):
     """Search emails using Gmail query syntax."""
     require_auth()
 
-    client = GmailClient()
+    client = _make_client()
     try:
-        messages = client.search(query=query, max_results=limit)
+        messages = client.search(query=query, max_results=limit, use_cache=not no_cache)
 
         if not messages:
             console.print(f"No messages found for: {query}")
             return
 
         table = format_email_list(messages)
-        console.print(table)
-        console.print(f"\n[dim]{len(messages)} results for '{query}'[/dim]")
+        display_table(table, f"{len(messages)} results for '{query}'")
     except RuntimeError as e:
         display_error(str(e))
         raise typer.Exit(1)
@@ -87,7 +120,7 @@ def read_message(
     """Read a specific email."""
     require_auth()
 
-    client = GmailClient()
+    client = _make_client()
     try:
         message = client.get_message(message_id)
 
@@ -110,7 +143,7 @@ def list_labels():
     """List all Gmail labels."""
     require_auth()
 
-    client = GmailClient()
+    client = _make_client()
     try:
         labels = client.list_labels()
         table = format_labels(labels)
@@ -127,7 +160,7 @@ def create_label(
     """Create a new Gmail label."""
     require_auth()
 
-    client = GmailClient()
+    client = _make_client()
     try:
         label = client.create_label(name)
         display_success(f"Created label: {label['name']}")
@@ -148,7 +181,7 @@ def apply_label(
     """Apply a label to emails matching a search query."""
     require_auth()
 
-    client = GmailClient()
+    client = _make_client()
     try:
         # Get the label ID
         label_id = client.get_label_id(label)
@@ -156,17 +189,13 @@ def apply_label(
             display_error(f"Label not found: {label}")
             raise typer.Exit(1)
 
-        # Search for matching emails
-        messages = client.search(query, max_results=limit)
-        if not messages:
+        # Search for matching emails; only their IDs are needed
+        message_ids = client.list_message_ids(query, max_results=limit)
+        if not message_ids:
             console.print(f"No emails found matching: {query}")
             return
 
-        # Apply label to each
-        count = 0
-        for msg in messages:
-            client.modify_labels(msg["id"], add_labels=[label_id])
-            count += 1
+        count = client.batch_modify_labels(message_ids, add_labels=[label_id])
 
         display_success(f"Applied '{label}' to {count} emails.")
     except RuntimeError as e:
@@ -184,14 +213,19 @@ def list_attachments(
     """List or download attachments from an email."""
     require_auth()
 
-    client = GmailClient()
+    client = _make_client()
     try:
         message = client.get_message(message_id)
+    except RuntimeError as e:
+        display_error(str(e))
+        raise typer.Exit(1)
 
-        if not message:
-            display_error(f"Message not found: {message_id}")
-            raise typer.Exit(1)
+    if not message:
+        display_error(f"Message not found: {message_id}")
+        raise typer.Exit(1)
 
+    failures = {}
+    try:
         attachments = message.get("attachments", [])
 
         if not attachments:
@@ -199,28 +233,27 @@ def list_attachments(
             return
 
         if download:
-            download_dir = Path(download)
-            download_dir.mkdir(parents=True, exist_ok=True)
-
-            for att in attachments:
-                if att.get("id"):
-                    path = client.get_attachment(
-                        message_id=message_id,
-                        attachment_id=att["id"],
-                        filename=att["filename"],
-                        download_dir=str(download_dir),
-                    )
-                    display_success(f"Downloaded: {path}")
+            paths, failures = client.download_attachments(
+                message_id,
+                [att for att in attachments if att.get("id")],
+                download_dir=download,
+            )
+            # Reported once all downloads finish so output isn't interleaved
+            for path in paths:
+                display_success(f"Downloaded: {path}")
+            for filename, e in failures.items():
+                display_error(f"Failed to download {filename}: {e}")
         else:
             table = format_attachments(attachments)
-            console.print(table)
-            console.print(
-                f"\n[dim]Use --download DIR to download attachments[/dim]"
-            )
+            display_table(table, "Use --download DIR to download attachments")
     except RuntimeError as e:
         display_error(str(e))
         raise typer.Exit(1)
 
+    # Outside the try: typer.Exit is a RuntimeError and would be reported again
+    if failures:
+        raise typer.Exit(1)
+
 
 @app.command("compose")
 def compose_message(
@@ -241,7 +274,7 @@ def compose_message(
             display_warning("Email cancelled (empty body).")
             return
 
-    client = GmailClient()
+    client = _make_client()
     try:
         result = client.send_message(
             to=to,
@@ -269,7 +302,7 @@ def reply_to_message(
     """Reply to an email."""
     require_auth()
 
-    client = GmailClient()
+    client = _make_client()
 
     # Get original message for context
     try:
@@ -313,7 +346,7 @@ def forward_message(
         if body and body.startswith("Add a message"):
             body = ""
 
-    client = GmailClient()
+    client = _make_client()
     try:
         result = client.forward(message_id=message_id, to=to, body=body or "")
         display_success(f"Message forwarded! ID: {result['id']}")
@@ -327,7 +360,7 @@ def list_drafts():
     """List all drafts."""
     require_auth()
 
-    client = GmailClient()
+    client = _make_client()
     try:
         drafts = client.list_drafts()
 
@@ -359,7 +392,7 @@ def create_draft(
             display_warning("Draft cancelled (empty body).")
             return
 
-    client = GmailClient()
+    client = _make_client()
     try:
         result = client.create_draft(
             to=to,
@@ -380,7 +413,7 @@ def send_draft(
     """Send a draft."""
     require_auth()
 
-    client = GmailClient()
+    client = _make_client()
     try:
         result = client.send_draft(draft_id)
         display_success(f"Draft sent! Message ID: {result['id']}")
@@ -400,7 +433,7 @@ def delete_draft(
         console.print("Cancelled.")
         return
 
-    client = GmailClient()
+    client = _make_client()
     try:
         client.delete_draft(draft_id)
         display_success("Draft deleted.")
@@ -416,32 +449,45 @@ def trash_message(
     """Move message(s) to trash."""
     require_auth()
 
-    client = GmailClient()
-    count = 0
-    for message_id in message_ids:
+    client = _make_client()
+    try:
+        count = client.batch_trash(message_ids)
+    except RuntimeError:
+        # Retry per message so a bad ID doesn't block the rest
         try:
-            client.trash_message(message_id)
-            count += 1
+            failures = client.trash_each(message_ids)
         except RuntimeError as e:
+            display_error(str(e))
+            raise typer.Exit(1)
+        for message_id, e in failures.items():
             display_error(f"Failed to trash {message_id}: {e}")
+        count = len(message_ids) - len(failures)
     display_success(f"Moved {count} message(s) to trash.")
 
 
 @app.command("delete")
 def delete_message(
-    message_id: str = typer.Argument(..., help="Message ID to delete"),
+    message_ids: list[str] = typer.Argument(..., help="Message ID(s) to delete"),
 ):
-    """Permanently delete a message."""
+    """Permanently delete message(s)."""
     require_auth()
 
-    if not confirm(f"Permanently delete message {message_id}? This cannot be undone."):
+    if len(message_ids) == 1:
+        prompt = f"Permanently delete message {message_ids[0]}? This cannot be undone."
+    else:
+        prompt = f"Permanently delete {len(message_ids)} messages? This cannot be undone."
+    if not confirm(prompt):
         console.print("Cancelled.")
         return
 
-    client = GmailClient()
+    client = _make_client()
     try:
-        client.delete_message(message_id)
-        display_success("Message permanently deleted.")
+        if len(message_ids) == 1:
+            client.delete_message(message_ids[0])
+            display_success("Message permanently deleted.")
+        else:
+            count = client.batch_delete(message_ids)
+            display_success(f"Permanently deleted {count} messages.")
     except RuntimeError as e:
         display_error(str(e))
         raise typer.Exit(1)
@@ -459,17 +505,14 @@ def mark_read(
         display_error("Provide a message ID or use --all-unread.")
         raise typer.Exit(1)
 
-    client = GmailClient()
+    client = _make_client()
     try:
         if all_unread:
-            messages = client.search("is:unread", max_results=500)
-            if not messages:
+            message_ids = client.list_message_ids("is:unread", max_results=500)
+            if not message_ids:
                 console.print("No unread messages found.")
                 return
-            count = 0
-            for msg in messages:
-                client.mark_as_read(msg["id"])
-                count += 1
+            count = client.batch_mark_read(message_ids)
             display_success(f"Marked {count} messages as read.")
         else:
             client.mark_as_read(message_id)
@@ -486,7 +529,7 @@ def mark_unread(
     """Mark a message as unread."""
     require_auth()
 
-    client = GmailClient()
+    client = _make_client()
     try:
         client.mark_as_unread(message_id)
         display_success("Message marked as unread.")
@@ -508,15 +551,32 @@ def modify_labels(
         display_error("Specify --add or --remove labels.")
         raise typer.Exit(1)
 
-    client = GmailClient()
+    client = _make_client()
     try:
-        client.modify_labels(message_id, add_labels=add, remove_labels=remove)
+        # Resolve every name from one cached label map before the single modify call
+        add_ids = client.resolve_label_ids(add)
+        remove_ids = client.resolve_label_ids(remove)
+        client.modify_labels(message_id, add_labels=add_ids, remove_labels=remove_ids)
         display_success("Labels updated.")
+    except ValueError as e:
+        display_error(str(e))
+        raise typer.Exit(1)
     except RuntimeError as e:
         display_error(str(e))
         raise typer.Exit(1)
 
 
+def _archive_ids(client: "GmailClient", message_ids: list[str]) -> int:
+    """Archive messages in bulk, retrying per message if the bulk call fails."""
+    try:
+        return client.batch_archive(message_ids)
+    except RuntimeError:
+        failures = client.archive_each(message_ids)
+        for message_id, e in failures.items():
+            display_error(f"Failed to archive {message_id}: {e}")
+        return len(message_ids) - len(failures)
+
+
 @app.command("archive")
 def archive_message(
     message_ids: list[str] | None = typer.Argument(
@@ -533,23 +593,20 @@ def archive_message(
         display_error("Provide message ID(s) or use --all-inbox.")
         raise typer.Exit(1)
 
-    client = GmailClient()
+    client = _make_client()
     try:
         if all_inbox:
-            messages = client.list_messages(max_results=500, label_ids=["INBOX"])
-            if not messages:
+            inbox_ids = client.list_message_ids(max_results=500, label_ids=["INBOX"])
+            if not inbox_ids:
                 console.print("No messages in inbox.")
                 return
-            count = 0
-            for msg in messages:
-                client.archive(msg["id"])
-                count += 1
+            count = _archive_ids(client, inbox_ids)
             display_success(f"Archived {count} messages.")
+        elif len(message_ids) == 1:
+            client.archive(message_ids[0])
+            display_success("Archived 1 message(s).")
         else:
-            count = 0
-            for message_id in message_ids:
-                client.archive(message_id)
-                count += 1
+            count = _archive_ids(client, message_ids)
             display_success(f"Archived {count} message(s).")
     except RuntimeError as e:
         display_error(str(e))
@@ -567,7 +624,7 @@ def clear_inbox(
     """
     require_auth()
 
-    client = GmailClient()
+    client = _make_client()
     try:
         # Get all inbox messages
         messages = client.list_messages(max_results=500, label_ids=["INBOX"])
@@ -601,10 +658,9 @@ def clear_inbox(
                 console.print("Cancelled.")
                 return
 
-        for msg in to_archive:
-            client.archive(msg["id"])
+        count = _archive_ids(client, [msg["id"] for msg in to_archive])
 
-        display_success(f"Archived {len(to_archive)} messages. Skipped {skipped_unread} unread, {skipped_starred} starred.")
+        display_success(f"Archived {count} messages. Skipped {skipped_unread} unread, {skipped_starred} starred.")
     except RuntimeError as e:
         display_error(str(e))
         raise typer.Exit(1)
@@ -615,7 +671,7 @@ def list_filters():
     """List all Gmail filters."""
     require_auth()
 
-    client = GmailClient()
+    client = _make_client()
     try:
         filters = client.list_filters()
 
@@ -629,44 +685,29 @@ def list_filters():
         table.add_column("Criteria", width=35)
         table.add_column("Actions", width=35)
 
+        add_row = table.add_row
         for f in filters:
-            # Build criteria string
-            criteria_parts = []
-            if f["from"]:
-                criteria_parts.append(f"from:{f['from']}")
-            if f["to"]:
-                criteria_parts.append(f"to:{f['to']}")
-            if f["subject"]:
-                criteria_parts.append(f"subject:{f['subject']}")
-            if f["query"]:
-                criteria_parts.append(f["query"])
-            criteria_str = " ".join(criteria_parts) or "(none)"
-
-            # Build actions string
-            action_parts = []
-            if "INBOX" in f["remove_labels"]:
-                action_parts.append("Skip Inbox")
-            if "UNREAD" in f["remove_labels"]:
-                action_parts.append("Mark Read")
-            if "STARRED" in f["add_labels"]:
-                action_parts.append("Star")
-            if "TRASH" in f["add_labels"]:
-                action_parts.append("Trash")
+            criteria_str = " ".join(
+                f"{prefix}{f[key]}" for key, prefix in FILTER_CRITERIA if f[key]
+            ) or "(none)"
+
+            action_parts = [
+                display for key, label, display in FILTER_ACTIONS if label in f[key]
+            ]
             if f["forward"]:
                 action_parts.append(f"Forward to {f['forward']}")
             # Show other labels
-            other_add = [l for l in f["add_labels"] if l not in ["STARRED", "TRASH", "IMPORTANT"]]
-            other_remove = [l for l in f["remove_labels"] if l not in ["INBOX", "UNREAD", "SPAM", "IMPORTANT"]]
+            other_add = [l for l in f["add_labels"] if l not in HIDDEN_ADD_LABELS]
+            other_remove = [l for l in f["remove_labels"] if l not in HIDDEN_REMOVE_LABELS]
             if other_add:
                 action_parts.append(f"+{','.join(other_add)}")
             if other_remove:
                 action_parts.append(f"-{','.join(other_remove)}")
             action_str = ", ".join(action_parts) or "(none)"
 
-            table.add_row(f["id"], criteria_str, action_str)
+            add_row(f["id"], criteria_str, action_str)
 
-        console.print(table)
-        console.print(f"\n[dim]{len(filters)} filters[/dim]")
+        display_table(table, f"{len(filters)} filters")
     except RuntimeError as e:
         display_error(str(e))
         raise typer.Exit(1)
@@ -704,7 +745,7 @@ def create_filter(
         display_error("Specify at least one action: --archive, --mark-read, --star, --trash, --add-label, --remove-label, --forward, or --category")
         raise typer.Exit(1)
 
-    client = GmailClient()
+    client = _make_client()
     try:
         result = client.create_filter(
             from_addr=from_addr,
@@ -754,7 +795,7 @@ def delete_filter(
         console.print("Cancelled.")
         return
 
-    client = GmailClient()
+    client = _make_client()
     try:
         client.delete_filter(filter_id)
         display_success("Filter deleted.")
@@ -1,5 +1,17 @@
 """Sheets module for Assistant CLI."""
 
-from .client import SheetsClient
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import SheetsClient
 
 __all__ = ["SheetsClient"]
+
+
+def __getattr__(name: str):
+    # Import the client on first access so loading sheets.commands stays cheap
+    if name == "SheetsClient":
+        from .client import SheetsClient
+
+        return SheetsClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,41 +1,248 @@
 """Google Sheets API client wrapper."""
 
-from typing import Any, Optional
-
-from googleapiclient.discovery import build
+import json
+import random
+import re
+import time
+from typing import Any, Iterable, Iterator, Optional
+from urllib.parse import quote
+
+import requests
+from google.auth.transport.requests import AuthorizedSession
 from googleapiclient.errors import HttpError
 
-from ..auth import get_credentials
+from ..auth import clear_cache, get_active_account, get_credentials, read_cache, write_cache
+from ..utils.api import build_service
+
+# Largest page Drive returns for files.list
+MAX_PAGE_SIZE = 1000
+
+# Partial-response masks: only the fields each call's result is read for
+SPREADSHEET_FIELDS = (
+    "spreadsheetId,properties(title,locale,timeZone),spreadsheetUrl,"
+    "sheets/properties(sheetId,title,index,gridProperties(rowCount,columnCount))"
+)
+SHEET_INDEX_FIELDS = "sheets/properties(sheetId,title)"
+VALUES_FIELDS = "values"
+BATCH_VALUES_FIELDS = "valueRanges(range,values)"
+UPDATE_FIELDS = "updatedRange,updatedRows,updatedColumns,updatedCells"
+BATCH_UPDATE_FIELDS = "totalUpdatedRows,totalUpdatedColumns,totalUpdatedCells,responses/updatedRange"
+APPEND_FIELDS = f"updates({UPDATE_FIELDS})"
+CLEAR_FIELDS = "clearedRange"
+CREATED_SPREADSHEET_FIELDS = "spreadsheetId,properties/title,spreadsheetUrl"
+ADD_SHEET_FIELDS = "replies/addSheet/properties(sheetId,title,index)"
+
+# Responses retried with backoff, and the most attempts made per request
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_ATTEMPTS = 5
+
+# Longest wait in seconds between attempts
+MAX_RETRY_DELAY = 32
+
+# Grid size Sheets gives a new sheet, grown when initial data needs more
+DEFAULT_SHEET_ROWS = 1000
+DEFAULT_SHEET_COLUMNS = 26
+
+# Cell part of a range after its "Sheet!" prefix, in A1 or R1C1 notation
+_A1_SIDE = r"(?:[A-Z]{1,3}\d*|\d+)"
+_A1_CELLS = re.compile(rf"{_A1_SIDE}(?::{_A1_SIDE})?|R\d*C\d*(?::R\d*C\d*)?", re.IGNORECASE)
+
+# Start cell of a range's cell part: column letters and row number, each optional
+_A1_START = re.compile(r"([A-Z]*)(\d*)", re.IGNORECASE)
+
+# Start cell in R1C1 notation; a row number is required, since "RC5" is
+# also the A1 cell in column RC
+_R1C1_START = re.compile(r"R(\d+)C(\d*)(?::|$)", re.IGNORECASE)
+
+# Most cells write_range sends in one request
+WRITE_TILE_CELLS = 10_000
+
+# values.get endpoint, requested directly when streaming a range's rows
+VALUES_URL = "https://sheets.googleapis.com/v4/spreadsheets/{spreadsheet_id}/values/{range_name}"
+
+# Start of the rows array in a values.get JSON response
+_VALUES_FIELD = re.compile(r'"values"\s*:\s*\[')
+
+# Response text read per step when streaming rows
+STREAM_CHUNK_SIZE = 256 * 1024
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Most read results kept in one spreadsheet's cache; the oldest are dropped first
+READ_CACHE_MAX_ENTRIES = 64
+
+
+def _check_range(range_name: str) -> None:
+    """
+    Reject a range that is certainly malformed before it costs a request.
+
+    Only ranges with a sheet prefix are checked: without one the text may
+    be a sheet or named range, which only the API can resolve.
+    """
+    sheet, sep, cells = range_name.rpartition("!")
+    if not sep:
+        valid = bool(cells.strip())
+    elif sheet.startswith("'"):
+        valid = len(sheet) > 1 and sheet.endswith("'") and bool(_A1_CELLS.fullmatch(cells))
+    else:
+        valid = bool(sheet) and bool(_A1_CELLS.fullmatch(cells))
+    if not valid:
+        raise ValueError(f"Invalid range: {range_name}")
+
+
+def _row_tiles(values: list[list[Any]]) -> Iterator[tuple[int, list[list[Any]]]]:
+    """
+    Split a grid into consecutive blocks of rows of at most WRITE_TILE_CELLS cells.
+
+    Yields (row offset, rows) pairs; an empty grid is one empty block, and a
+    row wider than the limit is a block of its own.
+    """
+    start = 0
+    cells = 0
+    for index, row in enumerate(values):
+        if cells and cells + len(row) > WRITE_TILE_CELLS:
+            yield start, values[start:index]
+            start, cells = index, 0
+        cells += len(row)
+    yield start, values[start:]
+
+
+def _iter_value_rows(chunks: Iterable[str]) -> Iterator[list[Any]]:
+    """
+    Yield the rows of a values.get response as chunks of its JSON text arrive.
+
+    Each row is decoded once it is complete, so the whole response is never
+    held in memory. A response without a values array (an empty range)
+    yields nothing.
+    """
+    chunks = iter(chunks)
+    buf = ""
+    for chunk in chunks:
+        buf += chunk
+        match = _VALUES_FIELD.search(buf)
+        if match:
+            break
+    else:
+        return
+
+    pos = match.end()
+    while True:
+        while pos < len(buf) and buf[pos] in " \t\r\n,":
+            pos += 1
+        if pos < len(buf):
+            if buf[pos] == "]":
+                return
+            try:
+                row, pos = _JSON_DECODER.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                pass  # the row continues in the next chunk
+            else:
+                yield row
+                continue
+        chunk = next(chunks, None)
+        if chunk is None:
+            raise RuntimeError("Sheets API error: values response was truncated")
+        buf = buf[pos:] + chunk
+        pos = 0
 
 
 class SheetsClient:
     """Wrapper class for Google Sheets API operations."""
 
-    def __init__(self):
-        """Initialize the Sheets client."""
+    def __init__(self, cache_ttl: float = 0):
+        """
+        Initialize the Sheets client.
+
+        Args:
+            cache_ttl: Seconds that read_range and get_spreadsheet results may
+                be reused from the account's on-disk cache (0 disables reuse)
+        """
         self._sheets_service = None
         self._drive_service = None
+        self._cache_ttl = cache_ttl
+        self._spreadsheets: dict[str, dict] = {}
+        self._sheet_ids: dict[str, dict[str, int]] = {}
 
     @property
     def sheets_service(self):
         """Get or create the Sheets API service."""
         if self._sheets_service is None:
-            creds = get_credentials()
-            if creds is None:
-                raise RuntimeError("Not authenticated. Run 'assistant auth login' first.")
-            self._sheets_service = build("sheets", "v4", credentials=creds)
+            self._sheets_service = build_service("sheets", "v4", get_active_account())
         return self._sheets_service
 
     @property
     def drive_service(self):
         """Get or create the Drive API service (for listing spreadsheets)."""
         if self._drive_service is None:
-            creds = get_credentials()
-            if creds is None:
-                raise RuntimeError("Not authenticated. Run 'assistant auth login' first.")
-            self._drive_service = build("drive", "v3", credentials=creds)
+            self._drive_service = build_service("drive", "v3", get_active_account())
         return self._drive_service
 
+    def _execute(self, request, idempotent: bool = True) -> dict:
+        """
+        Execute an API request, retrying rate-limit and server errors.
+
+        Waits follow a Retry-After header when the server sends one, otherwise
+        exponential backoff with jitter.
+
+        Args:
+            request: The HttpRequest to execute
+            idempotent: False when repeating the request could apply it twice;
+                only 429 responses, which are never applied, are retried then
+
+        Returns:
+            The response
+        """
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                return request.execute()
+            except HttpError as e:
+                status = e.resp.status
+                retryable = status == 429 or (idempotent and status in RETRY_STATUSES)
+                if not retryable or attempt == MAX_ATTEMPTS - 1:
+                    raise
+                try:
+                    delay = float(e.resp.get("retry-after", ""))
+                except ValueError:
+                    delay = 2**attempt + random.random()
+                time.sleep(min(delay, MAX_RETRY_DELAY))
+
+    def _cached_read(self, spreadsheet_id: str, key: str) -> Optional[Any]:
+        """Return a cached read result younger than cache_ttl, or None."""
+        if not self._cache_ttl:
+            return None
+        account = get_active_account()
+        if not account:
+            return None
+        entries = read_cache(f"sheets_{spreadsheet_id}", account, self._cache_ttl) or {}
+        entry = entries.get(key)
+        if entry is None or time.time() - entry[0] > self._cache_ttl:
+            return None
+        return entry[1]
+
+    def _store_read(self, spreadsheet_id: str, key: str, value: Any) -> None:
+        """Cache a read result, dropping expired and excess entries."""
+        if not self._cache_ttl:
+            return
+        account = get_active_account()
+        if not account:
+            return
+        name = f"sheets_{spreadsheet_id}"
+        now = time.time()
+        entries = read_cache(name, account, self._cache_ttl) or {}
+        entries = {k: e for k, e in entries.items() if now - e[0] <= self._cache_ttl}
+        entries.pop(key, None)
+        entries[key] = [now, value]
+        # Entries are kept oldest first, so the excess is at the front
+        write_cache(name, account, dict(list(entries.items())[-READ_CACHE_MAX_ENTRIES:]))
+
+    def _invalidate_reads(self, spreadsheet_id: str) -> None:
+        """Drop cached reads for a spreadsheet after it has been changed."""
+        self._spreadsheets.pop(spreadsheet_id, None)
+        self._sheet_ids.pop(spreadsheet_id, None)
+        account = get_active_account()
+        if account:
+            clear_cache(f"sheets_{spreadsheet_id}", account)
+
     def list_spreadsheets(self, max_results: int = 20, query: Optional[str] = None) -> list[dict]:
         """
         List spreadsheets the user has access to.
@@ -47,57 +254,90 @@ class SheetsClient:
         Returns:
             List of spreadsheet dictionaries with id, name, modifiedTime, webViewLink
         """
-        try:
-            q_parts = ["mimeType='application/vnd.google-apps.spreadsheet'"]
-            if query:
-                q_parts.append(f"name contains '{query}'")
-            q = " and ".join(q_parts)
-
-            response = (
-                self.drive_service.files()
-                .list(
-                    q=q,
-                    pageSize=max_results,
-                    fields="files(id, name, modifiedTime, webViewLink, owners)",
-                    orderBy="modifiedTime desc",
-                    supportsAllDrives=True,
-                    includeItemsFromAllDrives=True,
+        return [
+            sheet for page in self.iter_spreadsheets(max_results, query) for sheet in page
+        ]
+
+    def iter_spreadsheets(
+        self, max_results: int = 20, query: Optional[str] = None
+    ) -> Iterator[list[dict]]:
+        """
+        Yield spreadsheets page by page, as they arrive from the API.
+
+        Takes the same arguments as list_spreadsheets; each yielded list holds
+        one API page of spreadsheet dictionaries.
+        """
+        q_parts = ["mimeType='application/vnd.google-apps.spreadsheet'"]
+        if query:
+            q_parts.append(f"name contains '{query}'")
+        q = " and ".join(q_parts)
+
+        # Drive caps pageSize, so page through results until max_results is reached
+        remaining = max_results
+        page_token = None
+        while remaining > 0:
+            try:
+                response = self._execute(
+                    self.drive_service.files()
+                    .list(
+                        q=q,
+                        pageSize=min(MAX_PAGE_SIZE, remaining),
+                        pageToken=page_token,
+                        fields="nextPageToken, files(id, name, modifiedTime, webViewLink, owners)",
+                        orderBy="modifiedTime desc",
+                        supportsAllDrives=True,
+                        includeItemsFromAllDrives=True,
+                    )
                 )
-                .execute()
-            )
+            except HttpError as e:
+                raise RuntimeError(f"Drive API error: {e}")
 
-            files = response.get("files", [])
-            result = []
-            for f in files:
+            page = []
+            for f in response.get("files", [])[:remaining]:
                 owners = f.get("owners", [])
                 owner_email = owners[0].get("emailAddress", "") if owners else ""
-                result.append({
+                page.append({
                     "id": f["id"],
                     "name": f.get("name", ""),
                     "modified_time": f.get("modifiedTime", ""),
                     "web_view_link": f.get("webViewLink", ""),
                     "owner": owner_email,
                 })
+            if page:
+                remaining -= len(page)
+                yield page
 
-            return result
-        except HttpError as e:
-            raise RuntimeError(f"Drive API error: {e}")
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                break
 
     def get_spreadsheet(self, spreadsheet_id: str) -> dict:
         """
         Get spreadsheet metadata.
 
+        Only the fields in SPREADSHEET_FIELDS are requested; cell data and
+        formatting are left out of the response. The result is kept for this
+        client's later calls until the spreadsheet is changed through it, and a
+        result cached within cache_ttl is returned without a request.
+
         Args:
             spreadsheet_id: The spreadsheet ID
 
         Returns:
             Spreadsheet dictionary with metadata and sheet info
         """
+        if spreadsheet_id in self._spreadsheets:
+            return self._spreadsheets[spreadsheet_id]
+
+        cached = self._cached_read(spreadsheet_id, "metadata")
+        if cached is not None:
+            self._spreadsheets[spreadsheet_id] = cached
+            return cached
+
         try:
-            spreadsheet = (
+            spreadsheet = self._execute(
                 self.sheets_service.spreadsheets()
-                .get(spreadsheetId=spreadsheet_id)
-                .execute()
+                .get(spreadsheetId=spreadsheet_id, fields=SPREADSHEET_FIELDS)
             )
 
             sheets = []
@@ -111,7 +351,7 @@ class SheetsClient:
                     "column_count": props.get("gridProperties", {}).get("columnCount", 0),
                 })
 
-            return {
+            result = {
                 "id": spreadsheet.get("spreadsheetId"),
                 "title": spreadsheet.get("properties", {}).get("title", ""),
                 "locale": spreadsheet.get("properties", {}).get("locale", ""),
@@ -119,6 +359,9 @@ class SheetsClient:
                 "web_view_link": spreadsheet.get("spreadsheetUrl", ""),
                 "sheets": sheets,
             }
+            self._spreadsheets[spreadsheet_id] = result
+            self._store_read(spreadsheet_id, "metadata", result)
+            return result
         except HttpError as e:
             if e.resp.status == 404:
                 raise ValueError(f"Spreadsheet not found: {spreadsheet_id}")
@@ -133,6 +376,8 @@ class SheetsClient:
         """
         Read cell values from a range.
 
+        A result cached within cache_ttl is returned without a request.
+
         Args:
             spreadsheet_id: The spreadsheet ID
             range_name: A1 notation range (e.g., "Sheet1!A1:C10" or "A1:C10")
@@ -141,19 +386,121 @@ class SheetsClient:
         Returns:
             2D list of cell values
         """
+        _check_range(range_name)
+        cache_key = f"values:{value_render_option}:{range_name}"
+        cached = self._cached_read(spreadsheet_id, cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            result = (
+            result = self._execute(
                 self.sheets_service.spreadsheets()
                 .values()
                 .get(
                     spreadsheetId=spreadsheet_id,
                     range=range_name,
                     valueRenderOption=value_render_option,
+                    fields=VALUES_FIELDS,
                 )
-                .execute()
             )
 
-            return result.get("values", [])
+            values = result.get("values", [])
+            self._store_read(spreadsheet_id, cache_key, values)
+            return values
+        except HttpError as e:
+            if e.resp.status == 404:
+                raise ValueError(f"Spreadsheet not found: {spreadsheet_id}")
+            raise RuntimeError(f"Sheets API error: {e}")
+
+    def read_range_iter(
+        self,
+        spreadsheet_id: str,
+        range_name: str,
+        value_render_option: str = "FORMATTED_VALUE",
+    ) -> Iterator[list[Any]]:
+        """
+        Yield a range's rows while the response is still arriving.
+
+        An opt-in alternative to read_range for very large ranges: the JSON is
+        read in chunks and each row is decoded as soon as it is complete.
+        Results are neither cached nor retried.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID
+            range_name: A1 notation range (e.g., "Sheet1!A1:C10" or "A1:C10")
+            value_render_option: How values should be rendered (FORMATTED_VALUE, UNFORMATTED_VALUE, FORMULA)
+
+        Yields:
+            Lists of cell values, one per row
+        """
+        _check_range(range_name)
+        creds = get_credentials()
+        if creds is None:
+            raise RuntimeError("Not authenticated. Run 'assistant auth login' first.")
+
+        url = VALUES_URL.format(
+            spreadsheet_id=quote(spreadsheet_id, safe=""), range_name=quote(range_name, safe="")
+        )
+        params = {"valueRenderOption": value_render_option, "fields": VALUES_FIELDS}
+        try:
+            with AuthorizedSession(creds) as session, session.get(
+                url, params=params, stream=True
+            ) as response:
+                if response.status_code == 404:
+                    raise ValueError(f"Spreadsheet not found: {spreadsheet_id}")
+                response.raise_for_status()
+                response.encoding = "utf-8"
+                yield from _iter_value_rows(
+                    response.iter_content(STREAM_CHUNK_SIZE, decode_unicode=True)
+                )
+        except requests.RequestException as e:
+            raise RuntimeError(f"Sheets API error: {e}")
+
+    def batch_read_ranges(
+        self,
+        spreadsheet_id: str,
+        ranges: list[str],
+        value_render_option: str = "FORMATTED_VALUE",
+    ) -> list[dict]:
+        """
+        Read cell values from several ranges in one request.
+
+        A result cached within cache_ttl for the same ranges is returned
+        without a request.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID
+            ranges: A1 notation ranges (e.g., ["Sheet1!A1:C10", "Sheet2!A:A"])
+            value_render_option: How values should be rendered (FORMATTED_VALUE, UNFORMATTED_VALUE, FORMULA)
+
+        Returns:
+            List of dictionaries with range and values, in the order requested
+        """
+        for range_name in ranges:
+            _check_range(range_name)
+        cache_key = f"batch:{value_render_option}:{'|'.join(ranges)}"
+        cached = self._cached_read(spreadsheet_id, cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            result = self._execute(
+                self.sheets_service.spreadsheets()
+                .values()
+                .batchGet(
+                    spreadsheetId=spreadsheet_id,
+                    ranges=ranges,
+                    valueRenderOption=value_render_option,
+                    fields=BATCH_VALUES_FIELDS,
+                )
+            )
+
+            value_ranges = [
+                {"range": value_range.get("range", ""), "values": value_range.get("values", [])}
+                for value_range in result.get("valueRanges", [])
+            ]
+            self._store_read(spreadsheet_id, cache_key, value_ranges)
+            return value_ranges
         except HttpError as e:
             if e.resp.status == 404:
                 raise ValueError(f"Spreadsheet not found: {spreadsheet_id}")
@@ -169,6 +516,10 @@ class SheetsClient:
         """
         Write values to a range.
 
+        Grids of more than WRITE_TILE_CELLS cells are sent as consecutive
+        blocks of rows, one request each, to stay within the API's request
+        size and execution time limits.
+
         Args:
             spreadsheet_id: The spreadsheet ID
             range_name: A1 notation range (e.g., "Sheet1!A1:C10")
@@ -178,25 +529,76 @@ class SheetsClient:
         Returns:
             Update result with updated range and cell counts
         """
+        _check_range(range_name)
+        self._invalidate_reads(spreadsheet_id)
         try:
-            body = {"values": values}
-            result = (
+            results = []
+            for row_offset, rows in _row_tiles(values):
+                target = self.rows_below(range_name, row_offset) if row_offset else range_name
+                results.append(self._execute(
+                    self.sheets_service.spreadsheets()
+                    .values()
+                    .update(
+                        spreadsheetId=spreadsheet_id,
+                        range=target,
+                        valueInputOption=value_input_option,
+                        body={"values": rows},
+                        fields=UPDATE_FIELDS,
+                    )
+                ))
+
+            updated_range = results[0].get("updatedRange", "")
+            if len(results) > 1:
+                # Span from the first block's start cell to the last block's end cell
+                last = results[-1].get("updatedRange", "")
+                updated_range = f"{updated_range.split(':')[0]}:{last.rpartition('!')[2].split(':')[-1]}"
+            return {
+                "updated_range": updated_range,
+                "updated_rows": sum(r.get("updatedRows", 0) for r in results),
+                "updated_columns": max(r.get("updatedColumns", 0) for r in results),
+                "updated_cells": sum(r.get("updatedCells", 0) for r in results),
+            }
+        except HttpError as e:
+            if e.resp.status == 404:
+                raise ValueError(f"Spreadsheet not found: {spreadsheet_id}")
+            raise RuntimeError(f"Sheets API error: {e}")
+
+    def batch_write_ranges(
+        self,
+        spreadsheet_id: str,
+        data: list[dict],
+        value_input_option: str = "USER_ENTERED",
+    ) -> dict:
+        """
+        Write values to several ranges in one request.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID
+            data: List of dictionaries with range (A1 notation) and values (2D list)
+            value_input_option: How input should be interpreted (RAW, USER_ENTERED)
+
+        Returns:
+            Update result with updated ranges and total cell counts
+        """
+        for d in data:
+            _check_range(d["range"])
+        self._invalidate_reads(spreadsheet_id)
+        try:
+            body = {
+                "valueInputOption": value_input_option,
+                "data": [{"range": d["range"], "values": d["values"]} for d in data],
+            }
+            result = self._execute(
                 self.sheets_service.spreadsheets()
                 .values()
-                .update(
-                    spreadsheetId=spreadsheet_id,
-                    range=range_name,
-                    valueInputOption=value_input_option,
-                    body=body,
-                )
-                .execute()
+                .batchUpdate(spreadsheetId=spreadsheet_id, body=body, fields=BATCH_UPDATE_FIELDS)
             )
 
             return {
-                "updated_range": result.get("updatedRange", ""),
-                "updated_rows": result.get("updatedRows", 0),
-                "updated_columns": result.get("updatedColumns", 0),
-                "updated_cells": result.get("updatedCells", 0),
+                "updated_ranges": [r.get("updatedRange", "") for r in result.get("responses", [])],
+                "updated_rows": result.get("totalUpdatedRows", 0),
+                "updated_columns": result.get("totalUpdatedColumns", 0),
+                "updated_cells": result.get("totalUpdatedCells", 0),
             }
         except HttpError as e:
             if e.resp.status == 404:
@@ -222,9 +624,11 @@ class SheetsClient:
         Returns:
             Append result with updated range info
         """
+        _check_range(range_name)
+        self._invalidate_reads(spreadsheet_id)
         try:
             body = {"values": values}
-            result = (
+            result = self._execute(
                 self.sheets_service.spreadsheets()
                 .values()
                 .append(
@@ -233,8 +637,9 @@ class SheetsClient:
                     valueInputOption=value_input_option,
                     insertDataOption="INSERT_ROWS",
                     body=body,
-                )
-                .execute()
+                    fields=APPEND_FIELDS,
+                ),
+                idempotent=False,
             )
 
             updates = result.get("updates", {})
@@ -260,12 +665,13 @@ class SheetsClient:
         Returns:
             Result with cleared range
         """
+        _check_range(range_name)
+        self._invalidate_reads(spreadsheet_id)
         try:
-            result = (
+            result = self._execute(
                 self.sheets_service.spreadsheets()
                 .values()
-                .clear(spreadsheetId=spreadsheet_id, range=range_name, body={})
-                .execute()
+                .clear(spreadsheetId=spreadsheet_id, range=range_name, body={}, fields=CLEAR_FIELDS)
             )
 
             return {"cleared_range": result.get("clearedRange", "")}
@@ -285,10 +691,11 @@ class SheetsClient:
             Created spreadsheet info with id and url
         """
         try:
-            spreadsheet = (
+            spreadsheet = self._execute(
                 self.sheets_service.spreadsheets()
-                .create(body={"properties": {"title": title}})
-                .execute()
+                .create(body={"properties": {"title": title}}, fields=CREATED_SPREADSHEET_FIELDS),
+                # A repeated create would leave a second spreadsheet behind
+                idempotent=False,
             )
 
             return {
@@ -312,40 +719,207 @@ class SheetsClient:
         spreadsheet = self.get_spreadsheet(spreadsheet_id)
         return spreadsheet.get("sheets", [])
 
-    def add_sheet(self, spreadsheet_id: str, title: str) -> dict:
+    def get_sheet_id(self, spreadsheet_id: str, title: str) -> Optional[int]:
         """
-        Add a new sheet to a spreadsheet.
+        Get a sheet ID by its title.
+
+        The spreadsheet's title-to-ID map is fetched once per client, asking
+        for only sheet IDs and titles (or taken from an already loaded
+        get_spreadsheet result), and dropped when the client changes the
+        spreadsheet.
 
         Args:
             spreadsheet_id: The spreadsheet ID
-            title: The title for the new sheet
+            title: The sheet title
 
         Returns:
-            Created sheet info
+            Sheet ID if found, None otherwise
         """
-        try:
-            request = {
-                "requests": [{"addSheet": {"properties": {"title": title}}}]
-            }
-            response = (
-                self.sheets_service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body=request)
-                .execute()
-            )
+        sheet_ids = self._sheet_ids.get(spreadsheet_id)
+        if sheet_ids is None:
+            if spreadsheet_id in self._spreadsheets:
+                sheets = self._spreadsheets[spreadsheet_id]["sheets"]
+                sheet_ids = {sheet["title"]: sheet["sheet_id"] for sheet in sheets}
+            else:
+                try:
+                    response = self._execute(
+                        self.sheets_service.spreadsheets()
+                        .get(spreadsheetId=spreadsheet_id, fields=SHEET_INDEX_FIELDS)
+                    )
+                except HttpError as e:
+                    if e.resp.status == 404:
+                        raise ValueError(f"Spreadsheet not found: {spreadsheet_id}")
+                    raise RuntimeError(f"Sheets API error: {e}")
+                sheet_ids = {
+                    props.get("title", ""): props.get("sheetId")
+                    for props in (sheet.get("properties", {}) for sheet in response.get("sheets", []))
+                }
+            self._sheet_ids[spreadsheet_id] = sheet_ids
+        return sheet_ids.get(title)
+
+    def resolve_sheet_ids(self, spreadsheet_id: str, sheets: list[str]) -> list[int]:
+        """
+        Resolve sheet titles to sheet IDs.
 
-            reply = response.get("replies", [{}])[0]
-            props = reply.get("addSheet", {}).get("properties", {})
+        Numeric values are taken as sheet IDs and used as-is, without a request.
 
-            return {
-                "sheet_id": props.get("sheetId"),
-                "title": props.get("title", ""),
-                "index": props.get("index", 0),
+        Args:
+            spreadsheet_id: The spreadsheet ID
+            sheets: Sheet IDs or titles
+
+        Returns:
+            Sheet IDs, in the same order
+
+        Raises:
+            ValueError: If a title matches no sheet
+        """
+        sheet_ids = []
+        for sheet in sheets:
+            if sheet.isdigit():
+                sheet_ids.append(int(sheet))
+                continue
+            sheet_id = self.get_sheet_id(spreadsheet_id, sheet)
+            if sheet_id is None:
+                raise ValueError(f"Sheet not found: {sheet}")
+            sheet_ids.append(sheet_id)
+        return sheet_ids
+
+    @staticmethod
+    def rows_below(range_name: str, rows: int) -> str:
+        """
+        Return the start cell the given number of rows below a range's start.
+
+        For example rows_below("Sheet1!B2:D9", 10) is "Sheet1!B12", and
+        rows_below("Sheet1!R2C3:R9C5", 10) is "Sheet1!R12C3". A bare sheet
+        name starts at A1.
+        """
+        sheet, sep, cells = range_name.rpartition("!")
+        if not sep and not _A1_CELLS.fullmatch(cells):
+            sheet, sep, cells = range_name, "!", ""
+        r1c1 = _R1C1_START.match(cells)
+        if r1c1:
+            row, column = r1c1.groups()
+            return f"{sheet}{sep}R{int(row) + rows}C{column or 1}"
+        column, row = _A1_START.match(cells).groups()
+        return f"{sheet}{sep}{column or 'A'}{int(row or 1) + rows}"
+
+    @staticmethod
+    def add_sheet_request(
+        title: str,
+        sheet_id: Optional[int] = None,
+        row_count: Optional[int] = None,
+        column_count: Optional[int] = None,
+    ) -> dict:
+        """
+        Build the batch_update request that adds a sheet.
+
+        Giving the sheet ID lets later requests in the same batch refer to it.
+        """
+        props: dict[str, Any] = {"title": title}
+        if sheet_id is not None:
+            props["sheetId"] = sheet_id
+        if row_count is not None or column_count is not None:
+            props["gridProperties"] = {
+                "rowCount": row_count or DEFAULT_SHEET_ROWS,
+                "columnCount": column_count or DEFAULT_SHEET_COLUMNS,
             }
+        return {"addSheet": {"properties": props}}
+
+    @staticmethod
+    def delete_sheet_request(sheet_id: int) -> dict:
+        """Build the batch_update request that deletes a sheet."""
+        return {"deleteSheet": {"sheetId": sheet_id}}
+
+    @staticmethod
+    def rename_sheet_request(sheet_id: int, title: str) -> dict:
+        """Build the batch_update request that renames a sheet."""
+        return {
+            "updateSheetProperties": {
+                "properties": {"sheetId": sheet_id, "title": title},
+                "fields": "title",
+            }
+        }
+
+    def batch_update(
+        self, spreadsheet_id: str, requests: list[dict], fields: str = "replies"
+    ) -> list[dict]:
+        """
+        Apply several spreadsheet changes in one request.
+
+        The changes are applied atomically, in order: if one fails, none are
+        applied. Requests can be built with add_sheet_request,
+        delete_sheet_request and rename_sheet_request.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID
+            requests: Request objects for spreadsheets.batchUpdate
+            fields: Partial-response mask for the batchUpdate response
+
+        Returns:
+            One reply per request, in order
+        """
+        self._invalidate_reads(spreadsheet_id)
+        try:
+            response = self._execute(
+                self.sheets_service.spreadsheets()
+                .batchUpdate(
+                    spreadsheetId=spreadsheet_id, body={"requests": requests}, fields=fields
+                ),
+                # Repeating an applied addSheet/deleteSheet fails with a 400
+                idempotent=False,
+            )
+            return response.get("replies", [])
         except HttpError as e:
             if e.resp.status == 404:
                 raise ValueError(f"Spreadsheet not found: {spreadsheet_id}")
             raise RuntimeError(f"Sheets API error: {e}")
 
+    def add_sheet(
+        self,
+        spreadsheet_id: str,
+        title: str,
+        values: Optional[list[list[Any]]] = None,
+        value_input_option: str = "USER_ENTERED",
+    ) -> dict:
+        """
+        Add a new sheet to a spreadsheet.
+
+        The sheet is sized to fit the initial values, which are then written
+        from A1 with values.update, so they are parsed exactly as write_range
+        and append_rows parse their input.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID
+            title: The title for the new sheet
+            values: Optional 2D list of values to write from A1
+            value_input_option: How input should be interpreted (RAW, USER_ENTERED)
+
+        Returns:
+            Created sheet info
+        """
+        if values:
+            request = self.add_sheet_request(
+                title,
+                row_count=max(len(values), DEFAULT_SHEET_ROWS),
+                column_count=max(max(len(r) for r in values), DEFAULT_SHEET_COLUMNS),
+            )
+        else:
+            request = self.add_sheet_request(title)
+        replies = self.batch_update(spreadsheet_id, [request], fields=ADD_SHEET_FIELDS)
+        reply = replies[0] if replies else {}
+        props = reply.get("addSheet", {}).get("properties", {})
+        title = props.get("title", title)
+
+        if values:
+            sheet_range = "'{}'!A1".format(title.replace("'", "''"))
+            self.write_range(spreadsheet_id, sheet_range, values, value_input_option)
+
+        return {
+            "sheet_id": props.get("sheetId"),
+            "title": title,
+            "index": props.get("index", 0),
+        }
+
     def delete_sheet(self, spreadsheet_id: str, sheet_id: int) -> bool:
         """
         Delete a sheet from a spreadsheet.
@@ -357,16 +931,25 @@ class SheetsClient:
         Returns:
             True if successful
         """
-        try:
-            request = {"requests": [{"deleteSheet": {"sheetId": sheet_id}}]}
-            self.sheets_service.spreadsheets().batchUpdate(
-                spreadsheetId=spreadsheet_id, body=request
-            ).execute()
-            return True
-        except HttpError as e:
-            if e.resp.status == 404:
-                raise ValueError(f"Spreadsheet not found: {spreadsheet_id}")
-            raise RuntimeError(f"Sheets API error: {e}")
+        return self.delete_sheets(spreadsheet_id, [sheet_id])
+
+    def delete_sheets(self, spreadsheet_id: str, sheet_ids: list[int]) -> bool:
+        """
+        Delete several sheets from a spreadsheet in one request.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID
+            sheet_ids: The sheet IDs (not the titles)
+
+        Returns:
+            True if successful
+        """
+        self.batch_update(
+            spreadsheet_id,
+            [self.delete_sheet_request(sheet_id) for sheet_id in sheet_ids],
+            fields="spreadsheetId",
+        )
+        return True
 
     def rename_sheet(self, spreadsheet_id: str, sheet_id: int, title: str) -> bool:
         """
@@ -380,22 +963,7 @@ class SheetsClient:
         Returns:
             True if successful
         """
-        try:
-            request = {
-                "requests": [
-                    {
-                        "updateSheetProperties": {
-                            "properties": {"sheetId": sheet_id, "title": title},
-                            "fields": "title",
-                        }
-                    }
-                ]
-            }
-            self.sheets_service.spreadsheets().batchUpdate(
-                spreadsheetId=spreadsheet_id, body=request
-            ).execute()
-            return True
-        except HttpError as e:
-            if e.resp.status == 404:
-                raise ValueError(f"Spreadsheet not found: {spreadsheet_id}")
-            raise RuntimeError(f"Sheets API error: {e}")
+        self.batch_update(
+            spreadsheet_id, [self.rename_sheet_request(sheet_id, title)], fields="spreadsheetId"
+        )
+        return True
@@ -1,8 +1,9 @@
 """Google Sheets CLI commands."""
 
 import csv
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 
 import typer
 
@@ -11,14 +12,20 @@ from ..utils.display import (
     console,
     display_error,
     display_success,
+    display_table,
     confirm,
     format_spreadsheet_list,
     format_spreadsheet_detail,
     format_sheet_data,
 )
-from .client import SheetsClient
 
-app = typer.Typer(help="Google Sheets commands")
+if TYPE_CHECKING:
+    from .client import SheetsClient
+
+app = typer.Typer(help="Google Sheets commands", rich_markup_mode=None)
+
+# Rows read from a CSV file and sent per request
+CSV_CHUNK_ROWS = 5000
 
 
 def require_auth():
@@ -28,6 +35,25 @@ def require_auth():
         raise typer.Exit(1)
 
 
+def _make_client(cache_ttl: float = 0) -> "SheetsClient":
+    """Create a SheetsClient; the API client stack is only imported when a command runs."""
+    from .client import SheetsClient
+
+    return SheetsClient(cache_ttl=cache_ttl)
+
+
+def _csv_chunks(csv_file: Path) -> Iterator[list[list[str]]]:
+    """Yield the rows of a CSV file in lists of at most CSV_CHUNK_ROWS."""
+    with open(csv_file, newline="") as f:
+        reader = csv.reader(f)
+        yield from iter(lambda: list(islice(reader, CSV_CHUNK_ROWS)), [])
+
+
+def _parse_row(value: str) -> list[str]:
+    """Split a comma-separated --value into stripped cells, honouring CSV quoting."""
+    return [cell.strip() for cell in next(csv.reader([value], skipinitialspace=True), [])]
+
+
 @app.command("list")
 def list_spreadsheets(
     query: Optional[str] = typer.Option(None, "--query", "-q", help="Search query"),
@@ -36,7 +62,7 @@ def list_spreadsheets(
     """List recent spreadsheets."""
     require_auth()
 
-    client = SheetsClient()
+    client = _make_client()
     try:
         spreadsheets = client.list_spreadsheets(max_results=limit, query=query)
 
@@ -45,8 +71,7 @@ def list_spreadsheets(
             return
 
         table = format_spreadsheet_list(spreadsheets)
-        console.print(table)
-        console.print(f"\n[dim]{len(spreadsheets)} spreadsheets[/dim]")
+        display_table(table, f"{len(spreadsheets)} spreadsheets")
     except RuntimeError as e:
         display_error(str(e))
         raise typer.Exit(1)
@@ -55,11 +80,12 @@ def list_spreadsheets(
 @app.command("show")
 def show_spreadsheet(
     spreadsheet_id: str = typer.Argument(..., help="Spreadsheet ID"),
+    cache_ttl: float = typer.Option(0, "--cache-ttl", help="Reuse a cached result up to this many seconds old"),
 ):
     """Show spreadsheet details and sheets."""
     require_auth()
 
-    client = SheetsClient()
+    client = _make_client(cache_ttl)
     try:
         spreadsheet = client.get_spreadsheet(spreadsheet_id)
         panel = format_spreadsheet_detail(spreadsheet)
@@ -75,24 +101,39 @@ def show_spreadsheet(
 @app.command("read")
 def read_range(
     spreadsheet_id: str = typer.Argument(..., help="Spreadsheet ID"),
-    range_name: str = typer.Argument(..., help="Range in A1 notation (e.g., 'Sheet1!A1:C10')"),
+    range_names: list[str] = typer.Argument(..., help="Range(s) in A1 notation (e.g., 'Sheet1!A1:C10')"),
     formulas: bool = typer.Option(False, "--formulas", "-f", help="Show formulas instead of values"),
+    cache_ttl: float = typer.Option(0, "--cache-ttl", help="Reuse a cached result up to this many seconds old"),
 ):
-    """Read cell data from a spreadsheet."""
+    """Read cell data from a spreadsheet.
+
+    Several ranges can be given; they are fetched in one request.
+    """
     require_auth()
 
-    client = SheetsClient()
+    client = _make_client(cache_ttl)
     try:
         render_option = "FORMULA" if formulas else "FORMATTED_VALUE"
-        values = client.read_range(spreadsheet_id, range_name, value_render_option=render_option)
+        if len(range_names) == 1:
+            values = client.read_range(spreadsheet_id, range_names[0], value_render_option=render_option)
+
+            if not values:
+                console.print("No data found in range.")
+                return
 
-        if not values:
-            console.print("No data found in range.")
+            table = format_sheet_data(values)
+            display_table(table, f"{len(values)} rows")
             return
 
-        table = format_sheet_data(values)
-        console.print(table)
-        console.print(f"\n[dim]{len(values)} rows[/dim]")
+        value_ranges = client.batch_read_ranges(spreadsheet_id, range_names, value_render_option=render_option)
+        for value_range in value_ranges:
+            values = value_range["values"]
+            console.print(f"\n[bold]{value_range['range']}[/bold]")
+            if not values:
+                console.print("No data found in range.")
+                continue
+            console.print(format_sheet_data(values))
+            console.print(f"[dim]{len(values)} rows[/dim]")
     except ValueError as e:
         display_error(str(e))
         raise typer.Exit(1)
@@ -104,37 +145,61 @@ def read_range(
 @app.command("write")
 def write_range(
     spreadsheet_id: str = typer.Argument(..., help="Spreadsheet ID"),
-    range_name: str = typer.Argument(..., help="Range in A1 notation (e.g., 'Sheet1!A1')"),
+    range_names: list[str] = typer.Argument(..., help="Range(s) in A1 notation (e.g., 'Sheet1!A1')"),
     value: Optional[str] = typer.Option(None, "--value", "-v", help="Single value or comma-separated row"),
     csv_file: Optional[Path] = typer.Option(None, "--csv", help="CSV file to write"),
     raw: bool = typer.Option(False, "--raw", "-r", help="Write values as-is (no parsing)"),
 ):
-    """Write data to a spreadsheet."""
+    """Write data to a spreadsheet.
+
+    Several ranges can be given; the same data is written to each in one request.
+    CSV files are sent in chunks of rows, each starting below the previous one.
+    """
     require_auth()
 
     if not value and not csv_file:
         display_error("Either --value or --csv must be provided.")
         raise typer.Exit(1)
 
-    client = SheetsClient()
+    client = _make_client()
     try:
         if csv_file:
             if not csv_file.exists():
                 display_error(f"File not found: {csv_file}")
                 raise typer.Exit(1)
 
-            with open(csv_file, newline="") as f:
-                reader = csv.reader(f)
-                values = list(reader)
+            chunks = _csv_chunks(csv_file)
         else:
             # Parse comma-separated value as single row
-            values = [[v.strip() for v in value.split(",")]]
+            chunks = [[_parse_row(value)]]
 
         input_option = "RAW" if raw else "USER_ENTERED"
-        result = client.write_range(spreadsheet_id, range_name, values, value_input_option=input_option)
+        updated_cells = 0
+        updated_ranges = []
+        rows_written = 0
+        for values in chunks:
+            targets = range_names
+            if rows_written:
+                targets = [client.rows_below(range_name, rows_written) for range_name in range_names]
+            if len(targets) == 1:
+                result = client.write_range(spreadsheet_id, targets[0], values, value_input_option=input_option)
+                updated_ranges.append(result["updated_range"])
+            else:
+                data = [{"range": target, "values": values} for target in targets]
+                result = client.batch_write_ranges(spreadsheet_id, data, value_input_option=input_option)
+                updated_ranges.extend(result["updated_ranges"])
+            updated_cells += result["updated_cells"]
+            rows_written += len(values)
+
+        if not rows_written:
+            console.print("No rows to write.")
+            return
 
+        if len(updated_ranges) > len(range_names):
+            # Written in several chunks; report where each target started
+            updated_ranges = [f"{rows_written} rows from {range_name}" for range_name in range_names]
         display_success(
-            f"Updated {result['updated_cells']} cells in {result['updated_range']}"
+            f"Updated {updated_cells} cells in {', '.join(updated_ranges)}"
         )
     except ValueError as e:
         display_error(str(e))
@@ -152,31 +217,37 @@ def append_rows(
     csv_file: Optional[Path] = typer.Option(None, "--csv", help="CSV file to append"),
     raw: bool = typer.Option(False, "--raw", "-r", help="Write values as-is (no parsing)"),
 ):
-    """Append rows to a spreadsheet."""
+    """Append rows to a spreadsheet.
+
+    CSV files are sent in chunks of rows, one append request per chunk.
+    """
     require_auth()
 
     if not value and not csv_file:
         display_error("Either --value or --csv must be provided.")
         raise typer.Exit(1)
 
-    client = SheetsClient()
+    client = _make_client()
     try:
         if csv_file:
             if not csv_file.exists():
                 display_error(f"File not found: {csv_file}")
                 raise typer.Exit(1)
 
-            with open(csv_file, newline="") as f:
-                reader = csv.reader(f)
-                values = list(reader)
+            chunks = _csv_chunks(csv_file)
         else:
-            values = [[v.strip() for v in value.split(",")]]
+            chunks = [[_parse_row(value)]]
 
         input_option = "RAW" if raw else "USER_ENTERED"
-        result = client.append_rows(spreadsheet_id, range_name, values, value_input_option=input_option)
+        updated_rows = 0
+        updated_cells = 0
+        for values in chunks:
+            result = client.append_rows(spreadsheet_id, range_name, values, value_input_option=input_option)
+            updated_rows += result["updated_rows"]
+            updated_cells += result["updated_cells"]
 
         display_success(
-            f"Appended {result['updated_rows']} rows ({result['updated_cells']} cells)"
+            f"Appended {updated_rows} rows ({updated_cells} cells)"
         )
     except ValueError as e:
         display_error(str(e))
@@ -200,7 +271,7 @@ def clear_range(
             console.print("Cancelled.")
             return
 
-    client = SheetsClient()
+    client = _make_client()
     try:
         result = client.clear_range(spreadsheet_id, range_name)
         display_success(f"Cleared range: {result['cleared_range']}")
@@ -219,7 +290,7 @@ def create_spreadsheet(
     """Create a new spreadsheet."""
     require_auth()
 
-    client = SheetsClient()
+    client = _make_client()
     try:
         result = client.create_spreadsheet(title)
         display_success(f"Created spreadsheet: {result['title']}")
@@ -234,14 +305,42 @@ def create_spreadsheet(
 def add_sheet(
     spreadsheet_id: str = typer.Argument(..., help="Spreadsheet ID"),
     title: str = typer.Option(..., "--title", "-t", help="Sheet title"),
+    value: Optional[str] = typer.Option(None, "--value", "-v", help="Comma-separated first row"),
+    csv_file: Optional[Path] = typer.Option(None, "--csv", help="CSV file to fill the sheet with"),
+    raw: bool = typer.Option(False, "--raw", "-r", help="Write values as-is (no parsing)"),
 ):
-    """Add a new sheet to a spreadsheet."""
+    """Add a new sheet to a spreadsheet.
+
+    Initial data is written once the sheet exists; rows of a CSV file beyond
+    the first chunk are appended afterwards.
+    """
     require_auth()
 
-    client = SheetsClient()
+    if csv_file and not csv_file.exists():
+        display_error(f"File not found: {csv_file}")
+        raise typer.Exit(1)
+
+    client = _make_client()
     try:
-        result = client.add_sheet(spreadsheet_id, title)
-        display_success(f"Created sheet: {result['title']} (ID: {result['sheet_id']})")
+        if csv_file:
+            chunks = _csv_chunks(csv_file)
+        elif value:
+            chunks = iter([[_parse_row(value)]])
+        else:
+            chunks = iter([])
+
+        input_option = "RAW" if raw else "USER_ENTERED"
+        values = next(chunks, None)
+        result = client.add_sheet(spreadsheet_id, title, values, value_input_option=input_option)
+        rows = len(values or [])
+        sheet_range = "'{}'".format(result["title"].replace("'", "''"))
+        for values in chunks:
+            rows += client.append_rows(spreadsheet_id, sheet_range, values, value_input_option=input_option)["updated_rows"]
+
+        message = f"Created sheet: {result['title']} (ID: {result['sheet_id']})"
+        if rows:
+            message += f" with {rows} rows"
+        display_success(message)
     except ValueError as e:
         display_error(str(e))
         raise typer.Exit(1)
@@ -253,21 +352,26 @@ def add_sheet(
 @app.command("delete-sheet")
 def delete_sheet(
     spreadsheet_id: str = typer.Argument(..., help="Spreadsheet ID"),
-    sheet_id: int = typer.Argument(..., help="Sheet ID (numeric, not title)"),
+    sheets: list[str] = typer.Argument(..., help="Sheet ID(s) or title(s); numbers are taken as IDs"),
     yes: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation"),
 ):
-    """Delete a sheet from a spreadsheet."""
+    """Delete one or more sheets from a spreadsheet.
+
+    Several sheets are deleted in one request.
+    """
     require_auth()
 
+    sheets_text = ", ".join(sheets)
+    noun = "sheet" if len(sheets) == 1 else "sheets"
     if not yes:
-        if not confirm(f"Delete sheet {sheet_id}?"):
+        if not confirm(f"Delete {noun} {sheets_text}?"):
             console.print("Cancelled.")
             return
 
-    client = SheetsClient()
+    client = _make_client()
     try:
-        client.delete_sheet(spreadsheet_id, sheet_id)
-        display_success(f"Deleted sheet: {sheet_id}")
+        client.delete_sheets(spreadsheet_id, client.resolve_sheet_ids(spreadsheet_id, sheets))
+        display_success(f"Deleted {noun}: {sheets_text}")
     except ValueError as e:
         display_error(str(e))
         raise typer.Exit(1)
@@ -279,16 +383,17 @@ def delete_sheet(
 @app.command("rename-sheet")
 def rename_sheet(
     spreadsheet_id: str = typer.Argument(..., help="Spreadsheet ID"),
-    sheet_id: int = typer.Argument(..., help="Sheet ID (numeric, not title)"),
+    sheet: str = typer.Argument(..., help="Sheet ID or current title; a number is taken as an ID"),
     title: str = typer.Option(..., "--title", "-t", help="New sheet title"),
 ):
     """Rename a sheet in a spreadsheet."""
     require_auth()
 
-    client = SheetsClient()
+    client = _make_client()
     try:
+        (sheet_id,) = client.resolve_sheet_ids(spreadsheet_id, [sheet])
         client.rename_sheet(spreadsheet_id, sheet_id, title)
-        display_success(f"Renamed sheet {sheet_id} to: {title}")
+        display_success(f"Renamed sheet {sheet} to: {title}")
     except ValueError as e:
         display_error(str(e))
         raise typer.Exit(1)
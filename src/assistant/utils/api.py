@@ -0,0 +1,88 @@
+"""Helpers shared by the Google API client wrappers."""
+
+import json
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Optional
+
+# googleapiclient is imported where it is used: auth imports this module for
+# the JSON helpers, and most auth commands never build an API client
+if TYPE_CHECKING:
+    from googleapiclient.model import JsonModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+# Built API services keyed by (API name, version, account), shared by every client
+_SERVICE_CACHE: dict[tuple[str, str, Optional[str]], Any] = {}
+
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+@lru_cache(maxsize=1)
+def _orjson_model_class() -> type:
+    """Define the JsonModel subclass that parses API responses with orjson."""
+    from googleapiclient.model import JsonModel
+
+    class OrjsonModel(JsonModel):
+        """JsonModel that parses API responses with orjson."""
+
+        def deserialize(self, content):
+            try:
+                body = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                # Empty and non-JSON bodies are handled as JsonModel does
+                return super().deserialize(content)
+            if self._data_wrapper and "data" in body:
+                body = body["data"]
+            return body
+
+    return OrjsonModel
+
+
+def response_model() -> Optional["JsonModel"]:
+    """Model to pass to build(): orjson-backed when installed, else the library default."""
+    return _orjson_model_class()() if orjson is not None else None
+
+
+def build_service(api: str, version: str, account: Optional[str]) -> Any:
+    """
+    Return the API service for an account, building it on first use.
+
+    Services come from the discovery document bundled with googleapiclient
+    (no HTTP fetch and no on-disk discovery cache) and parse responses with
+    orjson when it is installed.
+
+    Raises:
+        RuntimeError: If the account has no usable credentials
+    """
+    key = (api, version, account)
+    service = _SERVICE_CACHE.get(key)
+    if service is None:
+        from googleapiclient.discovery import build
+
+        from ..auth import get_credentials
+
+        creds = get_credentials(account)
+        if creds is None:
+            raise RuntimeError("Not authenticated. Run 'assistant auth login' first.")
+        service = build(
+            api, version, credentials=creds,
+            cache_discovery=False, static_discovery=True,
+            model=response_model(),
+        )
+        _SERVICE_CACHE[key] = service
+    return service
@@ -1,16 +1,30 @@
 """Rich display utilities for the Assistant CLI."""
 
 import os
+import re
 import subprocess
+import sys
 import tempfile
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Optional
 
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
+from rich.style import Style
 from rich.table import Table
 from rich.text import Text
-from rich.markdown import Markdown
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:  # pragma: no cover - ciso8601 is optional
+    if sys.version_info >= (3, 11):
+        # fromisoformat accepts a trailing "Z" from 3.11 on
+        _parse_iso = datetime.fromisoformat
+    else:
+        def _parse_iso(value: str) -> datetime:
+            """Parse an ISO 8601 timestamp, accepting a trailing 'Z'."""
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
 
 console = Console(width=150, force_terminal=True)
 
@@ -35,6 +49,53 @@ def display_info(message: str) -> None:
     console.print(f"[bold blue]Info:[/bold blue] {message}")
 
 
+def display_table(table: RenderableType, footer: str) -> None:
+    """
+    Display a table followed by a dim footer line.
+
+    Both are rendered in a single print call; the footer is plain text,
+    so it may safely contain user input such as a search query.
+    """
+    console.print(Group(table, Text(f"\n{footer}", style="dim")))
+
+
+# Display name before the address in a From header, minus optional quotes
+_FROM_NAME = re.compile(r'\s*"?([^<]*?)"?\s*<')
+
+
+@lru_cache(maxsize=4096)
+def _sender_name(from_addr: str) -> str:
+    """Return the display name of a From header, or the header itself if it has none."""
+    match = _FROM_NAME.match(from_addr)
+    return (match and match.group(1)) or from_addr
+
+
+# Listings repeat the same timestamps (threads, digests, recurring events),
+# so formatted values are memoized by their raw string.
+@lru_cache(maxsize=4096)
+def _format_email_date(value: str) -> str:
+    """Format an email date (ISO 8601 or RFC 2822) for a listing."""
+    try:
+        return _parse_iso(value).strftime("%Y-%m-%d %H:%M")
+    except (ValueError, AttributeError):
+        pass
+    # Try parsing RFC 2822 format (common in emails)
+    from email.utils import parsedate_to_datetime
+    try:
+        return parsedate_to_datetime(value).strftime("%Y-%m-%d %H:%M")
+    except (ValueError, TypeError):
+        return value
+
+
+@lru_cache(maxsize=4096)
+def _format_event_time(value: str) -> str:
+    """Format an event's start or end dateTime for a listing."""
+    try:
+        return _parse_iso(value).strftime("%b %d %I:%M %p")
+    except (ValueError, AttributeError):
+        return value[:16]
+
+
 def format_email_list(emails: list[dict]) -> Table:
     """
     Format a list of emails as a Rich table.
@@ -58,33 +119,23 @@ def format_email_list(emails: list[dict]) -> Table:
     table.add_column("Subject", width=60, overflow="ellipsis", no_wrap=True)
     table.add_column("Date", width=18, no_wrap=True)
 
+    add_row = table.add_row
     for email in emails:
-        unread = "[bold red]*[/bold red]" if email.get("unread", False) else " "
-        from_addr = email.get("from", "Unknown")
-        if "<" in from_addr:
-            from_addr = from_addr.split("<")[0].strip().strip('"')
+        get = email.get
+        is_unread = get("unread", False)
+        from_addr = _sender_name(get("from", "Unknown"))
 
-        subject = email.get("subject", "(No Subject)")
-        if email.get("unread", False):
+        subject = get("subject", "(No Subject)")
+        if is_unread:
             subject = f"[bold]{subject}[/bold]"
 
-        date_str = email.get("date", "")
+        date_str = get("date", "")
         if date_str:
-            try:
-                dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                date_str = dt.strftime("%Y-%m-%d %H:%M")
-            except (ValueError, AttributeError):
-                # Try parsing RFC 2822 format (common in emails)
-                from email.utils import parsedate_to_datetime
-                try:
-                    dt = parsedate_to_datetime(date_str)
-                    date_str = dt.strftime("%Y-%m-%d %H:%M")
-                except (ValueError, TypeError):
-                    pass
-
-        table.add_row(
-            unread,
-            email.get("id", ""),
+            date_str = _format_email_date(date_str)
+
+        add_row(
+            "[bold red]*[/bold red]" if is_unread else " ",
+            get("id", ""),
             from_addr,
             subject,
             date_str,
@@ -93,6 +144,12 @@ def format_email_list(emails: list[dict]) -> Table:
     return table
 
 
+_EMAIL_LABEL_STYLE = Style(color="cyan", bold=True)
+
+# Rule between an email's headers and its body
+_EMAIL_SEPARATOR = f"\n\n{'─' * 60}\n\n"
+
+
 def format_email_detail(email: dict) -> Panel:
     """
     Format a single email for detailed display.
@@ -103,31 +160,29 @@ def format_email_detail(email: dict) -> Panel:
     Returns:
         Rich Panel object
     """
-    # Build header section
-    header_lines = [
-        f"[bold cyan]From:[/bold cyan] {email.get('from', 'Unknown')}",
-        f"[bold cyan]To:[/bold cyan] {email.get('to', 'Unknown')}",
-    ]
+    # Built as styled Text rather than markup: the body can be long and
+    # may contain brackets, and Rich would otherwise parse all of it
+    label = _EMAIL_LABEL_STYLE
+    content = Text.assemble(
+        ("From: ", label), email.get("from", "Unknown"), "\n",
+        ("To: ", label), email.get("to", "Unknown"),
+    )
 
     if email.get("cc"):
-        header_lines.append(f"[bold cyan]Cc:[/bold cyan] {email['cc']}")
+        content.append("\nCc: ", label)
+        content.append(email["cc"])
 
-    header_lines.extend([
-        f"[bold cyan]Date:[/bold cyan] {email.get('date', 'Unknown')}",
-        f"[bold cyan]Subject:[/bold cyan] {email.get('subject', '(No Subject)')}",
-    ])
+    content.append("\nDate: ", label)
+    content.append(email.get("date", "Unknown"))
+    content.append("\nSubject: ", label)
+    content.append(email.get("subject", "(No Subject)"))
 
     if email.get("attachments"):
-        att_list = ", ".join(att["filename"] for att in email["attachments"])
-        header_lines.append(f"[bold cyan]Attachments:[/bold cyan] {att_list}")
-
-    header = "\n".join(header_lines)
+        content.append("\nAttachments: ", label)
+        content.append(", ".join(att["filename"] for att in email["attachments"]))
 
-    # Build body section
-    body = email.get("body", "")
-
-    # Combine into panel
-    content = f"{header}\n\n{'─' * 60}\n\n{body}"
+    content.append(_EMAIL_SEPARATOR)
+    content.append(email.get("body", ""))
 
     return Panel(
         content,
@@ -153,9 +208,11 @@ def format_calendar_events(events: list[dict]) -> Table:
     table.add_column("End", width=18, no_wrap=True)
     table.add_column("Calendar", width=12, overflow="ellipsis")
 
+    add_row = table.add_row
     for event in events:
-        start = event.get("start", {})
-        end = event.get("end", {})
+        get = event.get
+        start = get("start", {})
+        end = get("end", {})
 
         # Handle all-day vs timed events
         if "date" in start:
@@ -164,32 +221,31 @@ def format_calendar_events(events: list[dict]) -> Table:
         else:
             start_dt = start.get("dateTime", "")
             end_dt = end.get("dateTime", "")
-            try:
-                if start_dt:
-                    dt = datetime.fromisoformat(start_dt.replace("Z", "+00:00"))
-                    start_str = dt.strftime("%b %d %I:%M %p")
-                else:
-                    start_str = ""
-                if end_dt:
-                    dt = datetime.fromisoformat(end_dt.replace("Z", "+00:00"))
-                    end_str = dt.strftime("%b %d %I:%M %p")
-                else:
-                    end_str = ""
-            except (ValueError, AttributeError):
-                start_str = start_dt[:16] if start_dt else ""
-                end_str = end_dt[:16] if end_dt else ""
+            start_str = _format_event_time(start_dt) if start_dt else ""
+            end_str = _format_event_time(end_dt) if end_dt else ""
 
-        table.add_row(
-            event.get("id", ""),
-            event.get("summary", "(No Title)"),
+        add_row(
+            get("id", ""),
+            get("summary", "(No Title)"),
             start_str,
             end_str,
-            event.get("calendar_name", "")[:12],
+            get("calendar_name", "")[:12],
         )
 
     return table
 
 
+_EVENT_LABEL_STYLE = Style(color="magenta", bold=True)
+
+# Attendee response status -> (icon, style)
+_RSVP_ICONS = {
+    "accepted": ("Y", "green"),
+    "declined": ("N", "red"),
+    "tentative": ("?", "yellow"),
+}
+_RSVP_UNKNOWN = ("-", "dim")
+
+
 def format_event_detail(event: dict) -> Panel:
     """
     Format a single calendar event for detailed display.
@@ -200,57 +256,53 @@ def format_event_detail(event: dict) -> Panel:
     Returns:
         Rich Panel object
     """
+    # Lines are assembled as styled Text, so event fields are never parsed
+    # as markup (a "[WIP]" title stays intact)
+    label = _EVENT_LABEL_STYLE
     lines = [
-        f"[bold magenta]Title:[/bold magenta] {event.get('summary', '(No Title)')}",
+        Text.assemble(("Title: ", label), event.get("summary", "(No Title)")),
     ]
 
     start = event.get("start", {})
     end = event.get("end", {})
 
     if "date" in start:
-        lines.append(f"[bold magenta]Date:[/bold magenta] {start['date']} (All day)")
+        lines.append(Text.assemble(("Date: ", label), f"{start['date']} (All day)"))
     else:
         start_dt = start.get("dateTime", "")
         end_dt = end.get("dateTime", "")
         if start_dt:
             try:
-                dt = datetime.fromisoformat(start_dt.replace("Z", "+00:00"))
-                lines.append(f"[bold magenta]Start:[/bold magenta] {dt.strftime('%B %d, %Y at %I:%M %p')}")
+                start_str = _parse_iso(start_dt).strftime("%B %d, %Y at %I:%M %p")
             except ValueError:
-                lines.append(f"[bold magenta]Start:[/bold magenta] {start_dt}")
+                start_str = start_dt
+            lines.append(Text.assemble(("Start: ", label), start_str))
         if end_dt:
             try:
-                dt = datetime.fromisoformat(end_dt.replace("Z", "+00:00"))
-                lines.append(f"[bold magenta]End:[/bold magenta] {dt.strftime('%B %d, %Y at %I:%M %p')}")
+                end_str = _parse_iso(end_dt).strftime("%B %d, %Y at %I:%M %p")
             except ValueError:
-                lines.append(f"[bold magenta]End:[/bold magenta] {end_dt}")
+                end_str = end_dt
+            lines.append(Text.assemble(("End: ", label), end_str))
 
     if event.get("location"):
-        lines.append(f"[bold magenta]Location:[/bold magenta] {event['location']}")
+        lines.append(Text.assemble(("Location: ", label), event["location"]))
 
     if event.get("description"):
-        lines.append(f"\n[bold magenta]Description:[/bold magenta]\n{event['description']}")
+        lines.append(Text.assemble("\n", ("Description:", label), "\n", event["description"]))
 
     if event.get("attendees"):
-        attendee_list = []
+        attendees = Text.assemble("\n", ("Attendees:", label))
         for att in event["attendees"]:
-            email = att.get("email", "")
-            status = att.get("responseStatus", "")
-            if status == "accepted":
-                status_icon = "[green]Y[/green]"
-            elif status == "declined":
-                status_icon = "[red]N[/red]"
-            elif status == "tentative":
-                status_icon = "[yellow]?[/yellow]"
-            else:
-                status_icon = "[dim]-[/dim]"
-            attendee_list.append(f"  {status_icon} {email}")
-        lines.append(f"\n[bold magenta]Attendees:[/bold magenta]\n" + "\n".join(attendee_list))
+            icon = _RSVP_ICONS.get(att.get("responseStatus", ""), _RSVP_UNKNOWN)
+            attendees.append("\n  ")
+            attendees.append(*icon)
+            attendees.append(f" {att.get('email', '')}")
+        lines.append(attendees)
 
     if event.get("htmlLink"):
-        lines.append(f"\n[dim]Link: {event['htmlLink']}[/dim]")
+        lines.append(Text(f"\nLink: {event['htmlLink']}", style="dim"))
 
-    content = "\n".join(lines)
+    content = Text("\n").join(lines)
 
     return Panel(
         content,
@@ -270,13 +322,14 @@ def format_labels(labels: list[dict]) -> Table:
         Rich Table object
     """
     table = Table(show_header=True, header_style="bold cyan", box=None)
-    table.add_column("Name", width=30)
-    table.add_column("Type", width=15)
+    table.add_column("Name", width=30, overflow="ellipsis", no_wrap=True)
+    table.add_column("Type", width=15, no_wrap=True)
     table.add_column("Messages", width=10, justify="right")
     table.add_column("Unread", width=10, justify="right")
 
+    add_row = table.add_row
     for label in labels:
-        table.add_row(
+        add_row(
             label.get("name", ""),
             label.get("type", ""),
             str(label.get("messagesTotal", "")),
@@ -298,11 +351,12 @@ def format_drafts(drafts: list[dict]) -> Table:
     """
     table = Table(show_header=True, header_style="bold cyan", box=None)
     table.add_column("ID", style="dim", overflow="fold")
-    table.add_column("To", width=25, overflow="ellipsis")
+    table.add_column("To", width=25, overflow="ellipsis", no_wrap=True)
     table.add_column("Subject", overflow="ellipsis")
 
+    add_row = table.add_row
     for draft in drafts:
-        table.add_row(
+        add_row(
             draft.get("id", ""),
             draft.get("to", "")[:25],
             draft.get("subject", "(No Subject)"),
@@ -322,10 +376,11 @@ def format_calendars(calendars: list[dict]) -> Table:
         Rich Table object
     """
     table = Table(show_header=True, header_style="bold magenta", box=None)
-    table.add_column("ID", style="dim", width=40)
-    table.add_column("Name", width=30)
-    table.add_column("Access", width=15)
+    table.add_column("ID", style="dim", width=40, no_wrap=True)
+    table.add_column("Name", width=30, no_wrap=True)
+    table.add_column("Access", width=15, no_wrap=True)
 
+    add_row = table.add_row
     for cal in calendars:
         access = cal.get("accessRole", "")
         if access == "owner":
@@ -335,7 +390,7 @@ def format_calendars(calendars: list[dict]) -> Table:
         else:
             access = f"[dim]{access}[/dim]"
 
-        table.add_row(
+        add_row(
             cal.get("id", "")[:40],
             cal.get("summary", "")[:30],
             access,
@@ -344,6 +399,18 @@ def format_calendars(calendars: list[dict]) -> Table:
     return table
 
 
+def format_size(size: Optional[int]) -> str:
+    """Format a byte count as B, KB or MB, or '-' when unknown."""
+    if size is None:
+        return "-"
+    bits = size.bit_length()
+    if bits > 20:
+        return f"{size * (1 / 1048576):.1f} MB"
+    if bits > 10:
+        return f"{size * (1 / 1024):.1f} KB"
+    return f"{size} B"
+
+
 def format_attachments(attachments: list[dict]) -> Table:
     """
     Format a list of attachments as a Rich table.
@@ -356,23 +423,16 @@ def format_attachments(attachments: list[dict]) -> Table:
     """
     table = Table(show_header=True, header_style="bold cyan", box=None)
     table.add_column("#", width=3, justify="right")
-    table.add_column("Filename", width=40, overflow="ellipsis")
+    table.add_column("Filename", width=40, overflow="ellipsis", no_wrap=True)
     table.add_column("Size", width=12, justify="right")
-    table.add_column("Type", width=25, overflow="ellipsis")
+    table.add_column("Type", width=25, overflow="ellipsis", no_wrap=True)
 
+    add_row = table.add_row
     for idx, att in enumerate(attachments, 1):
-        size = att.get("size", 0)
-        if size > 1024 * 1024:
-            size_str = f"{size / (1024 * 1024):.1f} MB"
-        elif size > 1024:
-            size_str = f"{size / 1024:.1f} KB"
-        else:
-            size_str = f"{size} B"
-
-        table.add_row(
+        add_row(
             str(idx),
             att.get("filename", "Unknown"),
-            size_str,
+            format_size(att.get("size", 0)),
             att.get("mimeType", ""),
         )
 
@@ -448,16 +508,17 @@ def format_spreadsheet_list(spreadsheets: list[dict]) -> Table:
     table.add_column("Modified", width=12, no_wrap=True)
     table.add_column("Owner", width=25, overflow="ellipsis")
 
+    add_row = table.add_row
     for sheet in spreadsheets:
         modified = sheet.get("modified_time", "")
         if modified:
             try:
-                dt = datetime.fromisoformat(modified.replace("Z", "+00:00"))
+                dt = _parse_iso(modified)
                 modified = dt.strftime("%b %d, %Y")
             except (ValueError, AttributeError):
                 modified = modified[:10]
 
-        table.add_row(
+        add_row(
             sheet.get("id", ""),
             sheet.get("name", ""),
             modified,
@@ -526,7 +587,7 @@ def format_sheet_data(values: list[list[Any]]) -> Table:
 
     if has_header:
         for i, header in enumerate(first_row):
-            table.add_column(str(header) if header else f"Col {i + 1}", overflow="ellipsis")
+            table.add_column(Text(header) if header else f"Col {i + 1}", overflow="ellipsis")
         # Pad header if needed
         for i in range(len(first_row), max_cols):
             table.add_column(f"Col {i + 1}", overflow="ellipsis")
@@ -536,9 +597,11 @@ def format_sheet_data(values: list[list[Any]]) -> Table:
             table.add_column(f"Col {i + 1}", overflow="ellipsis")
         data_rows = values
 
+    # Cells are wrapped in Text up front so Rich doesn't parse sheet data as
+    # markup; short rows are padded from one shared list
+    padding = [""] * max_cols
+    add_row = table.add_row
     for row in data_rows:
-        # Pad row with empty strings if needed
-        padded_row = list(row) + [""] * (max_cols - len(row))
-        table.add_row(*[str(cell) if cell is not None else "" for cell in padded_row])
+        add_row(*[Text(str(cell)) if cell is not None else "" for cell in row], *padding[len(row):])
 
     return table
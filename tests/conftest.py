@@ -0,0 +1,33 @@
+"""Shared fixtures: keep every test away from the real config directory."""
+
+import pytest
+
+from assistant import auth
+
+# Path helpers memoized in auth; cleared so they resolve under the test's directory
+_PATH_HELPERS = (
+    auth.get_config_dir,
+    auth.get_credentials_path,
+    auth.get_tokens_dir,
+    auth.get_cache_dir,
+    auth.get_config_path,
+    auth.get_accounts_index_path,
+    auth.get_token_path_for_account,
+)
+
+
+def _reset_auth_state() -> None:
+    for helper in _PATH_HELPERS:
+        helper.cache_clear()
+    auth._CONFIG_CACHE = None
+    auth._CONFIG_MTIME = None
+
+
+@pytest.fixture(autouse=True)
+def config_dir(tmp_path, monkeypatch):
+    """Point ASSISTANT_CONFIG_DIR at a temporary directory for the test."""
+    path = tmp_path / "config"
+    monkeypatch.setenv("ASSISTANT_CONFIG_DIR", str(path))
+    _reset_auth_state()
+    yield path
+    _reset_auth_state()
@@ -0,0 +1,26 @@
+"""Tests for account bookkeeping in auth."""
+
+import pytest
+
+from assistant import auth
+
+
+def test_accounts_without_token_files_are_dropped(config_dir):
+    auth.get_token_path_for_account("kept@example.com").write_text("{}")
+    auth._save_accounts_index(["gone@example.com", "kept@example.com"])
+
+    assert auth.list_accounts() == ["kept@example.com"]
+    assert auth.get_active_account() == "kept@example.com"
+    assert auth._load_accounts_index() == ["kept@example.com"]
+    assert auth.get_accounts_index_path().parent == config_dir
+
+
+@pytest.mark.parametrize("content", [b'["kept@exa', b"{}", b'"kept@example.com"', b"[1]"])
+def test_corrupt_accounts_index_is_rebuilt(config_dir, content):
+    token_path = auth.get_token_path_for_account("kept@example.com")
+    token_path.write_bytes(b'{"email": "kept@example.com"}')
+    auth.get_accounts_index_path().write_bytes(content)
+
+    assert auth.get_active_account() == "kept@example.com"
+    assert auth.list_accounts() == ["kept@example.com"]
+    assert auth._load_accounts_index() == ["kept@example.com"]
@@ -0,0 +1,154 @@
+"""Tests for the Sheets client."""
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from assistant import auth
+from assistant.sheets import client as sheets_client
+from assistant.sheets.client import SheetsClient
+
+
+class _FailingRequest:
+    """HttpRequest stand-in that fails with the given status on every call."""
+
+    def __init__(self, status: int):
+        self.status = status
+        self.calls = 0
+
+    def execute(self):
+        self.calls += 1
+        raise HttpError(httplib2.Response({"status": self.status}), b"")
+
+
+class _Spreadsheets:
+    def __init__(self, request):
+        self.request = request
+
+    def create(self, **kwargs):
+        return self.request
+
+    def batchUpdate(self, **kwargs):
+        return self.request
+
+
+class _Service:
+    def __init__(self, request):
+        self.request = request
+
+    def spreadsheets(self):
+        return _Spreadsheets(self.request)
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(sheets_client.time, "sleep", lambda seconds: None)
+
+
+def _client(request) -> SheetsClient:
+    client = SheetsClient()
+    client._sheets_service = _Service(request)
+    return client
+
+
+@pytest.mark.parametrize("status", [500, 503])
+def test_create_spreadsheet_is_not_retried(no_sleep, status):
+    request = _FailingRequest(status)
+    with pytest.raises(RuntimeError):
+        _client(request).create_spreadsheet("Report")
+    assert request.calls == 1
+
+
+@pytest.mark.parametrize("status", [500, 503])
+def test_batch_update_is_not_retried(no_sleep, status):
+    request = _FailingRequest(status)
+    with pytest.raises(RuntimeError):
+        _client(request).batch_update("sheet-id", [{"deleteSheet": {"sheetId": 1}}])
+    assert request.calls == 1
+
+
+def test_rate_limited_batch_update_is_retried(no_sleep):
+    request = _FailingRequest(429)
+    with pytest.raises(RuntimeError):
+        _client(request).batch_update("sheet-id", [{"deleteSheet": {"sheetId": 1}}])
+    assert request.calls == sheets_client.MAX_ATTEMPTS
+
+
+class _Request:
+    """HttpRequest stand-in returning a fixed response."""
+
+    def __init__(self, response: dict):
+        self.response = response
+
+    def execute(self):
+        return self.response
+
+
+class _RecordingSheets:
+    """Records batchUpdate and values().update calls."""
+
+    def __init__(self):
+        self.batch_updates = []
+        self.updates = []
+
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return self
+
+    def batchUpdate(self, spreadsheetId, body, fields):
+        self.batch_updates.append(body["requests"])
+        title = body["requests"][0]["addSheet"]["properties"]["title"]
+        return _Request({"replies": [{"addSheet": {"properties": {"sheetId": 7, "title": title, "index": 1}}}]})
+
+    def update(self, spreadsheetId, range, valueInputOption, body, fields):
+        self.updates.append((range, valueInputOption, body["values"]))
+        return _Request({"updatedRange": range, "updatedRows": len(body["values"])})
+
+
+@pytest.mark.parametrize("option", ["USER_ENTERED", "RAW"])
+def test_add_sheet_writes_values_with_input_option(option):
+    service = _RecordingSheets()
+    client = SheetsClient()
+    client._sheets_service = service
+
+    values = [["Date", "Amount"], ["2024-01-05", "1,000"], ["=A2", "1e400"]]
+    result = client.add_sheet("sheet-id", "It's data", values, value_input_option=option)
+
+    props = service.batch_updates[0][0]["addSheet"]["properties"]
+    assert "sheetId" not in props
+    assert len(service.batch_updates[0]) == 1
+    assert service.updates == [("'It''s data'!A1", option, values)]
+    assert result == {"sheet_id": 7, "title": "It's data", "index": 1}
+
+
+def test_writes_invalidate_only_the_test_accounts_cache(config_dir, monkeypatch):
+    monkeypatch.setattr(sheets_client, "get_active_account", lambda: "me@example.com")
+    auth.write_cache("sheets_sheet-id", "me@example.com", {"k": [0, []]})
+    cache_file = auth.get_account_cache_dir("me@example.com") / "sheets_sheet-id.json"
+    assert config_dir in cache_file.parents and cache_file.exists()
+
+    client = SheetsClient()
+    client._sheets_service = _RecordingSheets()
+    client.add_sheet("sheet-id", "New")
+
+    assert not cache_file.exists()
+
+
+@pytest.mark.parametrize(
+    "range_name, rows, expected",
+    [
+        ("Sheet1!B2:D9", 10, "Sheet1!B12"),
+        ("Sheet1!A1", 5, "Sheet1!A6"),
+        ("Sheet1!B:D", 3, "Sheet1!B4"),
+        ("Sheet1", 4, "Sheet1!A5"),
+        ("'My Sheet'!C3", 1, "'My Sheet'!C4"),
+        ("R1", 2, "R3"),
+        ("Sheet1!R1C1:R5C5", 10, "Sheet1!R11C1"),
+        ("Sheet1!r2c3", 4, "Sheet1!R6C3"),
+        ("Sheet1!R2C:R9C", 1, "Sheet1!R3C1"),
+    ],
+)
+def test_rows_below(range_name, rows, expected):
+    assert SheetsClient.rows_below(range_name, rows) == expected
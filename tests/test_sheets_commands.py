@@ -0,0 +1,19 @@
+"""Tests for the Sheets CLI commands."""
+
+import pytest
+
+from assistant.sheets.commands import _parse_row
+
+
+@pytest.mark.parametrize(
+    "value, cells",
+    [
+        ("a,b,c", ["a", "b", "c"]),
+        ("a , b ,c ", ["a", "b", "c"]),
+        ("  a,  b", ["a", "b"]),
+        ('"x, y" , z', ["x, y", "z"]),
+        ("", []),
+    ],
+)
+def test_parse_row_strips_cells(value, cells):
+    assert _parse_row(value) == cells